@@ -0,0 +1,229 @@
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional
+)
+
+from sigmaF.lexer import (
+    LEXERS,
+    new_lexer
+)
+from sigmaF.parser import PARSERS
+from sigmaF.token import TokenType
+
+SIZES: Dict[str, int] = {
+    'small': 100,
+    'medium': 1000,
+    'large': 10000,
+}
+
+
+def nested_corpus(size: int) -> str:
+    depth: int = max(size // 50, 1)
+    expressions: List[str] = []
+
+    for index in range(size // depth):
+        expression = '(' * depth + str(index) + ' + 1)' * depth
+        items = '[' * depth + str(index) + ']' * depth
+        expressions.append(f'let nested_{index} = {expression};\nlet items_{index} = {items};\n')
+
+    return ''.join(expressions)
+
+
+def list_corpus(size: int) -> str:
+    values: str = ', '.join(str(index) for index in range(size * 10))
+
+    return f'let values = [{values}];\n'
+
+
+def function_corpus(size: int) -> str:
+    functions: List[str] = []
+
+    for index in range(size):
+        functions.append(
+            f'let function_{index} = fn x::int, y::int -> int {{\n'
+            f'    if x > y then {{ => x - y * {index}; }}\n'
+            f'    => function_{index}(x + 1, y) + {index};\n'
+            '}\n'
+        )
+
+    return ''.join(functions)
+
+
+def string_corpus(size: int) -> str:
+    text: str = 'sigmaF \\t string -- not a comment /* neither */ ' * 20
+    strings: List[str] = [f'let text_{index} = "{text}";\n' for index in range(size)]
+
+    return ''.join(strings)
+
+
+CORPORA: Dict[str, Callable[[int], str]] = {
+    'nested': nested_corpus,
+    'list': list_corpus,
+    'functions': function_corpus,
+    'strings': string_corpus,
+}
+
+
+def lex(source: str, engine: str) -> int:
+    lexer = new_lexer(source, engine)
+
+    tokens: int = 0
+    while lexer.next_token().token_type is not TokenType.EOF:
+        tokens += 1
+
+    return tokens
+
+
+def parse(source: str, engine: str, parser_name: str = 'pratt') -> int:
+    parser = PARSERS[parser_name](new_lexer(source, engine))
+
+    return len(parser.parse_program().statements)
+
+
+def _best_time(function: Callable[[], Any], repeat: int) -> float:
+    best: float = float('inf')
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+
+    return best
+
+
+def _peak_memory(function: Callable[[], Any]) -> int:
+    tracemalloc.start()
+    try:
+        function()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return peak
+
+
+def measure(corpus: str, size: int, engine: str, repeat: int, parser: str = 'pratt') -> Dict[str, Any]:
+    source: str = CORPORA[corpus](size)
+    result: Dict[str, Any] = {
+        'corpus': corpus,
+        'size': size,
+        'bytes': len(source.encode('utf-8')),
+    }
+
+    try:
+        tokens: int = lex(source, engine)
+        statements: int = parse(source, engine, parser)
+
+        lex_seconds: float = _best_time(lambda: lex(source, engine), repeat)
+        parse_seconds: float = _best_time(lambda: parse(source, engine, parser), repeat)
+
+        result.update({
+            'tokens': tokens,
+            'statements': statements,
+            'lex_seconds': lex_seconds,
+            'parse_seconds': parse_seconds,
+            'tokens_per_second': tokens / lex_seconds,
+            'statements_per_second': statements / parse_seconds,
+            'lex_peak_bytes': _peak_memory(lambda: lex(source, engine)),
+            'parse_peak_bytes': _peak_memory(lambda: parse(source, engine, parser)),
+        })
+    except RecursionError:
+        result['error'] = 'RecursionError'
+
+    return result
+
+
+def run(corpora: List[str], sizes: List[str], engine: str, repeat: int, parser: str = 'pratt') -> Dict[str, Any]:
+    results: List[Dict[str, Any]] = []
+
+    for corpus in corpora:
+        for size in sizes:
+            results.append(measure(corpus, SIZES[size], engine, repeat, parser))
+
+    return {
+        'python': platform.python_version(),
+        'engine': engine,
+        'parser': parser,
+        'repeat': repeat,
+        'results': results,
+    }
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any]) -> List[str]:
+    lines: List[str] = []
+    baseline_results = {(result['corpus'], result['size']): result
+                        for result in baseline['results']}
+
+    for result in current['results']:
+        before: Optional[Dict[str, Any]] = baseline_results.get(
+            (result['corpus'], result['size']))
+        if before is None or 'error' in before or 'error' in result:
+            continue
+
+        lines.append('{:<10} {:>6}  lex x{:.2f}  parse x{:.2f}  parse memory x{:.2f}'.format(
+            result['corpus'],
+            result['size'],
+            result['tokens_per_second'] / before['tokens_per_second'],
+            result['statements_per_second'] / before['statements_per_second'],
+            result['parse_peak_bytes'] / before['parse_peak_bytes'],
+        ))
+
+    return lines
+
+
+def _format(result: Dict[str, Any]) -> str:
+    if 'error' in result:
+        return '{:<10} {:>6}  {}'.format(result['corpus'], result['size'], result['error'])
+
+    return '{:<10} {:>6}  {:>12,.0f} tokens/s  {:>10,.0f} statements/s  {:>12,} peak bytes'.format(
+        result['corpus'],
+        result['size'],
+        result['tokens_per_second'],
+        result['statements_per_second'],
+        result['parse_peak_bytes'],
+    )
+
+
+def main(args: List[str]) -> None:
+    argument_parser = argparse.ArgumentParser(
+        description='Measure the throughput of the sigmaF Lexer and Parser.')
+    argument_parser.add_argument('--corpus', nargs='+', choices=list(CORPORA), default=list(CORPORA))
+    argument_parser.add_argument('--size', nargs='+', choices=list(SIZES), default=['small', 'medium'])
+    argument_parser.add_argument('--engine', choices=list(LEXERS), default='regex')
+    argument_parser.add_argument('--parser', choices=list(PARSERS), default='pratt')
+    argument_parser.add_argument('--repeat', type=int, default=3)
+    argument_parser.add_argument('--output', help='Write the results as JSON to this path')
+    argument_parser.add_argument('--compare', help='JSON results of a previous run to compare against')
+    options = argument_parser.parse_args(args)
+
+    report: Dict[str, Any] = run(options.corpus, options.size, options.engine,
+                                 options.repeat, options.parser)
+
+    for result in report['results']:
+        print(_format(result))
+
+    if options.output is not None:
+        with open(options.output, mode='w', encoding='utf-8') as fout:
+            json.dump(report, fout, indent=2)
+
+    if options.compare is not None:
+        with open(options.compare, mode='r', encoding='utf-8') as fin:
+            baseline = json.load(fin)
+
+        print()
+        for line in compare(baseline, report):
+            print(line)
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
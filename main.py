@@ -84,7 +84,20 @@ def main(path=None, params=None) -> None:
 
         src = read_module(path)
         if not src is None:
-            start_repl(src, path)
+            use_cache = params is None or not '-nocache' in params
+            optimize = not params is None and '-optimize' in params
+            engine = 'tree'
+            if not params is None and '-closures' in params:
+                engine = 'closures'
+            elif not params is None and '-vm' in params:
+                engine = 'vm'
+            elif not params is None and '-native' in params:
+                engine = 'native'
+            elif not params is None and '-stackless' in params:
+                engine = 'stackless'
+            elif not params is None and '-unboxed' in params:
+                engine = 'unboxed'
+            start_repl(src, path, use_cache, optimize, engine)
 
 
 def filter_path_params(args):
@@ -4,14 +4,21 @@ from abc import (
 )
 from typing import (
     Any,
+    Dict,
+    Iterator,
     Optional,
-    List
+    List,
+    Tuple,
+    Type
 )
+from sigmaF.symbol import SYMBOLS
 from sigmaF.token import Token
 
 
 class ASTNode(ABC):
 
+    __slots__ = ()
+
     @abstractmethod
     def token_literal(self) -> str:
         pass
@@ -23,6 +30,8 @@ class ASTNode(ABC):
 
 class Statement(ASTNode):
 
+    __slots__ = ('token',)
+
     def __init__(self, token: Token) -> None:
         self.token = token
 
@@ -32,6 +41,8 @@ class Statement(ASTNode):
 
 class Expression(ASTNode):
 
+    __slots__ = ('token',)
+
     def __init__(self, token: Token) -> None:
         self.token = token
 
@@ -41,6 +52,8 @@ class Expression(ASTNode):
 
 class Program(ASTNode):
 
+    __slots__ = ('statements',)
+
     def __init__(self, statements: List[Statement]) -> None:
         self.statements = statements
 
@@ -60,11 +73,24 @@ class Program(ASTNode):
 
 class Identifier(Expression):
 
+    __slots__ = ('value', 'symbol', 'depth')
+
     def __init__(self,
                  token: Token,
-                 value: str) -> None:
+                 value: str,
+                 symbol: Optional[int] = None,
+                 depth: Optional[int] = None) -> None:
         super().__init__(token)
         self.value = value
+        self.symbol = SYMBOLS.intern(value) if symbol is None else symbol
+        self.depth = depth
+
+    def __getstate__(self) -> Tuple[Token, str, Optional[int]]:
+        return self.token, self.value, self.depth
+
+    def __setstate__(self, state: Tuple[Token, str, Optional[int]]) -> None:
+        self.token, self.value, self.depth = state
+        self.symbol = SYMBOLS.intern(self.value)
 
     def __str__(self) -> str:
         return self.value
@@ -72,6 +98,8 @@ class Identifier(Expression):
 
 class LetStatement(Statement):
 
+    __slots__ = ('name', 'value')
+
     def __init__(self,
                  token: Token,
                  name: Optional[Identifier] = None,
@@ -85,6 +113,9 @@ class LetStatement(Statement):
 
 
 class ReturnStatement(Statement):
+
+    __slots__ = ('return_value',)
+
     def __init__(self,
                  token: Token,
                  return_value: Optional[Expression] = None
@@ -97,6 +128,9 @@ class ReturnStatement(Statement):
 
 
 class ExpressionStatement(Statement):
+
+    __slots__ = ('expression',)
+
     def __init__(self,
                  token: Token,
                  expression: Optional[Expression] = None
@@ -109,43 +143,78 @@ class ExpressionStatement(Statement):
 
 
 class Integer(Expression):
+
+    __slots__ = ('value', 'constant')
+
     def __init__(self,
                  token: Token,
                  value: Optional[int] = None
                  ) -> None:
         super().__init__(token)
         self.value = value
+        self.constant: Any = None
+
+    def __getstate__(self) -> Tuple[Token, Optional[int]]:
+        return self.token, self.value
+
+    def __setstate__(self, state: Tuple[Token, Optional[int]]) -> None:
+        self.token, self.value = state
+        self.constant = None
 
     def __str__(self) -> str:
         return str(self.value)
 
 
 class Float(Expression):
+
+    __slots__ = ('value', 'constant')
+
     def __init__(self,
                  token: Token,
                  value: Optional[float] = None
                  ) -> None:
         super().__init__(token)
         self.value = value
+        self.constant: Any = None
+
+    def __getstate__(self) -> Tuple[Token, Optional[float]]:
+        return self.token, self.value
+
+    def __setstate__(self, state: Tuple[Token, Optional[float]]) -> None:
+        self.token, self.value = state
+        self.constant = None
 
     def __str__(self) -> str:
         return str(self.value)
 
 
 class String(Expression):
+
+    __slots__ = ('value', 'constant')
+
     def __init__(self,
                  token: Token,
                  value: Optional[str] = None
                  ) -> None:
         super().__init__(token)
         self.value = value
+        self.constant: Any = None
+
+    def __getstate__(self) -> Tuple[Token, Optional[str]]:
+        return self.token, self.value
+
+    def __setstate__(self, state: Tuple[Token, Optional[str]]) -> None:
+        self.token, self.value = state
+        self.constant = None
 
     def __str__(self) -> str:
-        return str(self.value)
+        return f'"{self.value}"'
 
 
 class Prefix(Expression):
 
+    __slots__ = ('operator', 'right')
+
     def __init__(self,
                  token: Token,
                  operator: str,
@@ -161,6 +230,8 @@ class Prefix(Expression):
 
 class Infix(Expression):
 
+    __slots__ = ('left', 'operator', 'right', 'cache')
+
     def __init__(self,
                  token: Token,
                  left: Expression,
@@ -171,6 +242,14 @@ class Infix(Expression):
         self.left = left
         self.operator = operator
         self.right = right
+        self.cache: Any = None
+
+    def __getstate__(self) -> Tuple[Token, Expression, str, Optional[Expression]]:
+        return self.token, self.left, self.operator, self.right
+
+    def __setstate__(self, state: Tuple[Token, Expression, str, Optional[Expression]]) -> None:
+        self.token, self.left, self.operator, self.right = state
+        self.cache = None
 
     def __str__(self) -> str:
         return f'({str(self.left)} {self.operator} {str(self.right)})'
@@ -178,6 +257,8 @@ class Infix(Expression):
 
 class Boolean(Expression):
 
+    __slots__ = ('value',)
+
     def __init__(self,
                  token: Token,
                  value: Optional[bool] = None
@@ -190,6 +271,9 @@ class Boolean(Expression):
 
 
 class Block(Statement):
+
+    __slots__ = ('statements',)
+
     def __init__(self,
                  token: Token,
                  statements: List[Statement]
@@ -205,6 +289,8 @@ class Block(Statement):
 
 class If(Expression):
 
+    __slots__ = ('condition', 'consequence', 'alternative')
+
     def __init__(self,
                  token: Token,
                  condition: Optional[Expression] = None,
@@ -227,18 +313,25 @@ class If(Expression):
 
 class Function(Expression):
 
+    __slots__ = ('parameters', 'type_parameters', 'type_output', 'body',
+                 'free_symbols', 'global_depth')
+
     def __init__(self,
                  token: Token,
                  parameters: List[Identifier] = [],
                  type_parameters: List[Identifier] = [],
                  type_output: Optional[Identifier] = None,
-                 body: Optional[Block] = None
+                 body: Optional[Block] = None,
+                 free_symbols: Optional[Tuple[int, ...]] = None,
+                 global_depth: int = 0
                  ) -> None:
         super().__init__(token)
         self.parameters = parameters
         self.type_parameters = type_parameters
         self.type_output = type_output
         self.body = body
+        self.free_symbols = free_symbols
+        self.global_depth = global_depth
 
     def __str__(self) -> str:
         param_and_type_list: List[str] = [f'{parameter}::{type_parameter} ' for parameter, type_parameter in zip(
@@ -251,14 +344,28 @@ class Function(Expression):
 
 class Call(Expression):
 
+    __slots__ = ('function', 'arguments', 'signature', 'cache')
+
     def __init__(self,
                  token: Token,
                  function: Expression,
-                 arguments: Optional[List[Expression]] = None
+                 arguments: Optional[List[Expression]] = None,
+                 signature: Optional['Function'] = None
                  ) -> None:
         super().__init__(token)
         self.function = function
         self.arguments = arguments
+        self.signature = signature
+        self.cache: Any = None
+
+    def __getstate__(self) -> Tuple[Token, Expression, Optional[List[Expression]], Optional['Function']]:
+        return self.token, self.function, self.arguments, self.signature
+
+    def __setstate__(self,
+                     state: Tuple[Token, Expression, Optional[List[Expression]], Optional['Function']]
+                     ) -> None:
+        self.token, self.function, self.arguments, self.signature = state
+        self.cache = None
 
     def __str__(self) -> str:
         assert self.arguments is not None
@@ -270,6 +377,8 @@ class Call(Expression):
 
 class ListValues(Expression):
 
+    __slots__ = ('values',)
+
     def __init__(self, token: Token, values: List[Any] = []) -> None:
         super().__init__(token)
         self.values = values
@@ -277,8 +386,11 @@ class ListValues(Expression):
     def __str__(self) -> str:
         return str([str(value) for value in self.values])
 
+
 class TupleValues(Expression):
 
+    __slots__ = ('values',)
+
     def __init__(self, token: Token, values: List[Any] = []) -> None:
         super().__init__(token)
         self.values = values
@@ -289,6 +401,8 @@ class TupleValues(Expression):
 
 class CallList(Expression):
 
+    __slots__ = ('list_identifier', 'range')
+
     def __init__(self,
                  token: Token,
                  list_identifier: Expression,
@@ -304,3 +418,35 @@ class CallList(Expression):
         args: str = ', '.join(range_list)
 
         return f'{str(self.list_identifier)}({args})'
+
+
+CHILD_FIELDS: Dict[Type, Tuple[str, ...]] = {
+    Program: ('statements',),
+    LetStatement: ('value',),
+    ReturnStatement: ('return_value',),
+    ExpressionStatement: ('expression',),
+    Prefix: ('right',),
+    Infix: ('left', 'right'),
+    Block: ('statements',),
+    If: ('condition', 'consequence', 'alternative'),
+    Function: ('body',),
+    Call: ('function', 'arguments'),
+    ListValues: ('values',),
+    TupleValues: ('values',),
+    CallList: ('list_identifier', 'range'),
+}
+
+
+def iter_nodes(root: ASTNode) -> Iterator[ASTNode]:
+    stack: List[ASTNode] = [root]
+
+    while stack:
+        node = stack.pop()
+        yield node
+
+        for field in reversed(CHILD_FIELDS.get(type(node), ())):
+            child = getattr(node, field)
+            if type(child) is list:
+                stack.extend(reversed(child))
+            elif child is not None:
+                stack.append(child)
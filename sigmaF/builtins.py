@@ -7,18 +7,22 @@ from typing import (
     Optional
 )
 
+from sigmaF.symbol import SYMBOLS
 from sigmaF.object import (
     Boolean,
     Builtin,
+    FALSE,
     Float,
     Function,
     Error,
     Integer,
+    new_integer,
+    NULL,
     ValueList,
     ValueTuple,
-    Null,
     Object,
-    String
+    String,
+    TRUE
 )
 
 _WRONG_NUMBER_OF_ARGS = 'Incorrect Number of arguments for length, it was received {} arguments, and is needed only {}'
@@ -33,13 +37,13 @@ def length(*args: Object) -> Object:
         return Error(_WRONG_NUMBER_OF_ARGS.format(len(args), 1))
     elif type(args[0]) == String:
         argument = cast(String, args[0])
-        return Integer(len(argument.value))
+        return new_integer(len(argument.value))
     elif type(args[0]) == ValueList:
         argument = cast(ValueList, args[0])
-        return Integer(len(argument.values))
+        return new_integer(len(argument.values))
     elif type(args[0]) == ValueTuple:
         argument = cast(ValueTuple, args[0])
-        return Integer(len(argument.values))
+        return new_integer(len(argument.values))
     else:
         return Error(_UNSUPPORTED_ARGUMENT_TYPE.format('length', args[0].type().name))
 
@@ -53,8 +57,7 @@ def println(*args: Object) -> Object:
                                  Float, Boolean, ValueList, Function]] = None
         if type_arg == String:
             argument = cast(String, args[0])
-            string = argument.inspect().replace('\\n', '\n').replace('\\t', '\t')
-            print(string)
+            print(argument.inspect())
 
         elif type_arg == Integer:
             argument = cast(Integer, args[0])
@@ -83,7 +86,7 @@ def println(*args: Object) -> Object:
         else:
             return Error(_UNSUPPORTED_ARGUMENT_TYPE.format('printLn', args[0].type().name))
 
-        return Null()
+        return NULL
 
 
 def negation_bolean(*args: Object) -> Object:
@@ -95,7 +98,7 @@ def negation_bolean(*args: Object) -> Object:
 
         if type_arg == Boolean:
             argument = cast(Boolean, args[0])
-            return Boolean(not argument.value)
+            return FALSE if argument.value else TRUE
         else:
             return Error(_UNSUPPORTED_ARGUMENT_TYPE.format('not', args[0].type().name))
 
@@ -168,3 +171,7 @@ BUILTIN: Dict[str, Builtin] = {
     'pow': Builtin(fn=pow_impure, io_type="builtin fn (int|float, int|float) -> null"),
     'parse': Builtin(fn=parse, io_type="builtin fn (int|str,str) -> null"),
 }
+
+BUILTIN_SYMBOLS: Dict[int, Builtin] = {
+    SYMBOLS.intern(name): builtin for name, builtin in BUILTIN.items()
+}
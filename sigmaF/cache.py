@@ -0,0 +1,141 @@
+import os
+import pickle
+import sys
+
+from hashlib import blake2b
+from tempfile import mkstemp
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    List,
+    Optional,
+    Tuple
+)
+
+from sigmaF.ast import Program
+from sigmaF.compiler import (
+    Bytecode,
+    dumps,
+    loads
+)
+from sigmaF.lexer import new_lexer
+from sigmaF.parser import (
+    Parser,
+    StackParser,
+    TableParser
+)
+
+CACHE_DIRECTORY = '__sfcache__'
+FORMAT_VERSION = 7
+
+_MAGIC = b'SFC\x00'
+
+
+def source_digest(source: str) -> str:
+    key = f'{FORMAT_VERSION}:{sys.implementation.cache_tag}:{source}'
+
+    return blake2b(key.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def cache_path(path: str, digest: str, suffix: str = '.sfc') -> str:
+    directory, filename = os.path.split(os.path.abspath(path))
+
+    return os.path.join(directory, CACHE_DIRECTORY, f'{filename}.{digest}{suffix}')
+
+
+def load_program(path: str, source: str) -> Optional[Program]:
+    program = _load(path, source, '.sfc', pickle.load)
+
+    return program if type(program) == Program else None
+
+
+def store_program(path: str, source: str, program: Program) -> None:
+    _store(path, source, '.sfc',
+           lambda fout: pickle.dump(program, fout, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+def load_bytecode(path: str, source: str) -> Optional[Bytecode]:
+    return _load(path, source, '.sfb', lambda fin: loads(fin.read()))
+
+
+def store_bytecode(path: str, source: str, bytecode: Bytecode) -> None:
+    _store(path, source, '.sfb', lambda fout: fout.write(dumps(bytecode)))
+
+
+def _load(path: str, source: str, suffix: str, read: Callable[[BinaryIO], Any]) -> Any:
+    digest: str = source_digest(source)
+    filename: str = cache_path(path, digest, suffix)
+
+    try:
+        with open(filename, mode='rb') as fin:
+            if fin.read(len(_MAGIC)) != _MAGIC or fin.read(len(digest)) != digest.encode('ascii'):
+                return None
+
+            return read(fin)
+    except FileNotFoundError:
+        return None
+    except Exception:
+        _remove(filename)
+        return None
+
+
+def _store(path: str, source: str, suffix: str, write: Callable[[BinaryIO], Any]) -> None:
+    digest: str = source_digest(source)
+    filename: str = cache_path(path, digest, suffix)
+    directory: str = os.path.dirname(filename)
+
+    try:
+        os.makedirs(directory, exist_ok=True)
+        descriptor, temporary = mkstemp(dir=directory, suffix='.tmp')
+    except OSError:
+        return
+
+    try:
+        with os.fdopen(descriptor, mode='wb') as fout:
+            fout.write(_MAGIC)
+            fout.write(digest.encode('ascii'))
+            write(fout)
+
+        os.replace(temporary, filename)
+    except (OSError, pickle.PicklingError, RecursionError):
+        _remove(temporary)
+        return
+
+    _remove_stale(path, filename, suffix)
+
+
+def parse_module(source: str, path: Optional[str] = None) -> Tuple[Program, List[str]]:
+    if path is not None and (program := load_program(path, source)) is not None:
+        return program, []
+
+    parser: Parser = TableParser(new_lexer(source, 'buffer'))
+    try:
+        program = parser.parse_program()
+    except RecursionError:
+        parser = StackParser(new_lexer(source, 'buffer'))
+        program = parser.parse_program()
+
+    if path is not None and len(parser.errors) == 0:
+        store_program(path, source, program)
+
+    return program, parser.errors
+
+
+def _remove_stale(path: str, current: str, suffix: str) -> None:
+    directory, filename = os.path.split(current)
+    prefix: str = f'{os.path.basename(path)}.'
+
+    for entry in os.listdir(directory):
+        digest: str = entry[len(prefix):-len(suffix)]
+
+        if entry.startswith(prefix) and entry.endswith(suffix) and \
+                len(digest) == 32 and entry != filename:
+            _remove(os.path.join(directory, entry))
+
+
+def _remove(filename: str) -> None:
+    try:
+        os.remove(filename)
+    except OSError:
+        pass
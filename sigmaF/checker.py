@@ -0,0 +1,329 @@
+from collections import ChainMap
+from typing import (
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union
+)
+
+import sigmaF.ast as ast
+from sigmaF.builtins import BUILTIN_SYMBOLS
+from sigmaF.evaluator import (
+    TYPE_REGISTER_LITERAL,
+    TYPE_REGISTER_OBJECT
+)
+from sigmaF.object import (
+    Environment,
+    ObjectType
+)
+
+StaticType = Optional[ObjectType]
+Binding = Union[ObjectType, ast.Function, None]
+Scope = ChainMap
+
+_UNKNOWN_TYPE = 'Unknown type: The type {} of the function {} does not exist'
+_WRONG_PARAMETERS = 'Wrong parameters: The function {} has {} parameters and {} types'
+_WRONG_OUTPUT = 'Output wrongs: The function {} expected to return type {} and return {}'
+
+_COMPARISON_OPERATORS: Set[str] = {'<', '>', '<=', '>=', '==', '!='}
+
+# Integer comparisons are left out on purpose: null is an integer for the
+# evaluator and comparing it returns null, not a boolean.
+_INFIX_TYPES: Dict[Tuple[ObjectType, str], ObjectType] = {
+    **{(ObjectType.INTEGER, operator): ObjectType.INTEGER
+       for operator in ('+', '-', '*', '**', '%')},
+    **{(ObjectType.FLOAT, operator): ObjectType.FLOAT
+       for operator in ('+', '-', '*', '**', '/', '%')},
+    **{(ObjectType.FLOAT, operator): ObjectType.BOOLEAN
+       for operator in _COMPARISON_OPERATORS},
+    (ObjectType.STRING, '+'): ObjectType.STRING,
+    (ObjectType.STRING, '=='): ObjectType.BOOLEAN,
+    (ObjectType.STRING, '!='): ObjectType.BOOLEAN,
+    **{(ObjectType.BOOLEAN, operator): ObjectType.BOOLEAN
+       for operator in ('==', '!=', '||', '&&')},
+    (ObjectType.LIST, '+'): ObjectType.LIST,
+    (ObjectType.LIST, '=='): ObjectType.BOOLEAN,
+    (ObjectType.LIST, '!='): ObjectType.BOOLEAN,
+    (ObjectType.TUPLE, '+'): ObjectType.TUPLE,
+    (ObjectType.TUPLE, '-'): ObjectType.TUPLE,
+    (ObjectType.TUPLE, '=='): ObjectType.BOOLEAN,
+    (ObjectType.TUPLE, '!='): ObjectType.BOOLEAN,
+}
+
+_LITERAL_TYPES: Dict[type, ObjectType] = {
+    ast.Integer: ObjectType.INTEGER,
+    ast.Float: ObjectType.FLOAT,
+    ast.String: ObjectType.STRING,
+    ast.Boolean: ObjectType.BOOLEAN,
+}
+
+
+class TypeChecker:
+
+    def __init__(self, env: Optional[Environment] = None) -> None:
+        self._env = env
+        self._errors: List[str] = []
+        self._globals: Dict[str, Binding] = {}
+        self._verified: Set[ast.Function] = set()
+        self._candidates: List[Tuple[ast.Call, ast.Function]] = []
+
+    @property
+    def errors(self) -> List[str]:
+        return self._errors
+
+    def check(self, program: ast.Program) -> int:
+        self._errors = []
+        self._verified = set()
+        self._candidates = []
+        self._globals = self._collect_globals(program)
+
+        try:
+            scope: Scope = ChainMap(self._globals)
+            for statement in program.statements:
+                if type(statement) == ast.LetStatement:
+                    self._check_let(statement, scope)
+                elif type(statement) == ast.ReturnStatement:
+                    self._infer(statement.return_value, scope)
+                elif type(statement) == ast.ExpressionStatement:
+                    self._infer(statement.expression, scope)
+        except RecursionError:
+            _clear_signatures(program)
+            return 0
+
+        checked_calls: int = 0
+        for call, signature in self._candidates:
+            if signature in self._verified:
+                call.signature = signature
+                checked_calls += 1
+
+        return checked_calls
+
+    def _collect_globals(self, program: ast.Program) -> Dict[str, Binding]:
+        names: Dict[str, Binding] = {}
+
+        for statement in program.statements:
+            if type(statement) != ast.LetStatement or statement.name is None:
+                continue
+
+            symbol: int = statement.name.symbol
+            bound: bool = statement.name.value in names \
+                or symbol in BUILTIN_SYMBOLS \
+                or (self._env is not None and symbol in self._env._store)
+
+            if not bound and type(statement.value) == ast.Function:
+                names[statement.name.value] = statement.value
+            else:
+                names[statement.name.value] = None
+
+        return names
+
+    def _check_let(self, statement: ast.LetStatement, scope: Scope) -> StaticType:
+        assert statement.name is not None
+
+        if type(statement.value) == ast.Function:
+            self._check_function(statement.value, scope, statement.name.value)
+            return ObjectType.FUNCTION
+
+        return self._infer(statement.value, scope)
+
+    def _check_function(self, function: ast.Function, scope: Scope, name: str = 'fn') -> None:
+        valid: bool = True
+
+        types: List[StaticType] = []
+        for type_identifier in function.type_parameters + [function.type_output]:
+            if type_identifier is None or type_identifier.value not in TYPE_REGISTER_LITERAL:
+                self._errors.append(_UNKNOWN_TYPE.format(type_identifier, name))
+                valid = False
+            types.append(TYPE_REGISTER_LITERAL.get(str(type_identifier)))
+
+        if len(function.parameters) != len(function.type_parameters):
+            self._errors.append(_WRONG_PARAMETERS.format(
+                name, len(function.parameters), len(function.type_parameters)))
+            valid = False
+
+        function_scope: Scope = scope.new_child({
+            parameter.value: parameter_type
+            for parameter, parameter_type in zip(function.parameters, types)
+        })
+
+        assert function.body is not None
+        returns, always_returns, _ = self._check_block(function.body.statements, function_scope)
+
+        output: StaticType = types[-1]
+        wrong_outputs: List[str] = [TYPE_REGISTER_OBJECT[return_type] for return_type in returns
+                                    if return_type is not None and return_type is not output]
+        if not valid:
+            return
+        elif len(wrong_outputs) > 0:
+            self._errors.append(_WRONG_OUTPUT.format(
+                name, function.type_output, ', '.join(sorted(wrong_outputs))))
+        elif always_returns and returns == {output}:
+            self._verified.add(function)
+
+    def _check_block(self,
+                     statements: List[ast.Statement],
+                     scope: Scope
+                     ) -> Tuple[Set[StaticType], bool, StaticType]:
+        returns: Set[StaticType] = set()
+        last_type: StaticType = None
+
+        for statement in statements:
+            last_type = None
+
+            if type(statement) == ast.ReturnStatement:
+                returns.add(self._infer(statement.return_value, scope))
+                return returns, True, None
+
+            elif type(statement) == ast.LetStatement:
+                assert statement.name is not None
+                value_type: StaticType = self._check_let(statement, scope)
+                if type(statement.value) == ast.Function:
+                    scope[statement.name.value] = statement.value
+                else:
+                    scope[statement.name.value] = value_type
+
+            elif type(statement) == ast.ExpressionStatement:
+                expression = statement.expression
+                if type(expression) == ast.If:
+                    branch_returns, always_returns, last_type = self._check_if(expression, scope)
+                    returns |= branch_returns
+                    if always_returns:
+                        return returns, True, None
+                else:
+                    last_type = self._infer(expression, scope)
+
+        return returns, False, last_type
+
+    def _check_if(self, if_expression: ast.If, scope: Scope) -> Tuple[Set[StaticType], bool, StaticType]:
+        self._infer(if_expression.condition, scope)
+
+        assert if_expression.consequence is not None
+        returns, always_returns, last_type = self._check_branch(if_expression.consequence, scope)
+
+        if if_expression.alternative is None:
+            return returns, False, None
+
+        alternative_returns, alternative_always_returns, alternative_type = \
+            self._check_branch(if_expression.alternative, scope)
+
+        return (returns | alternative_returns,
+                always_returns and alternative_always_returns,
+                last_type if last_type is alternative_type else None)
+
+    def _check_branch(self, block: ast.Block, scope: Scope) -> Tuple[Set[StaticType], bool, StaticType]:
+        branch_scope: Scope = scope.new_child()
+        result = self._check_block(block.statements, branch_scope)
+
+        for name in branch_scope.maps[0]:
+            scope[name] = None
+
+        return result
+
+    def _infer(self, expression: Optional[ast.Expression], scope: Scope) -> StaticType:
+        expression_type: type = type(expression)
+
+        if expression_type in _LITERAL_TYPES:
+            return _LITERAL_TYPES[expression_type]
+
+        elif expression_type == ast.Identifier:
+            binding: Binding = self._lookup(expression.value, scope)
+            if type(binding) == ast.Function:
+                return ObjectType.FUNCTION
+
+            return binding
+
+        elif expression_type == ast.Prefix:
+            right: StaticType = self._infer(expression.right, scope)
+            if expression.operator == '-' and right in (ObjectType.INTEGER, ObjectType.FLOAT):
+                return right
+
+            return None
+
+        elif expression_type == ast.Infix:
+            left: StaticType = self._infer(expression.left, scope)
+            right = self._infer(expression.right, scope)
+            if left is None or left is not right:
+                return None
+
+            return _INFIX_TYPES.get((left, expression.operator))
+
+        elif expression_type == ast.If:
+            returns, _, last_type = self._check_if(expression, scope)
+            if len(returns) > 0:
+                return None
+
+            return last_type
+
+        elif expression_type == ast.Function:
+            self._check_function(expression, scope)
+            return ObjectType.FUNCTION
+
+        elif expression_type == ast.Call:
+            return self._infer_call(expression, scope)
+
+        elif expression_type == ast.ListValues:
+            for value in expression.values:
+                self._infer(value, scope)
+            return ObjectType.LIST
+
+        elif expression_type == ast.TupleValues:
+            for value in expression.values:
+                self._infer(value, scope)
+            return ObjectType.TUPLE
+
+        elif expression_type == ast.CallList:
+            self._infer(expression.list_identifier, scope)
+            for value in expression.range or []:
+                self._infer(value, scope)
+
+        return None
+
+    def _infer_call(self, call: ast.Call, scope: Scope) -> StaticType:
+        call.signature = None
+
+        argument_types: List[StaticType] = [self._infer(argument, scope)
+                                            for argument in call.arguments or []]
+
+        signature: Binding = None
+        if type(call.function) == ast.Identifier:
+            signature = self._lookup(call.function.value, scope, globals_as_values=False)
+        else:
+            self._infer(call.function, scope)
+
+        if type(signature) != ast.Function:
+            return None
+
+        parameter_types: List[StaticType] = [TYPE_REGISTER_LITERAL.get(type_parameter.value)
+                                             for type_parameter in signature.type_parameters]
+        if len(argument_types) == len(signature.parameters) \
+                and len(parameter_types) == len(argument_types) \
+                and all(argument_type is not None and argument_type is parameter_type
+                        for argument_type, parameter_type in zip(argument_types, parameter_types)):
+            self._candidates.append((call, signature))
+
+        if signature.type_output is None:
+            return None
+
+        return TYPE_REGISTER_LITERAL.get(signature.type_output.value)
+
+    def _lookup(self, name: str, scope: Scope, globals_as_values: bool = True) -> Binding:
+        for bindings in scope.maps:
+            if name in bindings:
+                if bindings is self._globals and globals_as_values:
+                    return None
+
+                return bindings[name]
+
+        return None
+
+
+def check_types(program: ast.Program, env: Optional[Environment] = None) -> int:
+    return TypeChecker(env).check(program)
+
+
+def _clear_signatures(root: ast.ASTNode) -> None:
+    for node in ast.iter_nodes(root):
+        if type(node) == ast.Call:
+            node.signature = None
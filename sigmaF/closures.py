@@ -0,0 +1,626 @@
+from operator import (
+    add,
+    eq,
+    ge,
+    gt,
+    le,
+    lt,
+    mod,
+    mul,
+    ne,
+    sub
+)
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Type,
+    Union
+)
+
+import sigmaF.ast as ast
+from sigmaF.evaluator import (
+    FALSE,
+    NULL,
+    TRUE,
+    _capture_environment,
+    _check_arguments,
+    _check_output,
+    _check_type_tuple,
+    _evaluate_identifier,
+    _evaluate_infix_expression,
+    _evaluate_prefix_expression,
+    _extend_function_enviroment,
+    _get_values_iter,
+    _new_error,
+    _NON_MODIFIABLE_VALUE,
+    _NOT_A_FUNCTION,
+    _TAIL_EXPRESSIONS,
+    _UNKNOW_IDENTIFIER,
+    _unwrap_return_value,
+    TailCall
+)
+from sigmaF.object import (
+    Builtin,
+    Environment,
+    Error,
+    Float,
+    Function,
+    Integer,
+    new_integer,
+    Object,
+    ObjectType,
+    Return,
+    String,
+    ValueList
+)
+
+Code = Callable[[Environment], Optional[Object]]
+TailCode = Callable[[Environment], Union[Object, TailCall, None]]
+Compiler = Callable[[Any], Code]
+
+_ARITHMETIC_OPERATORS: Dict[str, Callable[[Any, Any], Any]] = {
+    '+': add,
+    '-': sub,
+    '*': mul,
+    '**': pow,
+    '%': mod,
+}
+
+_COMPARISON_OPERATORS: Dict[str, Callable[[Any, Any], bool]] = {
+    '<': lt,
+    '>': gt,
+    '<=': le,
+    '>=': ge,
+    '==': eq,
+    '!=': ne,
+}
+
+
+class ClosureCode:
+
+    __slots__ = ('body',)
+
+    def __init__(self, body: ast.Block) -> None:
+        self.body: TailCode = _compile_tail_block(body, True)
+
+    def __call__(self, env: Environment) -> Object:
+        return _apply_tail_calls(self.body, env)
+
+
+def run(program: ast.Program, env: Environment) -> Optional[Object]:
+    return compile_node(program)(env)
+
+
+def compile_node(node: ast.ASTNode) -> Code:
+    compiler: Optional[Compiler] = _COMPILERS.get(type(node))
+    if compiler is None:
+        return _nothing
+
+    return compiler(node)
+
+
+def _nothing(env: Environment) -> None:
+    return None
+
+
+def _compile_program(node: ast.Program) -> Code:
+    codes: List[Code] = [compile_node(statement) for statement in node.statements]
+
+    def program(env: Environment) -> Optional[Object]:
+        result: Optional[Object] = None
+
+        for code in codes:
+            result = code(env)
+
+            if type(result) is Return:
+                return result.value
+            elif type(result) is Error:
+                return result
+
+        return result
+
+    return program
+
+
+def _compile_expression_statement(node: ast.ExpressionStatement) -> Code:
+    assert node.expression is not None
+
+    return compile_node(node.expression)
+
+
+def _compile_integer(node: ast.Integer) -> Code:
+    if node.constant is None:
+        assert node.value is not None
+        node.constant = new_integer(node.value)
+    value: Object = node.constant
+
+    return lambda env: value
+
+
+def _compile_float(node: ast.Float) -> Code:
+    if node.constant is None:
+        assert node.value is not None
+        node.constant = Float(node.value)
+    value: Object = node.constant
+
+    return lambda env: value
+
+
+def _compile_boolean(node: ast.Boolean) -> Code:
+    assert node.value is not None
+    value: Object = TRUE if node.value else FALSE
+
+    return lambda env: value
+
+
+def _compile_string(node: ast.String) -> Code:
+    if node.constant is None:
+        assert node.value is not None
+        node.constant = String(node.value)
+    value: Object = node.constant
+
+    return lambda env: value
+
+
+def _compile_prefix(node: ast.Prefix) -> Code:
+    assert node.right is not None
+    right: Code = compile_node(node.right)
+    operator: str = node.operator
+
+    if operator != '-':
+        def prefix(env: Environment) -> Object:
+            right_value = right(env)
+
+            assert right_value is not None
+            return _evaluate_prefix_expression(operator, right_value)
+
+        return prefix
+
+    def minus(env: Environment) -> Object:
+        right_value = right(env)
+        value_type: Type = type(right_value)
+
+        if value_type is Integer:
+            return new_integer(-right_value.value)
+        elif value_type is Float:
+            return Float(-right_value.value)
+
+        assert right_value is not None
+        return _evaluate_prefix_expression(operator, right_value)
+
+    return minus
+
+
+def _compile_infix(node: ast.Infix) -> Code:
+    assert node.left is not None and node.right is not None
+    left: Code = compile_node(node.left)
+    right: Code = compile_node(node.right)
+    operator: str = node.operator
+
+    if operator in _ARITHMETIC_OPERATORS:
+        arithmetic_operator: Callable[[Any, Any], Any] = _ARITHMETIC_OPERATORS[operator]
+        new_value: Callable[[Any], Object] = Integer if operator == '**' else new_integer
+
+        def arithmetic(env: Environment) -> Object:
+            left_value = left(env)
+            right_value = right(env)
+            value_type: Type = type(left_value)
+
+            if value_type is type(right_value):
+                if value_type is Integer:
+                    return new_value(arithmetic_operator(left_value.value, right_value.value))
+                elif value_type is Float:
+                    return Float(arithmetic_operator(left_value.value, right_value.value))
+
+            assert right_value is not None and left_value is not None
+            return _evaluate_infix_expression(operator, left_value, right_value)
+
+        return arithmetic
+
+    elif operator in _COMPARISON_OPERATORS:
+        comparison_operator: Callable[[Any, Any], bool] = _COMPARISON_OPERATORS[operator]
+
+        def comparison(env: Environment) -> Object:
+            left_value = left(env)
+            right_value = right(env)
+            value_type: Type = type(left_value)
+
+            if value_type is type(right_value) and (value_type is Integer or value_type is Float):
+                return TRUE if comparison_operator(left_value.value, right_value.value) else FALSE
+
+            assert right_value is not None and left_value is not None
+            return _evaluate_infix_expression(operator, left_value, right_value)
+
+        return comparison
+
+    def infix(env: Environment) -> Object:
+        left_value = left(env)
+        right_value = right(env)
+
+        assert right_value is not None and left_value is not None
+        return _evaluate_infix_expression(operator, left_value, right_value)
+
+    return infix
+
+
+def _compile_block(node: ast.Block) -> Code:
+    codes: List[Code] = [compile_node(statement) for statement in node.statements]
+
+    def block(env: Environment) -> Optional[Object]:
+        result: Optional[Object] = None
+
+        for code in codes:
+            result = code(env)
+
+            if result is not None and (type(result) is Return or type(result) is Error):
+                return result
+
+        return result
+
+    return block
+
+
+def _compile_if(node: ast.If) -> Code:
+    assert node.condition is not None and node.consequence is not None
+    condition: Code = compile_node(node.condition)
+    consequence: Code = compile_node(node.consequence)
+    alternative: Optional[Code] = None if node.alternative is None \
+        else compile_node(node.alternative)
+
+    def if_expression(env: Environment) -> Optional[Object]:
+        condition_value = condition(env)
+
+        assert condition_value is not None
+        if condition_value is TRUE:
+            return consequence(env)
+        elif alternative is not None:
+            return alternative(env)
+
+        return NULL
+
+    return if_expression
+
+
+def _compile_return(node: ast.ReturnStatement) -> Code:
+    assert node.return_value is not None
+    return_value: Code = compile_node(node.return_value)
+
+    def return_statement(env: Environment) -> Object:
+        value = return_value(env)
+
+        assert value is not None
+        return Return(value)
+
+    return return_statement
+
+
+def _compile_let(node: ast.LetStatement) -> Code:
+    assert node.value is not None and node.name is not None
+    value: Code = compile_node(node.value)
+    symbol: int = node.name.symbol
+    name: str = node.name.value
+
+    def let_statement(env: Environment) -> Optional[Object]:
+        evaluated = value(env)
+
+        if symbol not in env._store:
+            env[symbol] = evaluated
+            return None
+
+        return _new_error(_NON_MODIFIABLE_VALUE, [name])
+
+    return let_statement
+
+
+def _compile_identifier(node: ast.Identifier) -> Code:
+    if node.depth != 0:
+        return lambda env: _evaluate_identifier(node, env)
+
+    symbol: int = node.symbol
+
+    def local(env: Environment) -> Object:
+        store = env._store
+        if symbol in store:
+            return store[symbol]
+
+        return _evaluate_identifier(node, env)
+
+    return local
+
+
+def _compile_function(node: ast.Function) -> Code:
+    assert node.body is not None
+    body: ClosureCode = ClosureCode(node.body)
+
+    def function(env: Environment) -> Function:
+        return Function(node.parameters,
+                        node.type_parameters,
+                        node.type_output,
+                        node.body,
+                        env if node.free_symbols is None else _capture_environment(node, env),
+                        body)
+
+    return function
+
+
+def _compile_call(node: ast.Call) -> Code:
+    assert node.arguments is not None
+    function_code: Code = compile_node(node.function)
+    arguments: List[Code] = [compile_node(argument) for argument in node.arguments]
+    signature: Optional[ast.Function] = node.signature
+
+    def call(env: Environment) -> Object:
+        function = function_code(env)
+
+        assert function is not None
+        if function.type() is ObjectType.ERROR:
+            return function
+
+        args: List[Object] = _evaluate_arguments(arguments, env)
+
+        if signature is not None and type(function) is Function \
+                and function.body is signature.body:
+            return _apply(function, args)
+
+        error = _check_arguments(function, args)
+        if error is not None:
+            return error
+
+        return _check_output(function, _apply(function, args))
+
+    return call
+
+
+def _compile_tail_call(node: ast.Call) -> TailCode:
+    assert node.arguments is not None
+    function_code: Code = compile_node(node.function)
+    arguments: List[Code] = [compile_node(argument) for argument in node.arguments]
+    signature: Optional[ast.Function] = node.signature
+
+    def tail_call(env: Environment) -> Union[Object, TailCall]:
+        function = function_code(env)
+
+        assert function is not None
+        if function.type() is ObjectType.ERROR:
+            return function
+
+        return TailCall(function, _evaluate_arguments(arguments, env),
+                        signature is not None and type(function) is Function
+                        and function.body is signature.body)
+
+    return tail_call
+
+
+def _compile_tail_block(node: ast.Block, value_position: bool) -> TailCode:
+    last: int = len(node.statements) - 1
+    codes: List[TailCode] = []
+
+    for index, statement in enumerate(node.statements):
+        if type(statement) is ast.ReturnStatement and \
+                type(statement.return_value) in _TAIL_EXPRESSIONS:
+            codes.append(_compile_tail_return(statement))
+        elif type(statement) is ast.ExpressionStatement and \
+                type(statement.expression) in _TAIL_EXPRESSIONS:
+            codes.append(_compile_tail_expression(statement.expression,
+                                                  value_position and index == last))
+        else:
+            codes.append(compile_node(statement))
+
+    def block(env: Environment) -> Union[Object, TailCall, None]:
+        result: Union[Object, TailCall, None] = None
+
+        for code in codes:
+            result = code(env)
+
+            if result is not None and (type(result) is Return or type(result) is Error
+                                       or type(result) is TailCall):
+                return result
+
+        return result
+
+    return block
+
+
+def _compile_tail_return(node: ast.ReturnStatement) -> TailCode:
+    assert node.return_value is not None
+    return_value: TailCode = _compile_tail_expression(node.return_value, True)
+
+    def return_statement(env: Environment) -> Union[Object, TailCall]:
+        value = return_value(env)
+
+        assert value is not None
+        if type(value) is TailCall:
+            return value
+
+        return Return(value)
+
+    return return_statement
+
+
+def _compile_tail_expression(node: ast.Expression, value_position: bool) -> TailCode:
+    if type(node) is ast.Call:
+        if not value_position:
+            return compile_node(node)
+
+        return _compile_tail_call(node)
+
+    assert node.condition is not None and node.consequence is not None
+    condition: Code = compile_node(node.condition)
+    consequence: TailCode = _compile_tail_block(node.consequence, value_position)
+    alternative: Optional[TailCode] = None if node.alternative is None \
+        else _compile_tail_block(node.alternative, value_position)
+
+    def if_expression(env: Environment) -> Union[Object, TailCall, None]:
+        condition_value = condition(env)
+
+        assert condition_value is not None
+        if condition_value is TRUE:
+            return consequence(env)
+        elif alternative is not None:
+            return alternative(env)
+
+        return NULL
+
+    return if_expression
+
+
+def _evaluate_arguments(arguments: List[Code], env: Environment) -> List[Object]:
+    args: List[Object] = []
+    for argument in arguments:
+        value = argument(env)
+
+        assert value is not None
+        args.append(value)
+
+    return args
+
+
+def _apply(function: Object, args: List[Object]) -> Object:
+    if type(function) is Function:
+        code: Optional[Code] = function.code
+        if code is None:
+            code = function.code = ClosureCode(function.body)
+
+        evaluated = code(_extend_function_enviroment(function, args))
+
+        assert evaluated is not None
+        return _unwrap_return_value(evaluated)
+
+    elif type(function) is Builtin:
+        return function.fn(*args)
+
+    return _new_error(_NOT_A_FUNCTION, [function.type().name])
+
+
+def _apply_tail_calls(body: TailCode, env: Environment) -> Object:
+    pending: List[Function] = []
+
+    while True:
+        evaluated = body(env)
+
+        if type(evaluated) is not TailCall:
+            assert evaluated is not None
+            value: Object = _unwrap_return_value(evaluated)
+            break
+
+        function: Object = evaluated.function
+        args: List[Object] = evaluated.arguments
+
+        if not evaluated.checked:
+            error = _check_arguments(function, args)
+            if error is not None:
+                value = error
+                break
+
+        if type(function) is not Function or \
+                (function.code is not None and type(function.code) is not ClosureCode):
+            value = _apply(function, args)
+            if not evaluated.checked:
+                value = _check_output(function, value)
+            break
+
+        if function.code is None:
+            function.code = ClosureCode(function.body)
+
+        body = function.code.body
+        env = _extend_function_enviroment(function, args)
+        if not evaluated.checked and \
+                (len(pending) == 0 or str(pending[-1].type_output) != str(function.type_output)):
+            pending.append(function)
+
+    for function in reversed(pending):
+        value = _check_output(function, value)
+
+    return value
+
+
+def _compile_items(node: ast.Expression) -> Callable[[Environment], List[Object]]:
+    codes: List[Code] = [compile_node(value) for value in node.values]
+    names: List[Any] = [
+        value.value if type(value) is ast.Identifier
+        else value.list_identifier if type(value) is ast.CallList
+        else 'unknow identifier'
+        for value in node.values
+    ]
+
+    def items(env: Environment) -> List[Object]:
+        values: List[Object] = []
+
+        for index, code in enumerate(codes):
+            evaluated = code(env)
+
+            assert evaluated is not None
+            if evaluated.type() is ObjectType.ERROR:
+                return [_new_error(_UNKNOW_IDENTIFIER, [names[index]])]
+
+            values.append(evaluated)
+
+        return values
+
+    return items
+
+
+def _compile_list(node: ast.ListValues) -> Code:
+    items: Callable[[Environment], List[Object]] = _compile_items(node)
+
+    def list_values(env: Environment) -> Object:
+        values: List[Object] = items(env)
+
+        if len(values) > 0 and values[0].type() is ObjectType.ERROR:
+            return values[0]
+
+        return ValueList(values)
+
+    return list_values
+
+
+def _compile_tuple(node: ast.TupleValues) -> Code:
+    items: Callable[[Environment], List[Object]] = _compile_items(node)
+
+    return lambda env: _check_type_tuple(items(env))
+
+
+def _compile_call_list(node: ast.CallList) -> Code:
+    assert node.range is not None
+    list_identifier: Code = compile_node(node.list_identifier)
+    ranges: List[Code] = [compile_node(end_of) for end_of in node.range]
+
+    def call_list(env: Environment) -> Object:
+        iterable = list_identifier(env)
+
+        assert iterable is not None
+        values: List[Object] = []
+        for end_of in ranges:
+            value = end_of(env)
+
+            assert value is not None
+            values.append(value)
+
+        return _get_values_iter(iterable, values)
+
+    return call_list
+
+
+_COMPILERS: Dict[Type, Compiler] = {
+    ast.Program: _compile_program,
+    ast.ExpressionStatement: _compile_expression_statement,
+    ast.Integer: _compile_integer,
+    ast.Float: _compile_float,
+    ast.Boolean: _compile_boolean,
+    ast.String: _compile_string,
+    ast.Prefix: _compile_prefix,
+    ast.Infix: _compile_infix,
+    ast.Block: _compile_block,
+    ast.If: _compile_if,
+    ast.ReturnStatement: _compile_return,
+    ast.LetStatement: _compile_let,
+    ast.Identifier: _compile_identifier,
+    ast.Function: _compile_function,
+    ast.Call: _compile_call,
+    ast.ListValues: _compile_list,
+    ast.TupleValues: _compile_tuple,
+    ast.CallList: _compile_call_list,
+}
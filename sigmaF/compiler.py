@@ -0,0 +1,582 @@
+import pickle
+
+from enum import (
+    IntEnum,
+    unique
+)
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple
+)
+
+import sigmaF.ast as ast
+from sigmaF.object import (
+    Float,
+    Integer,
+    Object,
+    String
+)
+from sigmaF.resolver import _declared_names
+from sigmaF.symbol import SYMBOLS
+
+BYTECODE_VERSION = 1
+
+_MAGIC = b'SFB\x00'
+
+_UNSUPPORTED_NODE = 'The node {} can not be compiled'
+_DYNAMIC_NAME = 'The name {} is bound dynamically'
+
+
+@unique
+class Opcode(IntEnum):
+    LOAD_CONST = 1
+    LOAD_TRUE = 2
+    LOAD_FALSE = 3
+    LOAD_NONE = 4
+    LOAD_LOCAL = 5
+    LOAD_LOCAL_OR_GLOBAL = 6
+    LOAD_FREE = 7
+    LOAD_GLOBAL = 8
+    STORE_LOCAL = 9
+    STORE_GLOBAL = 10
+    ADD = 11
+    SUB = 12
+    MUL = 13
+    POW = 14
+    MOD = 15
+    LT = 16
+    GT = 17
+    LE = 18
+    GE = 19
+    EQ = 20
+    NE = 21
+    BINARY = 22
+    NEGATE = 23
+    PREFIX = 24
+    POP = 25
+    POP_OR_EXIT = 26
+    POP_OR_JUMP = 27
+    JUMP = 28
+    JUMP_IF_NOT_TRUE = 29
+    JUMP_IF_ERROR = 30
+    MAKE_RETURN = 31
+    RETURN = 32
+    MAKE_FUNCTION = 33
+    CALL = 34
+    CALL_CHECKED = 35
+    ITEM_CHECK = 36
+    BUILD_LIST = 37
+    BUILD_TUPLE = 38
+    CALL_LIST = 39
+    LOAD_NULL = 40
+
+
+OPERAND_COUNTS: Dict[Opcode, int] = {
+    **{opcode: 0 for opcode in Opcode},
+    **{opcode: 1 for opcode in (
+        Opcode.LOAD_CONST,
+        Opcode.LOAD_LOCAL,
+        Opcode.LOAD_LOCAL_OR_GLOBAL,
+        Opcode.LOAD_FREE,
+        Opcode.LOAD_GLOBAL,
+        Opcode.STORE_LOCAL,
+        Opcode.STORE_GLOBAL,
+        Opcode.BINARY,
+        Opcode.PREFIX,
+        Opcode.POP_OR_JUMP,
+        Opcode.JUMP,
+        Opcode.JUMP_IF_NOT_TRUE,
+        Opcode.JUMP_IF_ERROR,
+        Opcode.MAKE_FUNCTION,
+        Opcode.CALL,
+        Opcode.BUILD_LIST,
+        Opcode.BUILD_TUPLE,
+        Opcode.CALL_LIST,
+    )},
+    Opcode.CALL_CHECKED: 2,
+    Opcode.ITEM_CHECK: 3,
+}
+
+_INFIX_OPCODES: Dict[str, Opcode] = {
+    '+': Opcode.ADD,
+    '-': Opcode.SUB,
+    '*': Opcode.MUL,
+    '**': Opcode.POW,
+    '%': Opcode.MOD,
+    '<': Opcode.LT,
+    '>': Opcode.GT,
+    '<=': Opcode.LE,
+    '>=': Opcode.GE,
+    '==': Opcode.EQ,
+    '!=': Opcode.NE,
+}
+
+_NAME_OPERANDS: Set[Opcode] = {
+    Opcode.LOAD_FREE,
+    Opcode.LOAD_GLOBAL,
+    Opcode.STORE_GLOBAL,
+    Opcode.BINARY,
+    Opcode.PREFIX,
+}
+
+_JUMPS: Set[Opcode] = {
+    Opcode.POP_OR_JUMP,
+    Opcode.JUMP,
+    Opcode.JUMP_IF_NOT_TRUE,
+    Opcode.JUMP_IF_ERROR,
+}
+
+
+class CompileError(Exception):
+    pass
+
+
+class FunctionCode:
+
+    __slots__ = ('name', 'instructions', 'argcount', 'local_names', 'free_names',
+                 'parameters', 'type_parameters', 'type_output', 'body', 'unit',
+                 'local_symbols', 'free_symbols')
+
+    def __init__(self,
+                 name: str,
+                 parameters: List[ast.Identifier],
+                 type_parameters: List[ast.Identifier],
+                 type_output: Optional[ast.Identifier],
+                 body: Optional[ast.Block],
+                 unit: 'Bytecode') -> None:
+        self.name = name
+        self.instructions: List[int] = []
+        self.argcount: int = len(parameters)
+        self.local_names: List[str] = [parameter.value for parameter in parameters]
+        self.free_names: List[str] = []
+        self.parameters = parameters
+        self.type_parameters = type_parameters
+        self.type_output = type_output
+        self.body = body
+        self.unit = unit
+        self.local_symbols: List[int] = []
+        self.free_symbols: List[int] = []
+
+    def __call__(self, env: Any) -> Optional[Object]:
+        from sigmaF.vm import call_code
+
+        return call_code(self, env)
+
+    def __getstate__(self) -> Tuple:
+        return (self.name, self.instructions, self.argcount, self.local_names,
+                self.free_names, self.parameters, self.type_parameters,
+                self.type_output, self.unit)
+
+    def __setstate__(self, state: Tuple) -> None:
+        (self.name, self.instructions, self.argcount, self.local_names,
+         self.free_names, self.parameters, self.type_parameters,
+         self.type_output, self.unit) = state
+        self.body = None
+        self.intern()
+
+    def intern(self) -> None:
+        self.local_symbols = [SYMBOLS.intern(name) for name in self.local_names]
+        self.free_symbols = [SYMBOLS.intern(name) for name in self.free_names]
+
+
+class Bytecode:
+
+    __slots__ = ('constants', 'names', 'functions', 'symbols')
+
+    def __init__(self) -> None:
+        self.constants: List[Object] = []
+        self.names: List[str] = []
+        self.functions: List[FunctionCode] = []
+        self.symbols: List[int] = []
+
+    @property
+    def main(self) -> FunctionCode:
+        return self.functions[0]
+
+    def __getstate__(self) -> Tuple:
+        return (self.constants, self.names, self.functions)
+
+    def __setstate__(self, state: Tuple) -> None:
+        self.constants, self.names, self.functions = state
+        self.intern()
+
+    def intern(self) -> None:
+        self.symbols = [SYMBOLS.intern(name) for name in self.names]
+
+
+class _Scope:
+
+    __slots__ = ('code', 'slots', 'bound', 'declared')
+
+    def __init__(self, code: FunctionCode, declared: Set[str]) -> None:
+        self.code = code
+        self.slots: Dict[str, int] = {name: slot for slot, name in enumerate(code.local_names)}
+        self.bound: Set[str] = set(self.slots)
+        self.declared = declared
+
+        for name in sorted(declared - self.bound):
+            self.slots[name] = len(code.local_names)
+            code.local_names.append(name)
+
+
+class Compiler:
+
+    def __init__(self) -> None:
+        self._unit: Bytecode = Bytecode()
+        self._code: FunctionCode = FunctionCode('<program>', [], [], None, None, self._unit)
+        self._scopes: List[_Scope] = []
+        self._constants: Dict[Tuple[type, Any], int] = {}
+        self._names: Dict[str, int] = {}
+        self._functions: Dict[ast.Function, int] = {}
+
+    def compile(self, program: ast.Program) -> Bytecode:
+        self._unit = Bytecode()
+        self._code = FunctionCode('<program>', [], [], None, None, self._unit)
+        self._unit.functions.append(self._code)
+        self._scopes = []
+        self._constants = {}
+        self._names = {}
+        self._functions = {}
+
+        for node in ast.iter_nodes(program):
+            if type(node) == ast.Function:
+                self._functions[node] = len(self._functions) + 1
+                self._unit.functions.append(self._code)
+
+        try:
+            self._compile_block(program.statements, direct=True)
+        except RecursionError:
+            raise CompileError(_UNSUPPORTED_NODE.format('Program'))
+        self._emit(Opcode.RETURN)
+
+        self._unit.intern()
+        for code in self._unit.functions:
+            code.intern()
+
+        return self._unit
+
+    def _emit(self, opcode: Opcode, *operands: int) -> int:
+        instructions: List[int] = self._code.instructions
+        instructions.append(opcode.value)
+        instructions.extend(operands)
+
+        return len(instructions) - 1
+
+    def _patch(self, operand: int) -> None:
+        self._code.instructions[operand] = len(self._code.instructions)
+
+    def _constant(self, value: Object) -> int:
+        key: Tuple[type, Any] = (type(value), value.value)
+        if key not in self._constants:
+            self._constants[key] = len(self._unit.constants)
+            self._unit.constants.append(value)
+
+        return self._constants[key]
+
+    def _name(self, name: str) -> int:
+        if name not in self._names:
+            self._names[name] = len(self._unit.names)
+            self._unit.names.append(name)
+
+        return self._names[name]
+
+    def _compile_block(self, statements: List[ast.Statement], direct: bool) -> None:
+        if len(statements) == 0:
+            self._emit(Opcode.LOAD_NONE)
+            return
+
+        bound: Optional[Set[str]] = None if len(self._scopes) == 0 \
+            else self._scopes[-1].bound.copy()
+        exits: List[int] = []
+
+        for index, statement in enumerate(statements):
+            self._compile_statement(statement, direct, exits)
+
+            if index == len(statements) - 1:
+                break
+            elif direct:
+                self._emit(Opcode.POP_OR_EXIT)
+            else:
+                exits.append(self._emit(Opcode.POP_OR_JUMP, 0))
+
+        for operand in exits:
+            self._patch(operand)
+
+        if bound is not None:
+            self._scopes[-1].bound = bound
+
+    def _compile_statement(self, statement: ast.Statement, direct: bool, exits: List[int]) -> None:
+        statement_type: type = type(statement)
+
+        if statement_type == ast.ExpressionStatement:
+            assert statement.expression is not None
+            if type(statement.expression) == ast.If:
+                self._compile_if(statement.expression, direct)
+            else:
+                self._compile_expression(statement.expression)
+
+        elif statement_type == ast.LetStatement:
+            assert statement.value is not None and statement.name is not None
+            name: str = statement.name.value
+            if type(statement.value) == ast.Function:
+                self._compile_function(statement.value, name)
+            else:
+                self._compile_expression(statement.value)
+
+            if len(self._scopes) == 0:
+                self._emit(Opcode.STORE_GLOBAL, self._name(name))
+            else:
+                scope: _Scope = self._scopes[-1]
+                self._emit(Opcode.STORE_LOCAL, scope.slots[name])
+                scope.bound.add(name)
+
+        elif statement_type == ast.ReturnStatement:
+            assert statement.return_value is not None
+            self._compile_expression(statement.return_value)
+
+            if direct:
+                self._emit(Opcode.RETURN)
+            else:
+                self._emit(Opcode.MAKE_RETURN)
+                exits.append(self._emit(Opcode.JUMP, 0))
+
+        elif statement_type == ast.Block:
+            self._compile_block(statement.statements, direct)
+
+        else:
+            raise CompileError(_UNSUPPORTED_NODE.format(statement_type.__name__))
+
+    def _compile_expression(self, expression: Optional[ast.Expression]) -> None:
+        expression_type: type = type(expression)
+
+        if expression_type == ast.Integer:
+            self._emit(Opcode.LOAD_CONST, self._constant(Integer(expression.value)))
+
+        elif expression_type == ast.Float:
+            self._emit(Opcode.LOAD_CONST, self._constant(Float(expression.value)))
+
+        elif expression_type == ast.String:
+            self._emit(Opcode.LOAD_CONST, self._constant(String(expression.value)))
+
+        elif expression_type == ast.Boolean:
+            self._emit(Opcode.LOAD_TRUE if expression.value else Opcode.LOAD_FALSE)
+
+        elif expression_type == ast.Identifier:
+            self._compile_identifier(expression.value)
+
+        elif expression_type == ast.Prefix:
+            self._compile_expression(expression.right)
+            if expression.operator == '-':
+                self._emit(Opcode.NEGATE)
+            else:
+                self._emit(Opcode.PREFIX, self._name(expression.operator))
+
+        elif expression_type == ast.Infix:
+            self._compile_expression(expression.left)
+            self._compile_expression(expression.right)
+            if expression.operator in _INFIX_OPCODES:
+                self._emit(_INFIX_OPCODES[expression.operator])
+            else:
+                self._emit(Opcode.BINARY, self._name(expression.operator))
+
+        elif expression_type == ast.If:
+            self._compile_if(expression, direct=False)
+
+        elif expression_type == ast.Function:
+            self._compile_function(expression)
+
+        elif expression_type == ast.Call:
+            self._compile_call(expression)
+
+        elif expression_type in (ast.ListValues, ast.TupleValues):
+            self._compile_items(expression)
+
+        elif expression_type == ast.CallList:
+            assert expression.range is not None
+            self._compile_expression(expression.list_identifier)
+            for value in expression.range:
+                self._compile_expression(value)
+            self._emit(Opcode.CALL_LIST, len(expression.range))
+
+        else:
+            raise CompileError(_UNSUPPORTED_NODE.format(expression_type.__name__))
+
+    def _compile_identifier(self, name: str) -> None:
+        if len(self._scopes) == 0:
+            self._emit(Opcode.LOAD_GLOBAL, self._name(name))
+            return
+
+        opcode, operand = self._resolve(len(self._scopes) - 1, name)
+        self._emit(opcode, operand)
+
+    def _resolve(self, index: int, name: str) -> Tuple[Opcode, int]:
+        scope: _Scope = self._scopes[index]
+
+        if name in scope.bound:
+            return Opcode.LOAD_LOCAL, scope.slots[name]
+        elif name in scope.declared:
+            if any(name in outer.slots for outer in self._scopes[:index]):
+                raise CompileError(_DYNAMIC_NAME.format(name))
+            return Opcode.LOAD_LOCAL_OR_GLOBAL, scope.slots[name]
+        elif index == 0:
+            return Opcode.LOAD_GLOBAL, self._name(name)
+
+        opcode, operand = self._resolve(index - 1, name)
+        if opcode == Opcode.LOAD_GLOBAL:
+            return opcode, operand
+        elif opcode == Opcode.LOAD_LOCAL_OR_GLOBAL:
+            raise CompileError(_DYNAMIC_NAME.format(name))
+
+        if name not in scope.code.free_names:
+            scope.code.free_names.append(name)
+
+        return Opcode.LOAD_FREE, self._name(name)
+
+    def _compile_if(self, if_expression: ast.If, direct: bool) -> None:
+        assert if_expression.condition is not None and if_expression.consequence is not None
+        self._compile_expression(if_expression.condition)
+        alternative: int = self._emit(Opcode.JUMP_IF_NOT_TRUE, 0)
+
+        self._compile_block(if_expression.consequence.statements, direct)
+        end: int = self._emit(Opcode.JUMP, 0)
+
+        self._patch(alternative)
+        if if_expression.alternative is not None:
+            self._compile_block(if_expression.alternative.statements, direct)
+        else:
+            self._emit(Opcode.LOAD_NULL)
+
+        self._patch(end)
+
+    def _compile_function(self, function: ast.Function, name: str = 'fn') -> None:
+        assert function.body is not None
+        index: int = self._functions[function]
+        code: FunctionCode = FunctionCode(
+            name,
+            function.parameters,
+            function.type_parameters,
+            function.type_output,
+            function.body,
+            self._unit
+        )
+        self._unit.functions[index] = code
+
+        enclosing: FunctionCode = self._code
+        self._code = code
+        self._scopes.append(_Scope(code, _declared_names(function.body)))
+
+        self._compile_block(function.body.statements, direct=True)
+        self._emit(Opcode.RETURN)
+
+        self._scopes.pop()
+        self._code = enclosing
+
+        for name in code.free_names:
+            self._compile_identifier(name)
+        self._emit(Opcode.MAKE_FUNCTION, index)
+
+    def _compile_call(self, call: ast.Call) -> None:
+        assert call.arguments is not None
+        self._compile_expression(call.function)
+
+        error: Optional[int] = None
+        if len(call.arguments) > 0:
+            error = self._emit(Opcode.JUMP_IF_ERROR, 0)
+
+        for argument in call.arguments:
+            self._compile_expression(argument)
+
+        if call.signature is not None and call.signature in self._functions:
+            self._emit(Opcode.CALL_CHECKED, len(call.arguments), self._functions[call.signature])
+        else:
+            self._emit(Opcode.CALL, len(call.arguments))
+
+        if error is not None:
+            self._patch(error)
+
+    def _compile_items(self, expression: ast.Expression) -> None:
+        exits: List[int] = []
+
+        for index, value in enumerate(expression.values):
+            self._compile_expression(value)
+
+            if type(value) is ast.Identifier:
+                name: str = value.value
+            elif type(value) is ast.CallList:
+                name = str(value.list_identifier)
+            else:
+                name = 'unknow identifier'
+            exits.append(self._emit(Opcode.ITEM_CHECK, index, self._name(name), 0))
+
+        if type(expression) == ast.ListValues:
+            self._emit(Opcode.BUILD_LIST, len(expression.values))
+        else:
+            self._emit(Opcode.BUILD_TUPLE, len(expression.values))
+
+        for operand in exits:
+            self._patch(operand)
+
+
+def compile_program(program: ast.Program) -> Bytecode:
+    return Compiler().compile(program)
+
+
+def disassemble(bytecode: Bytecode) -> str:
+    lines: List[str] = []
+
+    for index, code in enumerate(bytecode.functions):
+        parameters: str = ', '.join(code.local_names[:code.argcount])
+        lines.append(f'{index}: {code.name}({parameters}) '
+                     f'locals={code.local_names[code.argcount:]} free={code.free_names}')
+
+        instructions: List[int] = code.instructions
+        offset: int = 0
+        while offset < len(instructions):
+            opcode: Opcode = Opcode(instructions[offset])
+            operands: List[int] = instructions[offset + 1:offset + 1 + OPERAND_COUNTS[opcode]]
+            lines.append(f'{offset:>6} {opcode.name:<22}'
+                         f'{" ".join(str(operand) for operand in operands):<10}'
+                         f'{_describe(bytecode, code, opcode, operands)}'.rstrip())
+            offset += 1 + len(operands)
+
+    return '\n'.join(lines)
+
+
+def _describe(bytecode: Bytecode, code: FunctionCode, opcode: Opcode, operands: List[int]) -> str:
+    if opcode == Opcode.LOAD_CONST:
+        return f'({bytecode.constants[operands[0]].inspect()})'
+    elif opcode in _NAME_OPERANDS:
+        return f'({bytecode.names[operands[0]]})'
+    elif opcode in (Opcode.LOAD_LOCAL, Opcode.LOAD_LOCAL_OR_GLOBAL, Opcode.STORE_LOCAL):
+        return f'({code.local_names[operands[0]]})'
+    elif opcode in _JUMPS:
+        return f'(to {operands[0]})'
+    elif opcode == Opcode.ITEM_CHECK:
+        return f'({bytecode.names[operands[1]]}, to {operands[2]})'
+    elif opcode == Opcode.MAKE_FUNCTION:
+        return f'({bytecode.functions[operands[0]].name})'
+    elif opcode == Opcode.CALL_CHECKED:
+        return f'({bytecode.functions[operands[1]].name})'
+
+    return ''
+
+
+def dumps(bytecode: Bytecode) -> bytes:
+    return _MAGIC + bytes([BYTECODE_VERSION]) + \
+        pickle.dumps(bytecode, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def loads(data: bytes) -> Bytecode:
+    if data[:len(_MAGIC)] != _MAGIC or data[len(_MAGIC)] != BYTECODE_VERSION:
+        raise ValueError('Not a sigmaF bytecode of version {}'.format(BYTECODE_VERSION))
+
+    bytecode = pickle.loads(data[len(_MAGIC) + 1:])
+    if type(bytecode) != Bytecode:
+        raise ValueError('Not a sigmaF bytecode of version {}'.format(BYTECODE_VERSION))
+
+    return bytecode
+
@@ -1,9 +1,26 @@
+from functools import partial
+from operator import (
+    add,
+    eq,
+    ge,
+    gt,
+    le,
+    lt,
+    mod,
+    mul,
+    ne,
+    sub
+)
 from typing import (
     Any,
+    Callable,
     cast,
     Dict,
+    Iterable,
     List,
+    NamedTuple,
     Optional,
+    Tuple,
     Type,
     Union
 )
@@ -13,25 +30,25 @@ import sigmaF.ast as ast
 from sigmaF.object import (
     Boolean,
     Builtin,
+    EMPTY_LIST,
+    FALSE,
     Float,
     Function,
     Environment,
     Error,
     Integer,
     Identifier,
+    new_integer,
+    NULL,
     ValueList,
     ValueTuple,
-    Null,
     Return,
     String,
     Object,
     ObjectType,
+    TRUE,
 )
-from sigmaF.builtins import BUILTIN
-
-TRUE = Boolean(True)
-FALSE = Boolean(False)
-NULL = Null()
+from sigmaF.builtins import BUILTIN_SYMBOLS
 
 _NOT_A_FUNCTION = 'It is not a function: {}'
 _TYPE_MISMATCH = 'Type Discrepancy: It is not possible to do the operation \'{}\', for an {} and a {}'
@@ -51,6 +68,55 @@ _WRONG_NUMBER_OF_INDEXES_TUPLE = 'Wrong number of indexes: The tuple only requir
 _INCOMPATIBLE_TUPLE_OPTERATION = 'Incompatible tuple operation: It is not possible to do the operation {} between a {} Tuple and a {} Tuple'
 _INCOMPATIBLE_NULL_OPTERATION = 'Incompatible null operation: It is not possible to do the operation {} between a {} and {}'
 
+
+class TailCall(NamedTuple):
+    function: Object
+    arguments: List[Object]
+    checked: bool
+
+
+_TAIL_EXPRESSIONS = (ast.Call, ast.If)
+
+InfixHandler = Callable[[Any, Any], Object]
+
+
+class InfixCache:
+
+    __slots__ = ('left', 'right', 'handler', 'hits', 'misses')
+
+    def __init__(self, left: Type, right: Type, handler: InfixHandler) -> None:
+        self.left = left
+        self.right = right
+        self.handler = handler
+        self.hits = 0
+        self.misses = 1
+
+
+class CallCache:
+
+    __slots__ = ('target', 'argument_types', 'hits', 'misses')
+
+    def __init__(self, target: Any, argument_types: Tuple[Type, ...]) -> None:
+        self.target = target
+        self.argument_types = argument_types
+        self.hits = 0
+        self.misses = 1
+
+    def guard(self, function: Object, args: List[Object]) -> bool:
+        if type(function) == Builtin:
+            return function is self.target
+
+        if type(function) != Function or cast(Function, function).body is not self.target \
+                or len(args) != len(self.argument_types):
+            return False
+
+        for arg, argument_type in zip(args, self.argument_types):
+            if type(arg) is not argument_type:
+                return False
+
+        return True
+
+
 TYPE_REGISTER_LITERAL: Dict[str, ObjectType] = {
     'int': ObjectType.INTEGER,
     'str': ObjectType.STRING,
@@ -89,14 +155,20 @@ def evaluate(node: ast.ASTNode, env: Environment) -> Optional[Object]:
     elif node_type == ast.Integer:
         node = cast(ast.Integer, node)
 
-        assert node.value is not None
-        return Integer(node.value)
+        if node.constant is None:
+            assert node.value is not None
+            node.constant = new_integer(node.value)
+
+        return node.constant
 
     elif node_type == ast.Float:
         node = cast(ast.Float, node)
 
-        assert node.value is not None
-        return Float(node.value)
+        if node.constant is None:
+            assert node.value is not None
+            node.constant = Float(node.value)
+
+        return node.constant
 
     elif node_type == ast.Boolean:
         node = cast(ast.Boolean, node)
@@ -107,9 +179,11 @@ def evaluate(node: ast.ASTNode, env: Environment) -> Optional[Object]:
     elif node_type == ast.String:
         node = cast(ast.String, node)
 
-        assert node.value is not None
+        if node.constant is None:
+            assert node.value is not None
+            node.constant = _to_string_object(node.value)
 
-        return _to_string_object(node.value)
+        return node.constant
 
     elif node_type == ast.Prefix:
         node = cast(ast.Prefix, node)
@@ -128,7 +202,12 @@ def evaluate(node: ast.ASTNode, env: Environment) -> Optional[Object]:
         right = evaluate(node.right, env)
 
         assert right is not None and left is not None
-        return _evaluate_infix_expression(node.operator, left, right)
+        cache = node.cache
+        if cache is not None and type(left) is cache.left and type(right) is cache.right:
+            cache.hits += 1
+            return cache.handler(left, right)
+
+        return _specialize_infix(node, left, right)
     elif node_type == ast.Block:
         node = cast(ast.Block, node)
 
@@ -153,8 +232,8 @@ def evaluate(node: ast.ASTNode, env: Environment) -> Optional[Object]:
 
         assert node.name is not None
 
-        if not node.name.value in env._store:
-            env[node.name.value] = value
+        if not node.name.symbol in env._store:
+            env[node.name.symbol] = value
         else:
             return _new_error(_NON_MODIFIABLE_VALUE, [node.name.value])
 
@@ -171,7 +250,7 @@ def evaluate(node: ast.ASTNode, env: Environment) -> Optional[Object]:
                         node.type_parameters,
                         node.type_output,
                         node.body,
-                        env)
+                        env if node.free_symbols is None else _capture_environment(node, env))
     elif node_type == ast.Call:
         node = cast(ast.Call, node)
 
@@ -183,43 +262,19 @@ def evaluate(node: ast.ASTNode, env: Environment) -> Optional[Object]:
         assert node.arguments is not None
         args = _evaluate_expression(node.arguments, env)
 
-        if not _check_type_args_function(function, args):
-            function = cast(Function, function)
-
-            type_params = function.type_parameters
+        if node.signature is not None and type(function) == Function \
+                and cast(Function, function).body is node.signature.body:
+            return _apply_function(function, args)
 
-            type_args = []
-            for arg in args:
-                if arg.type() is ObjectType.ERROR:
-                    return arg
-                type_args.append(TYPE_REGISTER_OBJECT[arg.type()])
+        cache = node.cache
+        if cache is not None and cache.guard(function, args):
+            cache.hits += 1
+            if type(function) == Builtin:
+                return cast(Builtin, function).fn(*args)
 
-            return _new_error(_WRONG_ARGS, [
-                ', '.join([type_param.value for type_param in type_params[0:-1]]
-                          ) + f', and {type_params[-1].value}'
-                if len(type_args) > 1 else type_params[0].value,
+            return _check_output(function, _apply_function(function, args))
 
-                ' ,'.join(type_args[0:-1]) + f', and {type_args[-1]}'
-                if len(type_args) > 1 else type_args[0]
-            ])
-
-        return_fn = _apply_function(function, args)
-
-        if type(function) == Builtin:
-            return return_fn
-        elif type(function) == Function \
-                and _check_type_out_function(function, return_fn):
-            return return_fn
-        elif type(function) == Error:
-            return return_fn
-        else:
-            function = cast(Function, function)
-
-            if return_fn.type() is ObjectType.ERROR:
-                return return_fn
-
-            return _new_error(_WRONG_OUTPUT, [
-                function.type_output, TYPE_REGISTER_OBJECT[return_fn.type()]])
+        return _specialize_call(node, function, args)
 
     elif node_type == ast.ListValues:
         node = cast(ast.ListValues, node)
@@ -231,7 +286,7 @@ def evaluate(node: ast.ASTNode, env: Environment) -> Optional[Object]:
             else:
                 return items[0]
         else:
-            return ValueList([])
+            return EMPTY_LIST
 
     elif node_type == ast.CallList:
         node = cast(ast.CallList, node)
@@ -325,6 +380,48 @@ def _get_values_iter(iterable: Object, ranges: List[Object]) -> Object:
         return _new_error(_NOT_AN_ITERABLE, [TYPE_REGISTER_OBJECT[iterable.type()]])
 
 
+def _check_arguments(function: Object, args: List[Object]) -> Optional[Object]:
+    if _check_type_args_function(function, args):
+        return None
+
+    function = cast(Function, function)
+
+    type_params = function.type_parameters
+
+    type_args = []
+    for arg in args:
+        if arg.type() is ObjectType.ERROR:
+            return arg
+        type_args.append(TYPE_REGISTER_OBJECT[arg.type()])
+
+    return _new_error(_WRONG_ARGS, [
+        ', '.join([type_param.value for type_param in type_params[0:-1]]
+                  ) + f', and {type_params[-1].value}'
+        if len(type_args) > 1 else type_params[0].value,
+
+        ' ,'.join(type_args[0:-1]) + f', and {type_args[-1]}'
+        if len(type_args) > 1 else type_args[0]
+    ])
+
+
+def _check_output(function: Object, return_fn: Object) -> Object:
+    if type(function) == Builtin:
+        return return_fn
+    elif type(function) == Function \
+            and _check_type_out_function(function, return_fn):
+        return return_fn
+    elif type(function) == Error:
+        return return_fn
+    else:
+        function = cast(Function, function)
+
+        if return_fn.type() is ObjectType.ERROR:
+            return return_fn
+
+        return _new_error(_WRONG_OUTPUT, [
+            function.type_output, TYPE_REGISTER_OBJECT[return_fn.type()]])
+
+
 def _check_type_args_function(fn: Object, args: List[Object]) -> Union[bool, Object]:
     if type(fn) == Function:
         fn = cast(Function, fn)
@@ -354,7 +451,10 @@ def _apply_function(fn: Object, args: List[Object]) -> Object:
         fn = cast(Function, fn)
 
         extended_environment = _extend_function_enviroment(fn, args)
-        evaluated = evaluate(fn.body, extended_environment)
+        if fn.code is None:
+            return _apply_tail_calls(fn, extended_environment)
+
+        evaluated = fn.code(extended_environment)
 
         assert evaluated is not None
         return _unwrap_return_value(evaluated)
@@ -368,14 +468,140 @@ def _apply_function(fn: Object, args: List[Object]) -> Object:
         return _new_error(_NOT_A_FUNCTION, [fn.type().name])
 
 
+def _apply_tail_calls(fn: Function, env: Environment) -> Object:
+    pending: List[Function] = []
+
+    while True:
+        evaluated = _evaluate_tail_block(fn.body, env)
+
+        if type(evaluated) != TailCall:
+            assert evaluated is not None
+            value: Object = _unwrap_return_value(evaluated)
+            break
+
+        tail_call = cast(TailCall, evaluated)
+        function: Object = tail_call.function
+        args: List[Object] = tail_call.arguments
+
+        if not tail_call.checked:
+            error = _check_arguments(function, args)
+            if error is not None:
+                value = error
+                break
+
+        if type(function) != Function or cast(Function, function).code is not None:
+            value = _apply_function(function, args)
+            if not tail_call.checked:
+                value = _check_output(function, value)
+            break
+
+        fn = cast(Function, function)
+        env = _extend_function_enviroment(fn, args)
+        if not tail_call.checked and \
+                (len(pending) == 0 or str(pending[-1].type_output) != str(fn.type_output)):
+            pending.append(fn)
+
+    for function in reversed(pending):
+        value = _check_output(function, value)
+
+    return value
+
+
+def _evaluate_tail_block(block: ast.Block,
+                         env: Environment,
+                         value_position: bool = True) -> Union[Object, TailCall, None]:
+    result: Union[Object, TailCall, None] = None
+    last: int = len(block.statements) - 1
+
+    for index, statement in enumerate(block.statements):
+        if type(statement) == ast.ReturnStatement and \
+                type(statement.return_value) in _TAIL_EXPRESSIONS:
+            assert statement.return_value is not None
+            result = _evaluate_tail_expression(statement.return_value, env, True)
+            if type(result) == TailCall:
+                return result
+
+            assert result is not None
+            return Return(cast(Object, result))
+
+        elif type(statement) == ast.ExpressionStatement and \
+                type(statement.expression) in _TAIL_EXPRESSIONS:
+            assert statement.expression is not None
+            result = _evaluate_tail_expression(statement.expression,
+                                               env,
+                                               value_position and index == last)
+            if type(result) == TailCall:
+                return result
+
+        else:
+            result = evaluate(statement, env)
+
+        if result is not None and (type(result) == Return or type(result) == Error):
+            return result
+
+    return result
+
+
+def _evaluate_tail_expression(expression: ast.Expression,
+                              env: Environment,
+                              value_position: bool) -> Union[Object, TailCall, None]:
+    if type(expression) == ast.Call:
+        if not value_position:
+            return evaluate(expression, env)
+
+        return _evaluate_tail_call(cast(ast.Call, expression), env)
+
+    if_expression = cast(ast.If, expression)
+
+    assert if_expression.condition is not None
+    condition = evaluate(if_expression.condition, env)
+
+    assert condition is not None
+    if _is_truthy(condition):
+        assert if_expression.consequence is not None
+        return _evaluate_tail_block(if_expression.consequence, env, value_position)
+    elif if_expression.alternative is not None:
+        return _evaluate_tail_block(if_expression.alternative, env, value_position)
+
+    return NULL
+
+
+def _evaluate_tail_call(node: ast.Call, env: Environment) -> Union[Object, TailCall]:
+    function = evaluate(node.function, env)
+    assert function is not None
+    if function.type() is ObjectType.ERROR:
+        return function
+
+    assert node.arguments is not None
+    args = _evaluate_expression(node.arguments, env)
+
+    return TailCall(function, args, node.signature is not None and type(function) == Function
+                    and cast(Function, function).body is node.signature.body)
+
+
 def _extend_function_enviroment(fn: Function, args: List[Object]) -> Environment:
     env: Environment = Environment(outer=fn.env)
     for idx, param in enumerate(fn.parameters):
-        env[param.value] = args[idx]
+        env[param.symbol] = args[idx]
 
     return env
 
 
+def _capture_environment(function: ast.Function, env: Environment) -> Environment:
+    outer: Environment = env
+    for _ in range(function.global_depth):
+        outer = outer._outer
+
+    if not function.free_symbols:
+        return outer
+
+    captured: Environment = Environment(outer=outer)
+    for symbol in function.free_symbols:
+        captured[symbol] = env[symbol]
+
+    return captured
+
+
 def _unwrap_return_value(obj: Object) -> Object:
     if type(obj) == Return:
         obj = cast(Return, obj)
@@ -416,10 +642,22 @@ def _evaluate_expression(expressions: List[ast.Expression], env: Environment) ->
 
 
 def _evaluate_identifier(node: ast.Identifier, env: Environment) -> Object:
+    depth: Optional[int] = node.depth
+
+    if depth is not None:
+        while depth > 0:
+            env = env._outer
+            depth -= 1
+
+        if node.symbol in env._store:
+            return env._store[node.symbol]
+        elif env._outer is None:
+            return BUILTIN_SYMBOLS.get(node.symbol, _new_error(_UNKNOW_IDENTIFIER, [node.value]))
+
     try:
-        return env[node.value]
+        return env[node.symbol]
     except KeyError:
-        return BUILTIN.get(node.value, _new_error(_UNKNOW_IDENTIFIER, [node.value]))
+        return BUILTIN_SYMBOLS.get(node.symbol, _new_error(_UNKNOW_IDENTIFIER, [node.value]))
 
 
 def _evaluate_if_expression(if_expression: ast.If, env: Environment) -> Optional[Object]:
@@ -529,14 +767,29 @@ def _evaluate_list_infix_expression(operator: str,
                 return _new_error(_INCOMPATIBLE_LIST_OPTERATION, [operator, left_list[0].type().name, right_list[0].type().name])
         return ValueList(values=left_list + right_list)
     elif operator == '==':
-        return _to_boolean_object(left_list == right_list)
+        return _to_boolean_object(_equal_values(left, right))
     elif operator == '!=':
-        return _to_boolean_object(left_list != right_list)
+        return _to_boolean_object(not _equal_values(left, right))
     else:
         return _new_error(_UNKNOW_INFIX_OPERATOR, [operator,
                                                    right.type().name])
 
 
+def _equal_values(left: Object, right: Object) -> bool:
+    if type(left) != type(right):
+        return False
+    elif type(left) == ValueList or type(left) == ValueTuple:
+        left_values: List[Object] = cast(ValueList, left).values
+        right_values: List[Object] = cast(ValueList, right).values
+
+        return len(left_values) == len(right_values) and \
+            all(_equal_values(l1, l2) for l1, l2 in zip(left_values, right_values))
+    elif type(left) in (Integer, Float, String, Boolean):
+        return bool(cast(Integer, left).value == cast(Integer, right).value)
+
+    return left is right
+
+
 def _evaluate_tuple_infix_expression(operator: str,
                                      left: Object,
                                      right: Object
@@ -651,11 +904,11 @@ def _evaluate_interger_infix_expression(operator: str,
     right_value: int = cast(Integer, right).value
 
     if operator == '+':
-        return Integer(left_value + right_value)
+        return new_integer(left_value + right_value)
     elif operator == '-':
-        return Integer(left_value - right_value)
+        return new_integer(left_value - right_value)
     elif operator == '*':
-        return Integer(left_value * right_value)
+        return new_integer(left_value * right_value)
     elif operator == '**':
         return Integer(left_value ** right_value)
     elif operator == '/':
@@ -663,11 +916,11 @@ def _evaluate_interger_infix_expression(operator: str,
             return _new_error(_DIVISION_BY_ZERO, [''])
 
         if left_value % right_value == 0:
-            return Integer(left_value // right_value)
+            return new_integer(left_value // right_value)
         else:
             return _evaluate_float_infix_expression(operator, left, right)
     elif operator == '%':
-        return Integer(left_value % right_value)
+        return new_integer(left_value % right_value)
     elif operator == '<':
         return _to_boolean_object(left_value < right_value)
     elif operator == '>':
@@ -703,11 +956,105 @@ def _evaluate_string_infix_expression(operator: str,
                                                    right.type().name])
 
 
+def _specialize_infix(node: ast.Infix, left: Object, right: Object) -> Object:
+    left_type: Type = type(left)
+    right_type: Type = type(right)
+
+    handler: Optional[InfixHandler] = _INFIX_HANDLERS.get((node.operator, left_type, right_type))
+    if handler is None:
+        if left_type is right_type and left_type in _TYPED_INFIX_EXPRESSIONS:
+            handler = partial(_TYPED_INFIX_EXPRESSIONS[left_type], node.operator)
+        else:
+            handler = partial(_evaluate_infix_expression, node.operator)
+
+    cache = node.cache
+    if cache is None:
+        node.cache = InfixCache(left_type, right_type, handler)
+    else:
+        cache.left = left_type
+        cache.right = right_type
+        cache.handler = handler
+        cache.misses += 1
+
+    return handler(left, right)
+
+
+def _specialize_call(node: ast.Call, function: Object, args: List[Object]) -> Object:
+    error = _check_arguments(function, args)
+    if error is not None:
+        return error
+
+    target: Any = None
+    if type(function) == Builtin:
+        target = function
+    elif type(function) == Function:
+        target = cast(Function, function).body
+
+    if target is not None:
+        argument_types: Tuple[Type, ...] = tuple(type(arg) for arg in args)
+
+        cache = node.cache
+        if cache is None:
+            node.cache = CallCache(target, argument_types)
+        else:
+            cache.target = target
+            cache.argument_types = argument_types
+            cache.misses += 1
+
+    return _check_output(function, _apply_function(function, args))
+
+
+def inline_cache_statistics(node: ast.ASTNode) -> Tuple[int, int]:
+    hits: int = 0
+    misses: int = 0
+
+    for child in ast.iter_nodes(node):
+        if type(child) in _CACHED_NODES and child.cache is not None:
+            hits += child.cache.hits
+            misses += child.cache.misses
+
+    return hits, misses
+
+
+def _arithmetic_handler(new_value: Callable[[Any], Object],
+                        operation: Callable[[Any, Any], Any]) -> InfixHandler:
+    return lambda left, right: new_value(operation(left.value, right.value))
+
+
+def _comparison_handler(operation: Callable[[Any, Any], bool]) -> InfixHandler:
+    return lambda left, right: TRUE if operation(left.value, right.value) else FALSE
+
+
+_CACHED_NODES = (ast.Infix, ast.Call)
+
+_TYPED_INFIX_EXPRESSIONS: Dict[Type, Callable[[str, Object, Object], Object]] = {
+    Integer: _evaluate_interger_infix_expression,
+    Float: _evaluate_float_infix_expression,
+    String: _evaluate_string_infix_expression,
+    Boolean: _evaluate_bool_infix_expression,
+    ValueList: _evaluate_list_infix_expression,
+    ValueTuple: _evaluate_tuple_infix_expression,
+}
+
+_INFIX_HANDLERS: Dict[Tuple[str, Type, Type], InfixHandler] = {
+    **{(operator, value_type, value_type): _arithmetic_handler(new_value, operation)
+       for operator, operation in (('+', add), ('-', sub), ('*', mul), ('%', mod))
+       for value_type, new_value in ((Integer, new_integer), (Float, Float))},
+    ('**', Integer, Integer): _arithmetic_handler(Integer, pow),
+    ('**', Float, Float): _arithmetic_handler(Float, pow),
+    **{(operator, value_type, value_type): _comparison_handler(operation)
+       for operator, operation in (('<', lt), ('>', gt), ('<=', le), ('>=', ge), ('==', eq), ('!=', ne))
+       for value_type in (Integer, Float, String)
+       if value_type is not String or operator in ('==', '!=')},
+    ('+', String, String): _arithmetic_handler(String, add),
+}
+
+
 def _evaluate_minus_operator_expression(right: Object) -> Object:
     if type(right) == Integer:
         right = cast(Integer, right)
 
-        return Integer(-right.value)
+        return new_integer(-right.value)
     elif type(right) == Float:
         right = cast(Float, right)
 
@@ -724,9 +1071,13 @@ def _evaluate_prefix_expression(operator: str, right: Object) -> Object:
 
 
 def _evaluate_program(program: ast.Program, env: Environment) -> Optional[Object]:
+    return evaluate_statements(program.statements, env)
+
+
+def evaluate_statements(statements: Iterable[ast.Statement], env: Environment) -> Optional[Object]:
     result: Optional[Object] = None
 
-    for statement in program.statements:
+    for statement in statements:
         result = evaluate(statement, env)
 
         if type(result) == Return:
@@ -747,4 +1098,4 @@ def _to_boolean_object(value: bool) -> Boolean:
 
 
 def _to_string_object(value: str) -> String:
-    return String(value[1:-1])  # Extract the quotes of the string
+    return String(value)
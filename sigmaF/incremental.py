@@ -0,0 +1,176 @@
+from hashlib import blake2b
+from re import (
+    compile,
+    DOTALL,
+    Pattern
+)
+from typing import (
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple
+)
+
+from sigmaF.ast import (
+    Identifier,
+    iter_nodes,
+    LetStatement,
+    Program,
+    Statement
+)
+from sigmaF.lexer import (
+    TokenBuffer,
+    TokenBufferLexer
+)
+from sigmaF.parser import (
+    Parser,
+    TableParser
+)
+
+_SEGMENT_PATTERN: Pattern = compile(
+    r'"[^"]*"|--[^\n]*|/\*.*?\*/|([(\[{])|([)\]}])|(\blet\b)',
+    DOTALL
+)
+
+_OPEN_GROUP = 1
+_CLOSE_GROUP = 2
+_LET_GROUP = 3
+
+
+class Definition(NamedTuple):
+    span: Tuple[int, int]
+    digest: str
+    tokens: TokenBuffer
+    statements: List[Statement]
+    errors: List[str]
+
+
+class ModuleDiff(NamedTuple):
+    added: List[str]
+    removed: List[str]
+    changed: List[str]
+    statements: List[Statement]
+
+
+def split_definitions(source: str) -> List[Tuple[int, int]]:
+    starts: List[int] = [0]
+    depth: int = 0
+
+    for segment_match in _SEGMENT_PATTERN.finditer(source):
+        group: Optional[int] = segment_match.lastindex
+
+        if group == _OPEN_GROUP:
+            depth += 1
+        elif group == _CLOSE_GROUP:
+            depth = max(depth - 1, 0)
+        elif group == _LET_GROUP and depth == 0 and segment_match.start() > 0:
+            starts.append(segment_match.start())
+
+    ends: List[int] = starts[1:] + [len(source)]
+
+    return [(start, end) for start, end in zip(starts, ends) if source[start:end].strip()]
+
+
+class IncrementalFrontEnd:
+
+    def __init__(self) -> None:
+        self._definitions: List[Definition] = []
+        self._cache: Dict[str, Definition] = {}
+        self._bindings: Dict[str, str] = {}
+
+    @property
+    def definitions(self) -> List[Definition]:
+        return self._definitions
+
+    @property
+    def errors(self) -> List[str]:
+        return [error for definition in self._definitions for error in definition.errors]
+
+    @property
+    def program(self) -> Program:
+        return Program(statements=[statement
+                                   for definition in self._definitions
+                                   for statement in definition.statements])
+
+    def update(self, source: str) -> ModuleDiff:
+        definitions: List[Definition] = []
+        cache: Dict[str, Definition] = {}
+        parsed: Set[str] = set()
+
+        for span in split_definitions(source):
+            text: str = source[span[0]:span[1]]
+            digest: str = blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+
+            definition: Optional[Definition] = cache.get(digest) or self._cache.get(digest)
+            if definition is None or len(definition.errors) > 0:
+                definition = self._parse_definition(source, span, digest)
+                parsed.add(digest)
+            else:
+                definition = definition._replace(span=span)
+
+            definitions.append(definition)
+            cache[digest] = definition
+
+        bindings: Dict[str, str] = self._collect_bindings(definitions)
+
+        added: List[str] = [name for name in bindings if name not in self._bindings]
+        removed: List[str] = [name for name in self._bindings if name not in bindings]
+        changed: List[str] = [name for name, digest in bindings.items()
+                              if name in self._bindings and self._bindings[name] != digest]
+
+        diff = ModuleDiff(
+            added=added,
+            removed=removed,
+            changed=changed,
+            statements=self._stale_statements(definitions, parsed, set(added + removed + changed))
+        )
+
+        self._definitions = definitions
+        self._cache = cache
+        self._bindings = bindings
+
+        return diff
+
+    def _stale_statements(self,
+                          definitions: List[Definition],
+                          parsed: Set[str],
+                          stale: Set[str]) -> List[Statement]:
+        statements: List[Statement] = []
+
+        for definition in definitions:
+            for statement in definition.statements:
+                if definition.digest not in parsed and not _references(statement, stale):
+                    continue
+
+                statements.append(statement)
+                if isinstance(statement, LetStatement) and statement.name is not None:
+                    stale.add(statement.name.value)
+
+        return statements
+
+    def _parse_definition(self, source: str, span: Tuple[int, int], digest: str) -> Definition:
+        lexer: TokenBufferLexer = TokenBufferLexer(source, start=span[0], end=span[1])
+        parser: Parser = TableParser(lexer)
+
+        program: Program = parser.parse_program()
+
+        return Definition(span, digest, lexer.tokens, program.statements, parser.errors)
+
+    def _collect_bindings(self, definitions: List[Definition]) -> Dict[str, str]:
+        bindings: Dict[str, str] = {}
+
+        for definition in definitions:
+            for statement in definition.statements:
+                if isinstance(statement, LetStatement) and statement.name is not None:
+                    bindings[statement.name.value] = definition.digest
+
+        return bindings
+
+
+def _references(statement: Statement, names: Set[str]) -> bool:
+    if len(names) == 0:
+        return False
+
+    return any(type(node) is Identifier and node.value in names for node in iter_nodes(statement))
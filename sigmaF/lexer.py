@@ -1,23 +1,118 @@
-from re import match
+from array import array
+from bisect import bisect_right
+from codecs import getincrementaldecoder
+from re import (
+    compile,
+    DOTALL,
+    match,
+    Match,
+    Pattern
+)
+from typing import (
+    Any,
+    Dict,
+    Optional,
+    Tuple,
+    Type,
+    Union
+)
+
+from sigmaF.symbol import SYMBOLS
 from sigmaF.token import (
     lookup_token_type,
     Token,
     TokenType
 )
 
+_COMMENT_GROUP = 1
+_FLOAT_GROUP = 2
+_INT_GROUP = 3
+_IDENT_GROUP = 4
+_STRING_GROUP = 5
+_TWO_CHARACTER_GROUP = 6
+_ONE_CHARACTER_GROUP = 7
+_EOF_GROUP = 8
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+_TOKEN_PATTERN: Pattern = compile(
+    r'\s*(?:'
+    r'(--[^\n]*|/\*.*?\*/)'
+    r'|(\d+\.\d*)'
+    r'|(\d+)'
+    r'|([a-zA-Z_][a-zA-Z_\d]*)'
+    r'|("[^"]*")'
+    r'|(==|=>|!=|<=|>=|->|::|\|\||&&|\*\*)'
+    r'|(.)'
+    r'|(\Z))',
+    DOTALL
+)
+
+_TWO_CHARACTER_TOKENS: Dict[str, TokenType] = {
+    '==': TokenType.EQ,
+    '=>': TokenType.RETURN,
+    '!=': TokenType.NOT_EQ,
+    '<=': TokenType.L_OR_EQ_T,
+    '>=': TokenType.G_OR_EQ_T,
+    '->': TokenType.OUTPUTFUNTION,
+    '::': TokenType.TYPEASSIGN,
+    '||': TokenType.OR,
+    '&&': TokenType.AND,
+    '**': TokenType.EXPONENTIATION,
+}
+
+_TOKEN_TYPES: Tuple[Optional[TokenType], ...] = (None,) + tuple(TokenType)
+
+_ONE_CHARACTER_TOKENS: Dict[str, TokenType] = {
+    '=': TokenType.ASSIGN,
+    '+': TokenType.PLUS,
+    '-': TokenType.MINUS,
+    '*': TokenType.MULTIPLICATION,
+    '/': TokenType.DIVISION,
+    '%': TokenType.MODULUS,
+    '<': TokenType.LT,
+    '>': TokenType.GT,
+    '(': TokenType.LPAREN,
+    ')': TokenType.RPAREN,
+    '{': TokenType.LBRACE,
+    '}': TokenType.RBRACE,
+    '[': TokenType.LBRAKET,
+    ']': TokenType.RBRAKET,
+    ',': TokenType.COMMA,
+    ';': TokenType.SEMICOLON,
+}
+
+
+def decode_string(raw: str) -> str:
+    if '\\' not in raw:
+        return raw
+
+    return raw.replace('\\n', '\n').replace('\\t', '\t')
+
 
 class Lexer:
-    def __init__(self, source: str) -> None:
+    def __init__(self, source: str, keep_comments: bool = False) -> None:
         self._source: str = source
+        self._keep_comments: bool = keep_comments
         self._character: str = ''
         self._read_position: int = 0
         self._position: int = 0
 
         self._read_character()
 
+    def current_position(self, lookbehind: int = 0) -> Optional[Tuple[int, int]]:
+        return None
+
     def next_token(self) -> Token:
         self._skip_whitespace()
 
+        while self._is_comment_start():
+            comment = self._read_comment()
+            if self._keep_comments:
+                return Token(TokenType.COMMENT, comment)
+
+            self._skip_whitespace()
+
         if match(r'^=$', self._character):
             if self._peek_character() == '=':
                 token = self._make_two_character_token(TokenType.EQ)
@@ -26,11 +121,7 @@ class Lexer:
             else:
                 token = Token(TokenType.ASSIGN, self._character)
         elif match(r'^\"$', self._character):
-            if self._peek_ahead_character('\"'):
-                token = self._make_a_lot_of_character_token(
-                    self._character, TokenType.STRING)
-            else:
-                token = Token(TokenType.ILLEGAL, "\"")
+            token = self._read_string()
         elif match(r'^\+$', self._character):
             token = Token(TokenType.PLUS, self._character)
         elif match(r'^$', self._character):
@@ -117,6 +208,26 @@ class Lexer:
 
         return token
 
+    def _is_comment_start(self) -> bool:
+        if self._character == '-':
+            return self._peek_character() == '-'
+        elif self._character == '/' and self._peek_character() == '*':
+            return self._source.find('*/', self._position + 2) != -1
+
+        return False
+
+    def _read_comment(self) -> str:
+        initial_position = self._position
+
+        if self._character == '-':
+            while self._character != '\n' and self._character != '':
+                self._read_character()
+        else:
+            self._read_position = self._source.find('*/', self._position + 2) + 2
+            self._read_character()
+
+        return self._source[initial_position:self._position]
+
     def _is_letter(self, character: str) -> bool:
         return bool(match(r'^[a-zA-Z_]$', character))
 
@@ -130,36 +241,23 @@ class Lexer:
 
         return Token(token_type, f'{prefix}{suffix}')
 
-    def _make_a_lot_of_character_token(self, character: str, token_type: TokenType) -> Token:
-        initial_position = self._read_position
+    def _read_string(self) -> Token:
+        closing_position = self._source.find('"', self._read_position)
+        if closing_position == -1:
+            return Token(TokenType.ILLEGAL, self._character)
 
-        self._read_character()
+        literal = decode_string(self._source[self._read_position:closing_position])
 
-        while (self._character != character):
-            self._read_character()
+        self._read_position = closing_position
+        self._read_character()
 
-        return Token(token_type, self._source[initial_position - 1:self._read_position])
+        return Token(TokenType.STRING, literal)
 
     def _peek_character(self) -> str:
         if self._read_position >= len(self._source):
             return ''
         return self._source[self._read_position]
 
-    def _peek_ahead_character(self, character: str) -> bool:
-        initial_position = self._read_position
-
-        self._read_character()
-
-        while self._character != character and self._read_position <= len(self._source):
-            self._read_character()
-
-        if (self._character == character and initial_position != self._read_position):
-            self._read_position = initial_position
-            return True
-        else:
-            self._read_position = initial_position
-            return False
-
     def _read_identifier(self) -> str:
         initial_position = self._position
 
@@ -188,3 +286,222 @@ class Lexer:
     def _skip_whitespace(self) -> None:
         while match(r'^\s$', self._character):
             self._read_character()
+
+
+def _token_type(group: int, literal: str) -> TokenType:
+    if group == _COMMENT_GROUP:
+        return TokenType.COMMENT
+    elif group == _IDENT_GROUP:
+        return SYMBOLS.token_type(SYMBOLS.intern(literal))
+    elif group == _INT_GROUP:
+        return TokenType.INT
+    elif group == _FLOAT_GROUP:
+        return TokenType.FLOAT
+    elif group == _STRING_GROUP:
+        return TokenType.STRING
+    elif group == _TWO_CHARACTER_GROUP:
+        return _TWO_CHARACTER_TOKENS[literal]
+    elif group == _ONE_CHARACTER_GROUP:
+        return _ONE_CHARACTER_TOKENS.get(literal, TokenType.ILLEGAL)
+    else:
+        return TokenType.EOF
+
+
+class RegexLexer(Lexer):
+
+    def __init__(self, source: str, keep_comments: bool = False) -> None:
+        self._source: str = source
+        self._keep_comments: bool = keep_comments
+        self._position: int = 0
+
+    def next_token(self) -> Token:
+        while True:
+            token_match = _TOKEN_PATTERN.match(self._source, self._position)
+            assert token_match is not None
+
+            self._position = token_match.end()
+
+            if self._keep_comments or token_match.lastindex != _COMMENT_GROUP:
+                break
+
+        return self._make_token(token_match)
+
+    def _make_token(self, token_match: Match) -> Token:
+        group: int = token_match.lastindex
+        literal: str = token_match.group(group)
+
+        if group == _IDENT_GROUP:
+            symbol: int = SYMBOLS.intern(literal)
+            return Token(SYMBOLS.token_type(symbol), SYMBOLS.name(symbol))
+        elif group == _STRING_GROUP:
+            return Token(TokenType.STRING, decode_string(literal[1:-1]))
+
+        return Token(_token_type(group, literal), literal)
+
+
+class StreamLexer(RegexLexer):
+
+    def __init__(self,
+                 stream: Any,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 encoding: str = 'utf-8',
+                 keep_comments: bool = False
+                 ) -> None:
+        super().__init__('', keep_comments)
+        self._stream = stream
+        self._chunk_size = chunk_size
+        self._decoder = getincrementaldecoder(encoding)()
+        self._exhausted: bool = False
+
+    def next_token(self) -> Token:
+        while True:
+            token_match = _TOKEN_PATTERN.match(self._source, self._position)
+            assert token_match is not None
+
+            if not self._exhausted and self._may_continue(token_match):
+                self._read_chunk()
+                continue
+
+            self._position = token_match.end()
+
+            if self._keep_comments or token_match.lastindex != _COMMENT_GROUP:
+                break
+
+        return self._make_token(token_match)
+
+    def _may_continue(self, token_match: Match) -> bool:
+        end: int = token_match.end()
+
+        if end == len(self._source):
+            return True
+        elif token_match.lastindex != _ONE_CHARACTER_GROUP:
+            return False
+
+        character: str = token_match.group(_ONE_CHARACTER_GROUP)
+
+        return character == '"' or (character == '/' and self._source[end] == '*')
+
+    def _read_chunk(self) -> None:
+        chunk: Union[str, bytes] = self._stream.read(self._chunk_size)
+
+        if isinstance(chunk, bytes):
+            text = self._decoder.decode(chunk, final=not chunk)
+        else:
+            text = chunk
+
+        if not chunk:
+            self._exhausted = True
+
+        self._source = self._source[self._position:] + text
+        self._position = 0
+
+
+class TokenBuffer:
+
+    def __init__(self,
+                 source: str,
+                 keep_comments: bool = False,
+                 start: int = 0,
+                 end: Optional[int] = None) -> None:
+        self._source = source
+        self._keep_comments = keep_comments
+        self._types: array = array('B')
+        self._starts: array = array('I')
+        self._ends: array = array('I')
+        self._line_starts: Optional[array] = None
+
+        self._scan(start, len(source) if end is None else end)
+
+    def __len__(self) -> int:
+        return len(self._types)
+
+    def __getitem__(self, index: int) -> Token:
+        return Token(self.token_type(index), self.literal(index))
+
+    def token_type(self, index: int) -> TokenType:
+        token_type = _TOKEN_TYPES[self._types[index]]
+        assert token_type is not None
+
+        return token_type
+
+    def literal(self, index: int) -> str:
+        if self._types[index] == TokenType.STRING.value:
+            return decode_string(self._source[self._starts[index] + 1:self._ends[index] - 1])
+
+        return self._source[self._starts[index]:self._ends[index]]
+
+    def span(self, index: int) -> Tuple[int, int]:
+        return self._starts[index], self._ends[index]
+
+    def position(self, index: int) -> Tuple[int, int]:
+        if self._line_starts is None:
+            self._line_starts = self._index_lines()
+
+        offset: int = self._starts[index]
+        line: int = bisect_right(self._line_starts, offset)
+
+        return line, offset - self._line_starts[line - 1] + 1
+
+    def _index_lines(self) -> array:
+        line_starts: array = array('I', [0])
+
+        offset: int = self._source.find('\n')
+        while offset != -1:
+            line_starts.append(offset + 1)
+            offset = self._source.find('\n', offset + 1)
+
+        return line_starts
+
+    def _scan(self, position: int, limit: int) -> None:
+        source: str = self._source
+
+        while True:
+            token_match = _TOKEN_PATTERN.match(source, position, limit)
+            assert token_match is not None
+
+            group: int = token_match.lastindex
+            start, end = token_match.span(group)
+            position = token_match.end()
+
+            if group == _COMMENT_GROUP and not self._keep_comments:
+                continue
+
+            token_type = _token_type(group, source[start:end])
+
+            self._types.append(token_type.value)
+            self._starts.append(start)
+            self._ends.append(end)
+
+            if token_type is TokenType.EOF:
+                return
+
+
+class TokenBufferLexer(Lexer):
+
+    def __init__(self,
+                 source: str,
+                 keep_comments: bool = False,
+                 start: int = 0,
+                 end: Optional[int] = None) -> None:
+        self.tokens: TokenBuffer = TokenBuffer(source, keep_comments, start, end)
+        self._index: int = -1
+
+    def next_token(self) -> Token:
+        if self._index < len(self.tokens) - 1:
+            self._index += 1
+
+        return self.tokens[self._index]
+
+    def current_position(self, lookbehind: int = 0) -> Optional[Tuple[int, int]]:
+        return self.tokens.position(max(self._index - lookbehind, 0))
+
+
+LEXERS: Dict[str, Type[Lexer]] = {
+    'character': Lexer,
+    'regex': RegexLexer,
+    'buffer': TokenBufferLexer,
+}
+
+
+def new_lexer(source: str, engine: str = 'regex', keep_comments: bool = False) -> Lexer:
+    return LEXERS[engine](source, keep_comments)
@@ -8,6 +8,7 @@ from enum import (
 )
 from typing import (
     Any,
+    Callable,
     Dict,
     List,
     Optional
@@ -156,13 +157,15 @@ class Function(Object):
                  type_parameters: List[Identifier],
                  type_output: Optional[Identifier],
                  body: Block,
-                 env: Environment
+                 env: Environment,
+                 code: Optional[Callable[[Environment], Optional[Object]]] = None
                  ) -> None:
         self.parameters = parameters
         self.type_parameters = type_parameters
         self.type_output = type_output
         self.body = body
         self.env = env
+        self.code = code
 
     def type(self) -> ObjectType:
         return ObjectType.FUNCTION
@@ -225,4 +228,24 @@ class ValueTuple(Object):
 
         return ('(' + ', '.join(values_list) + ')')
 
+
+SMALL_INTEGER_MIN = -5
+SMALL_INTEGER_MAX = 1024
+
+TRUE = Boolean(True)
+FALSE = Boolean(False)
+NULL = Null()
+EMPTY_LIST = ValueList([])
+
+_SMALL_INTEGERS: List[Integer] = [
+    Integer(value) for value in range(SMALL_INTEGER_MIN, SMALL_INTEGER_MAX + 1)
+]
+
+
+def new_integer(value: int) -> Integer:
+    if type(value) is int and SMALL_INTEGER_MIN <= value <= SMALL_INTEGER_MAX:
+        return _SMALL_INTEGERS[value - SMALL_INTEGER_MIN]
+
+    return Integer(value)
+
 # TODO To create the nullable class, this will be able to evaluate for example 'int?' or 'bool?'
@@ -0,0 +1,114 @@
+from typing import (
+    List,
+    Optional,
+    Tuple,
+    Type
+)
+
+import sigmaF.ast as ast
+from sigmaF.evaluator import (
+    evaluate,
+    _evaluate_infix_expression,
+    _evaluate_prefix_expression
+)
+from sigmaF.object import (
+    Boolean,
+    Environment,
+    Float,
+    Integer,
+    Object,
+    String
+)
+from sigmaF.token import (
+    Token,
+    TokenType
+)
+
+_LITERAL_NODES: Tuple[Type, ...] = (ast.Integer, ast.Float, ast.String, ast.Boolean)
+
+_MAX_FOLDED_EXPONENT = 256
+
+_ENVIRONMENT: Environment = Environment()
+
+
+def fold_constants(root: ast.ASTNode) -> int:
+    folded: int = 0
+    stack: List[Tuple[ast.ASTNode, bool]] = [(root, False)]
+
+    while stack:
+        node, visited = stack.pop()
+        fields: Tuple[str, ...] = ast.CHILD_FIELDS.get(type(node), ())
+
+        if not visited:
+            stack.append((node, True))
+            for field in fields:
+                child = getattr(node, field)
+                if type(child) is list:
+                    stack.extend((item, False) for item in child)
+                elif child is not None:
+                    stack.append((child, False))
+            continue
+
+        for field in fields:
+            child = getattr(node, field)
+            if type(child) is list:
+                for index, item in enumerate(child):
+                    literal = _fold(item)
+                    if literal is not None:
+                        child[index] = literal
+                        folded += 1
+            elif child is not None:
+                literal = _fold(child)
+                if literal is not None:
+                    setattr(node, field, literal)
+                    folded += 1
+
+    return folded
+
+
+def _fold(node: ast.ASTNode) -> Optional[ast.Expression]:
+    node_type: Type = type(node)
+
+    try:
+        if node_type is ast.Infix:
+            if type(node.left) not in _LITERAL_NODES \
+                    or type(node.right) not in _LITERAL_NODES:
+                return None
+            if node.operator == '**' and type(node.right) is ast.Integer \
+                    and abs(node.right.value) > _MAX_FOLDED_EXPONENT:
+                return None
+
+            return _to_literal(_evaluate_infix_expression(
+                node.operator,
+                evaluate(node.left, _ENVIRONMENT),
+                evaluate(node.right, _ENVIRONMENT)))
+
+        elif node_type is ast.Prefix:
+            if type(node.right) not in _LITERAL_NODES:
+                return None
+
+            return _to_literal(_evaluate_prefix_expression(
+                node.operator,
+                evaluate(node.right, _ENVIRONMENT)))
+    except ArithmeticError:
+        return None
+
+    return None
+
+
+def _to_literal(value: Object) -> Optional[ast.Expression]:
+    value_type: Type = type(value)
+
+    if value_type is Integer and type(value.value) is int:
+        return ast.Integer(Token(TokenType.INT, str(value.value)), value.value)
+    elif value_type is Float and type(value.value) is float:
+        return ast.Float(Token(TokenType.FLOAT, str(value.value)), value.value)
+    elif value_type is String:
+        return ast.String(Token(TokenType.STRING, value.value), value.value)
+    elif value_type is Boolean:
+        if value.value:
+            return ast.Boolean(Token(TokenType.TRUE, 'true'), True)
+
+        return ast.Boolean(Token(TokenType.FALSE, 'false'), False)
+
+    return None
@@ -1,11 +1,15 @@
 from enum import IntEnum
 
 from typing import (
+    Any,
     Callable,
     Dict,
+    Generator,
+    Iterator,
     List,
     Tuple,
-    Optional
+    Optional,
+    Type
 )
 
 from sigmaF.ast import (
@@ -40,6 +44,7 @@ PrefixParseFn = Callable[[], Optional[Expression]]
 PrefixParseFns = Dict[TokenType, PrefixParseFn]
 InfixParseFn = Callable[[Expression], Optional[Expression]]
 IndixParseFns = Dict[TokenType, InfixParseFn]
+ParseSteps = Generator[Any, Any, Any]
 
 
 class Precedence(IntEnum):
@@ -73,6 +78,26 @@ PRECEDENCE: Dict[TokenType, Precedence] = {
     TokenType.OR: Precedence.AND,
 }
 
+PRECEDENCE_TABLE: List[Precedence] = [Precedence.LOWEST] * (len(TokenType) + 1)
+for _token_type, _precedence in PRECEDENCE.items():
+    PRECEDENCE_TABLE[_token_type.value] = _precedence
+
+_SEMICOLON_KIND: int = TokenType.SEMICOLON.value
+
+_LIST_ITEM_TYPES: List[TokenType] = [
+    TokenType.INT,
+    TokenType.FLOAT,
+    TokenType.STRING,
+    TokenType.TRUE,
+    TokenType.FALSE,
+    TokenType.IDENT,
+    TokenType.FUNCTION,
+    TokenType.LBRAKET,
+    TokenType.LPAREN,
+    TokenType.RPAREN,
+    TokenType.MINUS,
+]
+
 
 class Parser:
 
@@ -94,18 +119,17 @@ class Parser:
         return self._errors
 
     def parse_program(self) -> Program:
-        program: Program = Program(statements=[])
+        return Program(statements=list(self.iter_statements()))
 
+    def iter_statements(self) -> Iterator[Statement]:
         assert self._current_token is not None
         while self._current_token.token_type != TokenType.EOF:
             statement = self._parse_statement()
             if statement is not None:
-                program.statements.append(statement)
+                yield statement
 
             self._advance_tokens()
 
-        return program
-
     def _advance_tokens(self) -> None:
         self._old_token = self._current_token
         self._current_token = self._peek_token
@@ -126,7 +150,14 @@ class Parser:
         error = f'The next token was expected to be of type {token_type} ' + \
             f', but {self._peek_token.token_type} was obtained'
 
-        self._errors.append(error)
+        self._append_error(error, 0)
+
+    def _append_error(self, message: str, lookbehind: int = 1) -> None:
+        position: Optional[Tuple[int, int]] = self._lexer.current_position(lookbehind)
+        if position is not None:
+            message = f'Line {position[0]}, column {position[1]}: {message}'
+
+        self._errors.append(message)
 
     def _parse_expression(self, precedence: Precedence) -> Optional[Expression]:
         assert self._current_token is not None
@@ -134,7 +165,7 @@ class Parser:
             prefix_parse_fn = self._prefix_parse_fns[self._current_token.token_type]
         except KeyError:
             message = f'It was not found nothing funtion for parse {self._current_token.literal}'
-            self._errors.append(message)
+            self._append_error(message)
 
             return None
 
@@ -170,7 +201,7 @@ class Parser:
         except ValueError:
             message = f'It was not possible to parse {self._current_token.literal} ' + \
                 'like Integer.'
-            self._errors.append(message)
+            self._append_error(message)
             return None
         return integer
 
@@ -183,7 +214,7 @@ class Parser:
         except ValueError:
             message = f'It was not possible to parse {self._current_token.literal} ' + \
                 'like Floating.'
-            self._errors.append(message)
+            self._append_error(message)
             return None
         return floating
 
@@ -196,7 +227,7 @@ class Parser:
         except ValueError:
             message = f'It was not possible to parse {self._current_token.literal} ' + \
                 'like String.'
-            self._errors.append(message)
+            self._append_error(message)
             return None
         return string
 
@@ -484,19 +515,7 @@ class Parser:
             return list_values
 
         values = []
-        allow_types = [TokenType.INT,
-                       TokenType.FLOAT,
-                       TokenType.STRING,
-                       TokenType.TRUE,
-                       TokenType.FALSE,
-                       TokenType.IDENT,
-                       TokenType.FUNCTION,
-                       TokenType.LBRAKET,
-                       TokenType.LPAREN,
-                       TokenType.RPAREN,
-                       TokenType.MINUS]
-
-        if self._current_token.token_type not in allow_types:
+        if self._current_token.token_type not in _LIST_ITEM_TYPES:
             return None
 
         token_type = self._current_token.token_type
@@ -588,3 +607,427 @@ class Parser:
             TokenType.STRING: self._parse_string,
             TokenType.MINUS: self._parse_prefix_expression,
         }
+
+
+class TableParser(Parser):
+
+    def __init__(self, lexer: Lexer) -> None:
+        super().__init__(lexer)
+
+        self._prefix_table: List[Optional[PrefixParseFn]] = self._build_table(
+            self._prefix_parse_fns)
+        self._infix_table: List[Optional[InfixParseFn]] = self._build_table(
+            self._infix_parse_fns)
+
+    def _build_table(self, parse_fns: Dict[TokenType, Any]) -> List[Any]:
+        table: List[Any] = [None] * (len(TokenType) + 1)
+        for token_type, parse_fn in parse_fns.items():
+            table[token_type.value] = parse_fn
+
+        return table
+
+    def _parse_expression(self, precedence: Precedence) -> Optional[Expression]:
+        assert self._current_token is not None
+        prefix_parse_fn = self._prefix_table[self._current_token.token_type._value_]
+        if prefix_parse_fn is None:
+            message = f'It was not found nothing funtion for parse {self._current_token.literal}'
+            self._append_error(message)
+
+            return None
+
+        left_expression = prefix_parse_fn()
+
+        infix_table = self._infix_table
+        assert self._peek_token is not None
+        while True:
+            kind: int = self._peek_token.token_type._value_
+            if kind == _SEMICOLON_KIND or precedence >= PRECEDENCE_TABLE[kind]:
+                break
+
+            infix_parse_fn = infix_table[kind]
+            if infix_parse_fn is None:
+                return left_expression
+
+            self._advance_tokens()
+
+            assert left_expression is not None
+            left_expression = infix_parse_fn(left_expression)
+
+        return left_expression
+
+    def _current_precedence(self) -> Precedence:
+        assert self._current_token is not None
+        return PRECEDENCE_TABLE[self._current_token.token_type._value_]
+
+    def _peek_precedence(self) -> Precedence:
+        assert self._peek_token is not None
+        return PRECEDENCE_TABLE[self._peek_token.token_type._value_]
+
+
+class StackParser(TableParser):
+
+    def __init__(self, lexer: Lexer) -> None:
+        super().__init__(lexer)
+
+        self._prefix_steps: List[Optional[Tuple[Callable, bool]]] = self._build_table(
+            self._register_prefix_steps())
+        self._infix_steps: List[Optional[Callable]] = self._build_table(
+            self._register_infix_steps())
+
+    def _parse_statement(self) -> Optional[Statement]:
+        return self._run(self._parse_statement_steps())
+
+    def _run(self, steps: ParseSteps) -> Any:
+        stack: List[ParseSteps] = [steps]
+        value: Any = None
+
+        while stack:
+            try:
+                stack.append(stack[-1].send(value))
+                value = None
+            except StopIteration as stop:
+                stack.pop()
+                value = stop.value
+
+        return value
+
+    def _parse_statement_steps(self) -> ParseSteps:
+        assert self._current_token is not None
+        if self._current_token.token_type == TokenType.LET:
+            return (yield self._parse_let_statement_steps())
+        elif self._current_token.token_type == TokenType.RETURN:
+            return (yield self._parse_return_statement_steps())
+        else:
+            return (yield self._parse_expression_statements_steps())
+
+    def _parse_expression_steps(self, precedence: Precedence) -> ParseSteps:
+        assert self._current_token is not None
+        prefix_steps = self._prefix_steps[self._current_token.token_type._value_]
+        if prefix_steps is None:
+            message = f'It was not found nothing funtion for parse {self._current_token.literal}'
+            self._append_error(message)
+
+            return None
+
+        prefix_parse_fn, is_steps = prefix_steps
+        if is_steps:
+            left_expression = yield prefix_parse_fn()
+        else:
+            left_expression = prefix_parse_fn()
+
+        infix_steps = self._infix_steps
+        assert self._peek_token is not None
+        while True:
+            kind: int = self._peek_token.token_type._value_
+            if kind == _SEMICOLON_KIND or precedence >= PRECEDENCE_TABLE[kind]:
+                break
+
+            infix_parse_fn = infix_steps[kind]
+            if infix_parse_fn is None:
+                return left_expression
+
+            self._advance_tokens()
+
+            assert left_expression is not None
+            left_expression = yield infix_parse_fn(left_expression)
+
+        return left_expression
+
+    def _parse_expression_statements_steps(self) -> ParseSteps:
+        assert self._current_token is not None
+        expression_statement = ExpressionStatement(token=self._current_token)
+
+        expression_statement.expression = yield self._parse_expression_steps(
+            Precedence.LOWEST)
+
+        assert self._peek_token is not None
+        if self._peek_token.token_type == TokenType.SEMICOLON:
+            self._advance_tokens()
+
+        return expression_statement
+
+    def _parse_let_statement_steps(self) -> ParseSteps:
+        assert self._current_token is not None
+        let_statement = LetStatement(token=self._current_token)
+
+        if not self._expected_token(TokenType.IDENT):
+            return None
+
+        let_statement.name = self._parse_identifier()
+        if not self._expected_token(TokenType.ASSIGN):
+            return None
+
+        self._advance_tokens()
+
+        let_statement.value = yield self._parse_expression_steps(Precedence.LOWEST)
+
+        assert self._peek_token is not None
+        if self._peek_token.token_type == TokenType.SEMICOLON:
+            self._advance_tokens()
+
+        return let_statement
+
+    def _parse_return_statement_steps(self) -> ParseSteps:
+        assert self._current_token is not None
+        return_statement = ReturnStatement(token=self._current_token)
+
+        self._advance_tokens()
+
+        return_statement.return_value = yield self._parse_expression_steps(
+            Precedence.LOWEST)
+        assert self._peek_token is not None
+        if self._peek_token.token_type == TokenType.SEMICOLON:
+            self._advance_tokens()
+
+        return return_statement
+
+    def _parse_prefix_expression_steps(self) -> ParseSteps:
+        assert self._current_token is not None
+        prefix_expression = Prefix(token=self._current_token,
+                                   operator=self._current_token.literal)
+
+        self._advance_tokens()
+
+        prefix_expression.right = yield self._parse_expression_steps(Precedence.PREFIX)
+
+        return prefix_expression
+
+    def _parse_infix_expression_steps(self, left: Expression) -> ParseSteps:
+        assert self._current_token is not None
+        infix = Infix(token=self._current_token,
+                      operator=self._current_token.literal,
+                      left=left)
+        precedence = self._current_precedence()
+
+        self._advance_tokens()
+
+        infix.right = yield self._parse_expression_steps(precedence)
+        return infix
+
+    def _parse_block_steps(self) -> ParseSteps:
+        assert self._current_token is not None
+        block_statements = Block(token=self._current_token,
+                                 statements=[])
+
+        self._advance_tokens()
+
+        while not self._current_token.token_type == TokenType.RBRACE and \
+                not self._current_token.token_type == TokenType.EOF:
+            statement = yield self._parse_statement_steps()
+            if statement:
+                block_statements.statements.append(statement)
+
+            self._advance_tokens()
+
+        return block_statements
+
+    def _parse_call_steps(self, function: Expression) -> ParseSteps:
+        assert self._current_token is not None
+        call = Call(self._current_token, function)
+        call.arguments = yield self._parse_call_arguments_steps()
+
+        return call
+
+    def _parse_call_arguments_steps(self) -> ParseSteps:
+        arguments: List[Expression] = []
+
+        assert self._peek_token is not None
+        if self._peek_token.token_type == TokenType.RPAREN:
+            self._advance_tokens()
+
+            return None
+
+        self._advance_tokens()
+        if expression := (yield self._parse_expression_steps(Precedence.LOWEST)):
+            arguments.append(expression)
+
+        while self._peek_token.token_type == TokenType.COMMA:
+            self._advance_tokens()
+            self._advance_tokens()
+
+            if expression := (yield self._parse_expression_steps(Precedence.LOWEST)):
+                arguments.append(expression)
+        if not self._expected_token(TokenType.RPAREN):
+            return None
+
+        return arguments
+
+    def _parse_if_steps(self) -> ParseSteps:
+        assert self._current_token is not None
+        if_expression = If(token=self._current_token)
+
+        self._advance_tokens()
+
+        if_expression.condition = yield self._parse_expression_steps(Precedence.LOWEST)
+
+        if not self._expected_token(TokenType.THEN):
+            return None
+
+        if not self._expected_token(TokenType.LBRACE):
+            return None
+
+        if_expression.consequence = yield self._parse_block_steps()
+
+        if self._peek_token is not None and self._peek_token.token_type == TokenType.ELSE:
+            self._advance_tokens()
+
+            if not self._expected_token(TokenType.LBRACE):
+                return None
+
+            if_expression.alternative = yield self._parse_block_steps()
+
+        return if_expression
+
+    def _parse_function_steps(self) -> ParseSteps:
+        assert self._current_token is not None
+        function = Function(token=self._current_token)
+
+        if not self._expected_token(TokenType.IDENT):
+            return None
+
+        function.parameters, function.type_parameters, function.type_output = self._parse_function_parameters()
+
+        if not self._expected_token(TokenType.LBRACE):
+            return None
+
+        function.body = yield self._parse_block_steps()
+
+        return function
+
+    def _parse_grouped_expression_steps(self) -> ParseSteps:
+        expression = yield self._parse_expression_steps(Precedence.LOWEST)
+        if self._peek_token.token_type is TokenType.COMMA:
+            return (yield self._parse_tuple_steps(expression))
+        if not self._expected_token(TokenType.RPAREN):
+            return None
+
+        return expression
+
+    def _parse_tuple_steps(self, fst_value: Optional[Expression]) -> ParseSteps:
+        assert self._current_token is not None
+        tuple_values = TupleValues(token=Token(TokenType.COMMA, '('))
+
+        values = [fst_value]
+
+        self._advance_tokens()
+
+        while self._current_token.token_type == TokenType.COMMA:
+            self._advance_tokens()
+
+            if expression := (yield self._parse_expression_steps(Precedence.LOWEST)):
+                values.append(expression)
+
+                self._advance_tokens()
+
+        if self._current_token.token_type is not TokenType.RPAREN:
+            return None
+
+        tuple_values.values = values
+
+        return tuple_values
+
+    def _parse_paren_steps(self) -> ParseSteps:
+        assert self._current_token is not None and \
+            self._peek_token is not None
+
+        self._advance_tokens()
+
+        return (yield self._parse_grouped_expression_steps())
+
+    def _parse_list_steps(self) -> ParseSteps:
+        assert self._current_token is not None
+        list_values = ListValues(token=self._current_token)
+
+        self._advance_tokens()
+
+        if self._current_token.token_type == TokenType.RBRAKET:
+            return list_values
+
+        values = []
+        if self._current_token.token_type not in _LIST_ITEM_TYPES:
+            return None
+
+        token_type = self._current_token.token_type
+
+        if expression := (yield self._parse_expression_steps(Precedence.LOWEST)):
+            values.append(expression)
+
+        self._advance_tokens()
+        while self._current_token.token_type == TokenType.COMMA:
+
+            self._advance_tokens()
+
+            if self._current_token.token_type != token_type:
+                return None
+
+            if expression := (yield self._parse_expression_steps(Precedence.LOWEST)):
+                values.append(expression)
+
+                self._advance_tokens()
+
+        if self._current_token.token_type is not TokenType.RBRAKET:
+            return None
+        list_values.values = values
+
+        return list_values
+
+    def _parse_call_list_steps(self, value_list: Expression) -> ParseSteps:
+        assert self._current_token is not None
+        call_list = CallList(self._current_token, value_list)
+        call_list.range = yield self._parse_call_list_arguments_steps()
+
+        return call_list
+
+    def _parse_call_list_arguments_steps(self) -> ParseSteps:
+        ranges: List[Expression] = []
+
+        assert self._peek_token is not None
+        if self._peek_token.token_type == TokenType.RBRAKET:
+            self._advance_tokens()
+
+            return None
+        self._advance_tokens()
+        if expression := (yield self._parse_expression_steps(Precedence.LOWEST)):
+            ranges.append(expression)
+        while self._peek_token.token_type == TokenType.COMMA:
+            self._advance_tokens()
+            self._advance_tokens()
+
+            if expression := (yield self._parse_expression_steps(Precedence.LOWEST)):
+                ranges.append(expression)
+        if not self._expected_token(TokenType.RBRAKET):
+            return None
+
+        return ranges
+
+    def _register_infix_steps(self) -> Dict[TokenType, Callable]:
+        infix_steps: Dict[TokenType, Callable] = {
+            token_type: self._parse_infix_expression_steps for token_type in self._infix_parse_fns
+        }
+        infix_steps[TokenType.LPAREN] = self._parse_call_steps
+        infix_steps[TokenType.LBRAKET] = self._parse_call_list_steps
+
+        return infix_steps
+
+    def _register_prefix_steps(self) -> Dict[TokenType, Tuple[Callable, bool]]:
+        return {
+            TokenType.FUNCTION: (self._parse_function_steps, True),
+            TokenType.IF: (self._parse_if_steps, True),
+            TokenType.LPAREN: (self._parse_paren_steps, True),
+            TokenType.LBRAKET: (self._parse_list_steps, True),
+            TokenType.RBRAKET: (self._parse_list_steps, True),
+            TokenType.FALSE: (self._parse_boolean, False),
+            TokenType.TRUE: (self._parse_boolean, False),
+            TokenType.IDENT: (self._parse_identifier, False),
+            TokenType.INT: (self._parse_interger, False),
+            TokenType.FLOAT: (self._parse_float, False),
+            TokenType.STRING: (self._parse_string, False),
+            TokenType.MINUS: (self._parse_prefix_expression_steps, True),
+        }
+
+
+PARSERS: Dict[str, Type[Parser]] = {
+    'pratt': Parser,
+    'table': TableParser,
+    'stack': StackParser,
+}
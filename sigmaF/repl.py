@@ -4,24 +4,56 @@ import re
 from os import system, name
 
 from typing import (
+    Callable,
+    Dict,
     Optional,
     List
 )
 
-from sigmaF.ast import Program
+from sigmaF.ast import (
+    LetStatement,
+    Program
+)
+from sigmaF.cache import (
+    load_bytecode,
+    parse_module,
+    store_bytecode
+)
+from sigmaF.checker import check_types
+from sigmaF.closures import run
+from sigmaF.compiler import (
+    Bytecode,
+    compile_program,
+    CompileError
+)
+from sigmaF.incremental import IncrementalFrontEnd
 from sigmaF.object import (
     Environment,
+    Object,
     ObjectType
 )
+from sigmaF.optimizer import fold_constants
+from sigmaF.resolver import resolve_names
 from sigmaF.parser import (
     Parser,
 )
-from sigmaF.lexer import Lexer
+from sigmaF.stackless import run as run_stackless
+from sigmaF.symbol import SYMBOLS
+from sigmaF.transpiler import run as run_native
+from sigmaF.unboxed import run as run_unboxed
+from sigmaF.lexer import (
+    Lexer,
+    new_lexer
+)
 from sigmaF.token import (
     Token,
     TokenType,
 )
 from sigmaF.evaluator import evaluate
+from sigmaF.vm import (
+    execute,
+    run as run_bytecode
+)
 
 
 EOF_TOKEN: Token = Token(TokenType.EOF, '')
@@ -30,37 +62,61 @@ _FILENOTFOUNT = "File not fount on {}"
 _MAXIMUMRECURSIONDEPTH = 'Maximum recursion depth exceeded while being evaluated {}'
 _EVALUATIONERROR = 'There was an error in the evaluation process {}'
 
+_FRONT_ENDS: Dict[str, IncrementalFrontEnd] = {}
+
+Engine = Callable[[Program, Environment], Optional[Object]]
+
+ENGINES: Dict[str, Engine] = {
+    'tree': evaluate,
+    'closures': run,
+    'vm': run_bytecode,
+    'native': run_native,
+    'stackless': run_stackless,
+    'unboxed': run_unboxed,
+}
+
 
 def _print_parse_errors(errors: List[str]):
     for error in errors:
         print(error)
 
 
-def _clean_comments(source: str) -> str:
-    pattern_single_line_comment = re.compile(r'\-\-.*(\n|\b)')
-    pattern_multiline_comment = re.compile(r'\/\*(\s|.)*?\*\/')
-
-    source = re.sub(pattern_multiline_comment, '', source)
-    source = re.sub(pattern_single_line_comment, '', source)
+def _check_errors(source: str,
+                  enviroment: Environment,
+                  _path: Optional[str] = None,
+                  optimize: bool = False,
+                  engine: str = 'tree') -> str:
+    env: Environment = enviroment
+    bytecode: Optional[Bytecode] = None
 
-    return source
+    if engine == 'vm' and _path is not None:
+        bytecode = load_bytecode(_path, source)
 
+    try:
+        if bytecode is None:
+            program, errors = parse_module(source, _path)
 
-def _check_errors(source: str, enviroment: Environment) -> str:
-    source = _clean_comments(source)
+            if len(errors) > 0:
+                _print_parse_errors(errors)
+                return ''
 
-    lexer: Lexer = Lexer(source)
-    parser: Parser = Parser(lexer)
+            if optimize:
+                fold_constants(program)
 
-    program: Program = parser.parse_program()
-    env: Environment = enviroment
+            check_types(program, env)
+            resolve_names(program)
 
-    if len(parser.errors) > 0:
-        _print_parse_errors(parser.errors)
-        return ''
+            if engine == 'vm' and _path is not None:
+                try:
+                    bytecode = compile_program(program)
+                    store_bytecode(_path, source, bytecode)
+                except CompileError:
+                    pass
 
-    try:
-        evaluated = evaluate(program, env)
+        if bytecode is not None:
+            evaluated = execute(bytecode, env)
+        else:
+            evaluated = ENGINES[engine](program, env)
 
         if evaluated is not None:
             print(evaluated.inspect())
@@ -77,8 +133,7 @@ def read_module(path):
     src = None
     try:
         with open(path, mode='r', encoding='utf-8') as fin:
-            lines = fin.readlines()
-        src = '\n'.join([str(line) for line in lines])
+            src = fin.read()
     except FileNotFoundError:
         print('\n[Error] ' + _FILENOTFOUNT.format(path) + '\n')
     return src
@@ -94,23 +149,49 @@ def clear():
         _ = system('clear')
 
 
-def update(_path: Optional[str], env: Environment):
+def update(_path: Optional[str], env: Environment, engine: str = 'tree'):
     if _path is None:
         print(f"[Warning] There is no path to be uploaded")
         return env
 
     print(f"[Warning] Updated the path: { _path}")
 
-    new_env = Environment()
+    source: Optional[str] = read_module(_path)
+    if source is None:
+        return env
+
+    front_end: IncrementalFrontEnd = _FRONT_ENDS.setdefault(
+        _path, IncrementalFrontEnd())
+    diff = front_end.update(source)
+
+    if len(front_end.errors) > 0:
+        _print_parse_errors(front_end.errors)
+        return env
+
+    names: List[str] = diff.removed + [
+        statement.name.value for statement in diff.statements
+        if isinstance(statement, LetStatement) and statement.name is not None
+    ]
+    for name in names:
+        symbol: int = SYMBOLS.intern(name)
+        if symbol in env._store:
+            env.__delitem__(symbol)
+
+    try:
+        program: Program = front_end.program
+        check_types(program, env)
+        resolve_names(program)
 
-    source: str = read_module(_path)
-    _ = Lexer(_check_errors(source, new_env))
+        for statement in diff.statements:
+            evaluated = ENGINES[engine](Program(statements=[statement]), env)
 
-    for key, value in new_env._store.items():
-        if key in env.keys():
-            env.__delitem__(key)
+            if evaluated is not None and evaluated.type() is ObjectType.ERROR:
+                print(evaluated.inspect())
+    except RecursionError:
+        print('[Error] ' + _MAXIMUMRECURSIONDEPTH.format(''))
+    except AssertionError:
+        print('\n[Error] ' + _EVALUATIONERROR.format('') + '\n')
 
-        env.__setitem__(key, value)
     return env
 
 
@@ -171,15 +252,17 @@ def read_sublines(source):
     return '\n'.join(sub_lines)
 
 
-def start_repl(source: str = '', _path: Optional[str] = None) -> None:
+def start_repl(source: str = '',
+               _path: Optional[str] = None,
+               use_cache: bool = True,
+               optimize: bool = False,
+               engine: str = 'tree') -> None:
     scanned: List[str] = []
     env: Environment = Environment()
 
-    scanned.append(_check_errors(source, env))
-
-    lexer: Lexer = Lexer(' '.join(scanned))
+    scanned.append(_check_errors(source, env, _path if use_cache else None, optimize, engine))
 
-    _ = process(lexer, env)
+    lexer: Lexer = new_lexer('')
 
     _pattern_path = re.compile(r'load\(([\w\.-_\/]+)\)')
 
@@ -195,17 +278,17 @@ def start_repl(source: str = '', _path: Optional[str] = None) -> None:
         elif source.strip() == "clear()":
             clear()
         elif source == "update()":
-            env = update(_path, env)
+            env = update(_path, env, engine)
         elif (path := re.match(_pattern_path, source)) is not None:
-            env = update(path.group(1), env)
+            env = update(path.group(1), env, engine)
             _path = path.group(1)
         else:
             if source != '':
-                source += read_sublines(source)
+                source += '\n' + read_sublines(source)
 
-            scanned.append(_check_errors(source, env))
+            scanned.append(_check_errors(source, env, optimize=optimize, engine=engine))
 
-            lexer = Lexer(' '.join(scanned))
+            lexer = new_lexer('\n'.join(scanned))
 
             _ = process(lexer, env)
 
@@ -0,0 +1,215 @@
+from typing import (
+    List,
+    Optional,
+    Set,
+    Tuple
+)
+
+import sigmaF.ast as ast
+
+GLOBAL = -1
+
+
+class FunctionScope:
+
+    __slots__ = ('function', 'bound', 'declared', 'converted', 'free')
+
+    def __init__(self, function: ast.Function, bound: Set[str], declared: Set[str]) -> None:
+        self.function = function
+        self.bound = bound
+        self.declared = declared
+        self.converted = True
+        self.free: Set[int] = set()
+
+
+Scopes = Tuple[FunctionScope, ...]
+
+
+class Resolver:
+
+    def __init__(self) -> None:
+        self._scopes: List[FunctionScope] = []
+        self._references: List[Tuple[ast.Identifier, Scopes, int]] = []
+        self._functions: List[Tuple[FunctionScope, Scopes]] = []
+
+    def resolve(self, program: ast.Program) -> int:
+        self._scopes = []
+        self._references = []
+        self._functions = []
+
+        try:
+            for statement in program.statements:
+                self._resolve_statement(statement)
+        except RecursionError:
+            for node in ast.iter_nodes(program):
+                if type(node) == ast.Identifier:
+                    node.depth = None
+                elif type(node) == ast.Function:
+                    node.free_symbols = None
+            return 0
+
+        for identifier, scopes, target in self._references:
+            _capture(identifier.symbol, scopes, target)
+
+        for identifier, scopes, target in self._references:
+            identifier.depth = _depth(identifier.symbol, scopes, target)
+
+        for scope, scopes in self._functions:
+            function: ast.Function = scope.function
+            function.free_symbols = tuple(sorted(scope.free)) if scope.converted else None
+            function.global_depth = _depth(-1, scopes, GLOBAL)
+
+        return len(self._references)
+
+    def _resolve_block(self, statements: List[ast.Statement]) -> None:
+        if len(self._scopes) == 0:
+            for statement in statements:
+                self._resolve_statement(statement)
+            return
+
+        scope: FunctionScope = self._scopes[-1]
+        bound: Set[str] = scope.bound.copy()
+
+        for statement in statements:
+            self._resolve_statement(statement)
+
+        scope.bound.intersection_update(bound)
+
+    def _resolve_statement(self, statement: ast.Statement) -> None:
+        statement_type: type = type(statement)
+
+        if statement_type == ast.LetStatement:
+            self._resolve_expression(statement.value)
+            if len(self._scopes) > 0 and statement.name is not None:
+                self._scopes[-1].bound.add(statement.name.value)
+
+        elif statement_type == ast.ReturnStatement:
+            self._resolve_expression(statement.return_value)
+
+        elif statement_type == ast.ExpressionStatement:
+            self._resolve_expression(statement.expression)
+
+        elif statement_type == ast.Block:
+            self._resolve_block(statement.statements)
+
+    def _resolve_expression(self, expression: Optional[ast.Expression]) -> None:
+        expression_type: type = type(expression)
+
+        if expression_type == ast.Identifier:
+            self._resolve_identifier(expression)
+
+        elif expression_type == ast.Prefix:
+            self._resolve_expression(expression.right)
+
+        elif expression_type == ast.Infix:
+            self._resolve_expression(expression.left)
+            self._resolve_expression(expression.right)
+
+        elif expression_type == ast.If:
+            self._resolve_expression(expression.condition)
+            self._resolve_statement(expression.consequence)
+            self._resolve_statement(expression.alternative)
+
+        elif expression_type == ast.Function:
+            self._resolve_function(expression)
+
+        elif expression_type == ast.Call:
+            self._resolve_expression(expression.function)
+            for argument in expression.arguments or []:
+                self._resolve_expression(argument)
+
+        elif expression_type in (ast.ListValues, ast.TupleValues):
+            for value in expression.values:
+                self._resolve_expression(value)
+
+        elif expression_type == ast.CallList:
+            self._resolve_expression(expression.list_identifier)
+            for value in expression.range or []:
+                self._resolve_expression(value)
+
+    def _resolve_identifier(self, identifier: ast.Identifier) -> None:
+        scopes: Scopes = tuple(self._scopes)
+
+        for index in range(len(scopes) - 1, -1, -1):
+            if identifier.value in scopes[index].bound:
+                self._references.append((identifier, scopes, index))
+                return
+            elif identifier.value in scopes[index].declared:
+                identifier.depth = None
+                for scope in scopes:
+                    scope.converted = False
+                return
+
+        self._references.append((identifier, scopes, GLOBAL))
+
+    def _resolve_function(self, function: ast.Function) -> None:
+        assert function.body is not None
+        scope: FunctionScope = FunctionScope(
+            function,
+            bound={parameter.value for parameter in function.parameters},
+            declared=_declared_names(function.body)
+        )
+
+        self._functions.append((scope, tuple(self._scopes)))
+
+        self._scopes.append(scope)
+        self._resolve_block(function.body.statements)
+        self._scopes.pop()
+
+
+def resolve_names(program: ast.Program) -> int:
+    return Resolver().resolve(program)
+
+
+def _capture(symbol: int, scopes: Scopes, target: int) -> None:
+    if target == GLOBAL:
+        return
+
+    for index in range(len(scopes) - 1, target, -1):
+        if scopes[index].converted:
+            for scope in scopes[target + 1:index + 1]:
+                if scope.converted:
+                    scope.free.add(symbol)
+            return
+
+
+def _depth(symbol: int, scopes: Scopes, target: int) -> int:
+    depth: int = 0
+
+    for index in range(len(scopes) - 1, -1, -1):
+        if index == target:
+            return depth
+
+        scope: FunctionScope = scopes[index]
+        if scope.converted:
+            if len(scope.free) == 0:
+                return depth + 1
+            elif symbol in scope.free:
+                return depth + 1
+
+            return depth + 2
+
+        depth += 1
+
+    return depth
+
+
+def _declared_names(body: ast.Block) -> Set[str]:
+    declared: Set[str] = set()
+    stack: List[ast.ASTNode] = list(body.statements)
+
+    while stack:
+        node = stack.pop()
+        if type(node) == ast.Function:
+            continue
+        elif type(node) == ast.LetStatement and node.name is not None:
+            declared.add(node.name.value)
+
+        for field in ast.CHILD_FIELDS.get(type(node), ()):
+            child = getattr(node, field)
+            if type(child) is list:
+                stack.extend(child)
+            elif child is not None:
+                stack.append(child)
+
+    return declared
@@ -0,0 +1,390 @@
+from typing import (
+    Any,
+    cast,
+    List,
+    Optional,
+    Tuple,
+    Type
+)
+
+import sigmaF.ast as ast
+from sigmaF.evaluator import (
+    NULL,
+    _apply_function,
+    _capture_environment,
+    _check_arguments,
+    _check_output,
+    _check_type_tuple,
+    _evaluate_identifier,
+    _evaluate_infix_expression,
+    _evaluate_prefix_expression,
+    _extend_function_enviroment,
+    _get_values_iter,
+    _is_truthy,
+    _new_error,
+    _NON_MODIFIABLE_VALUE,
+    _to_boolean_object,
+    _UNKNOW_IDENTIFIER,
+    _unwrap_return_value
+)
+from sigmaF.object import (
+    Environment,
+    Error,
+    Float,
+    Function,
+    new_integer,
+    Object,
+    ObjectType,
+    Return,
+    String,
+    ValueList
+)
+
+MAX_DEPTH = 100000
+
+_MAXIMUM_DEPTH = 'Maximum recursion depth exceeded: There are more than {} nested calls'
+
+_EVALUATE = 0
+_PROGRAM = 1
+_BLOCK = 2
+_PREFIX = 3
+_INFIX = 4
+_IF = 5
+_RETURN = 6
+_LET = 7
+_ARGUMENTS = 8
+_CALL = 9
+_LEAVE = 10
+_ITEMS = 11
+_LIST = 12
+_TUPLE = 13
+_CALL_LIST = 14
+_CHECK = 15
+
+Task = Tuple[Any, ...]
+
+
+def run(program: ast.Program, env: Environment, max_depth: int = MAX_DEPTH) -> Optional[Object]:
+    return execute(program, env, max_depth)
+
+
+def execute(node: ast.ASTNode, env: Environment, max_depth: int = MAX_DEPTH) -> Optional[Object]:
+    tasks: List[Task] = [(_EVALUATE, node, env)]
+    values: List[Any] = []
+    frames: List[int] = []
+
+    while tasks:
+        task: Task = tasks.pop()
+        kind: int = task[0]
+
+        if kind == _EVALUATE:
+            node = task[1]
+            env = task[2]
+            node_type: Type = type(node)
+
+            if node_type == ast.ExpressionStatement:
+                assert node.expression is not None
+                tasks.append((_EVALUATE, node.expression, env))
+
+            elif node_type == ast.Integer:
+                if node.constant is None:
+                    assert node.value is not None
+                    node.constant = new_integer(node.value)
+
+                values.append(node.constant)
+
+            elif node_type == ast.Float:
+                if node.constant is None:
+                    assert node.value is not None
+                    node.constant = Float(node.value)
+
+                values.append(node.constant)
+
+            elif node_type == ast.Boolean:
+                assert node.value is not None
+                values.append(_to_boolean_object(node.value))
+
+            elif node_type == ast.String:
+                if node.constant is None:
+                    assert node.value is not None
+                    node.constant = String(node.value)
+
+                values.append(node.constant)
+
+            elif node_type == ast.Identifier:
+                values.append(_evaluate_identifier(node, env))
+
+            elif node_type == ast.Prefix:
+                assert node.right is not None
+                tasks.append((_PREFIX, node.operator))
+                tasks.append((_EVALUATE, node.right, env))
+
+            elif node_type == ast.Infix:
+                assert node.left is not None and node.right is not None
+                tasks.append((_INFIX, node.operator))
+                tasks.append((_EVALUATE, node.right, env))
+                tasks.append((_EVALUATE, node.left, env))
+
+            elif node_type == ast.Block:
+                tasks.append((_BLOCK, node.statements, 0, env))
+
+            elif node_type == ast.Program:
+                tasks.append((_PROGRAM, node.statements, 0, env))
+
+            elif node_type == ast.If:
+                assert node.condition is not None
+                tasks.append((_IF, node, env))
+                tasks.append((_EVALUATE, node.condition, env))
+
+            elif node_type == ast.ReturnStatement:
+                assert node.return_value is not None
+                tasks.append((_RETURN,))
+                tasks.append((_EVALUATE, node.return_value, env))
+
+            elif node_type == ast.LetStatement:
+                assert node.value is not None and node.name is not None
+                tasks.append((_LET, node.name, env))
+                tasks.append((_EVALUATE, node.value, env))
+
+            elif node_type == ast.Function:
+                assert node.body is not None
+                values.append(Function(node.parameters,
+                                       node.type_parameters,
+                                       node.type_output,
+                                       node.body,
+                                       env if node.free_symbols is None
+                                       else _capture_environment(node, env)))
+
+            elif node_type == ast.Call:
+                assert node.arguments is not None
+                tasks.append((_ARGUMENTS, node, env))
+                tasks.append((_EVALUATE, node.function, env))
+
+            elif node_type == ast.ListValues:
+                tasks.append((_LIST,))
+                tasks.append((_ITEMS, node.values, 0, env))
+
+            elif node_type == ast.TupleValues:
+                tasks.append((_TUPLE,))
+                tasks.append((_ITEMS, node.values, 0, env))
+
+            elif node_type == ast.CallList:
+                assert node.range is not None
+                tasks.append((_CALL_LIST, len(node.range)))
+                for end_of in reversed(node.range):
+                    tasks.append((_EVALUATE, end_of, env))
+                tasks.append((_EVALUATE, node.list_identifier, env))
+
+            else:
+                values.append(None)
+
+        elif kind == _BLOCK or kind == _PROGRAM:
+            statements: List[ast.Statement] = task[1]
+            index: int = task[2]
+
+            if index > 0:
+                result = values[-1]
+
+                if type(result) == Return or type(result) == Error:
+                    if kind == _PROGRAM:
+                        values[-1] = _unwrap_return_value(cast(Object, result))
+                    continue
+                elif index == len(statements):
+                    continue
+
+                values.pop()
+            elif len(statements) == 0:
+                values.append(None)
+                continue
+
+            tasks.append((kind, statements, index + 1, task[3]))
+            tasks.append((_EVALUATE, statements[index], task[3]))
+
+        elif kind == _PREFIX:
+            right = values.pop()
+
+            assert right is not None
+            values.append(_evaluate_prefix_expression(task[1], right))
+
+        elif kind == _INFIX:
+            right = values.pop()
+            left = values.pop()
+
+            assert right is not None and left is not None
+            values.append(_evaluate_infix_expression(task[1], left, right))
+
+        elif kind == _IF:
+            condition = values.pop()
+            if_expression: ast.If = task[1]
+
+            assert condition is not None
+            if _is_truthy(condition):
+                assert if_expression.consequence is not None
+                tasks.append((_EVALUATE, if_expression.consequence, task[2]))
+            elif if_expression.alternative is not None:
+                tasks.append((_EVALUATE, if_expression.alternative, task[2]))
+            else:
+                values.append(NULL)
+
+        elif kind == _RETURN:
+            value = values.pop()
+
+            assert value is not None
+            values.append(Return(value))
+
+        elif kind == _LET:
+            value = values.pop()
+            name: ast.Identifier = task[1]
+            env = task[2]
+
+            if name.symbol not in env._store:
+                env[name.symbol] = value
+                values.append(None)
+            else:
+                values.append(_new_error(_NON_MODIFIABLE_VALUE, [name.value]))
+
+        elif kind == _ARGUMENTS:
+            function = values[-1]
+            call: ast.Call = task[1]
+
+            assert function is not None
+            if function.type() is ObjectType.ERROR:
+                continue
+
+            assert call.arguments is not None
+            tasks.append((_CALL, call, len(call.arguments)))
+            for argument in reversed(call.arguments):
+                tasks.append((_EVALUATE, argument, task[2]))
+
+        elif kind == _CALL:
+            call = task[1]
+            argc: int = task[2]
+
+            args: List[Object] = cast(List[Object], values[len(values) - argc:])
+            del values[len(values) - argc:]
+            function = cast(Object, values.pop())
+
+            checked: bool = call.signature is not None and type(function) == Function \
+                and cast(Function, function).body is call.signature.body
+
+            if not checked:
+                error = _check_arguments(function, args)
+                if error is not None:
+                    values.append(error)
+                    continue
+
+            if type(function) != Function or cast(Function, function).code is not None:
+                value = _apply_function(function, args)
+                values.append(value if checked else _check_output(function, value))
+                continue
+
+            fn = cast(Function, function)
+
+            if len(frames) > 0 and _in_tail_position(tasks, frames[-1]):
+                del tasks[frames[-1] + 1:]
+
+                caller: Task = tasks[-1]
+                if not checked and (caller[0] == _LEAVE and caller[2] or
+                                    str(caller[1].type_output) != str(fn.type_output)):
+                    tasks.append((_CHECK, fn))
+            else:
+                if len(frames) >= max_depth:
+                    return _new_error(_MAXIMUM_DEPTH, [max_depth])
+
+                frames.append(len(tasks))
+                tasks.append((_LEAVE, fn, checked))
+
+            tasks.append((_EVALUATE, fn.body, _extend_function_enviroment(fn, args)))
+
+        elif kind == _CHECK:
+            value = values.pop()
+
+            assert value is not None
+            values.append(_check_output(task[1], _unwrap_return_value(value)))
+
+        elif kind == _LEAVE:
+            frames.pop()
+            value = values.pop()
+
+            assert value is not None
+            value = _unwrap_return_value(value)
+            values.append(value if task[2] else _check_output(task[1], value))
+
+        elif kind == _ITEMS:
+            items: List[ast.Expression] = task[1]
+            index = task[2]
+
+            if index > 0:
+                evaluated = values[-1]
+
+                assert evaluated is not None
+                if evaluated.type() is ObjectType.ERROR:
+                    del values[len(values) - index:]
+                    values.append(_unknown_item_error(items[index - 1]))
+                    values.append(1)
+                    continue
+
+            if index == len(items):
+                values.append(index)
+                continue
+
+            tasks.append((_ITEMS, items, index + 1, task[3]))
+            tasks.append((_EVALUATE, items[index], task[3]))
+
+        elif kind == _LIST:
+            items_values: List[Object] = _pop_items(values)
+
+            if len(items_values) > 0 and items_values[0].type() is ObjectType.ERROR:
+                values.append(items_values[0])
+            else:
+                values.append(ValueList(items_values))
+
+        elif kind == _TUPLE:
+            values.append(_check_type_tuple(_pop_items(values)))
+
+        elif kind == _CALL_LIST:
+            count: int = task[1]
+
+            ranges = cast(List[Object], values[len(values) - count:])
+            del values[len(values) - count:]
+            iterable = values.pop()
+
+            assert iterable is not None
+            values.append(_get_values_iter(iterable, ranges))
+
+    return values.pop()
+
+
+def _in_tail_position(tasks: List[Task], frame: int) -> bool:
+    returned: bool = False
+
+    for index in range(len(tasks) - 1, frame, -1):
+        task: Task = tasks[index]
+
+        if task[0] == _RETURN:
+            returned = True
+        elif task[0] == _BLOCK:
+            if not returned and task[2] < len(task[1]):
+                return False
+        elif task[0] != _CHECK:
+            return False
+
+    return True
+
+
+def _pop_items(values: List[Any]) -> List[Object]:
+    count: int = values.pop()
+
+    items: List[Object] = values[len(values) - count:]
+    del values[len(values) - count:]
+
+    return items
+
+
+def _unknown_item_error(item: ast.Expression) -> Error:
+    if type(item) is ast.Identifier:
+        return _new_error(_UNKNOW_IDENTIFIER, [cast(ast.Identifier, item).value])
+    elif type(item) is ast.CallList:
+        return _new_error(_UNKNOW_IDENTIFIER, [cast(ast.CallList, item).list_identifier])
+
+    return _new_error(_UNKNOW_IDENTIFIER, ['unknow identifier'])
@@ -0,0 +1,45 @@
+from typing import (
+    Dict,
+    List
+)
+
+from sigmaF.token import (
+    KEYWORDS,
+    TokenType
+)
+
+
+class SymbolTable:
+
+    def __init__(self) -> None:
+        self._symbols: Dict[str, int] = {}
+        self._names: List[str] = []
+        self._token_types: List[TokenType] = []
+
+        for keyword, token_type in KEYWORDS.items():
+            self.intern(keyword)
+            self._token_types[-1] = token_type
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def intern(self, name: str) -> int:
+        try:
+            return self._symbols[name]
+        except KeyError:
+            symbol = len(self._names)
+
+            self._symbols[name] = symbol
+            self._names.append(name)
+            self._token_types.append(TokenType.IDENT)
+
+            return symbol
+
+    def name(self, symbol: int) -> str:
+        return self._names[symbol]
+
+    def token_type(self, symbol: int) -> TokenType:
+        return self._token_types[symbol]
+
+
+SYMBOLS: SymbolTable = SymbolTable()
@@ -15,6 +15,7 @@ class TokenType(Enum):
     ASSIGN = auto()
     COMMA = auto()
     CLASSNAME = auto()
+    COMMENT = auto()
     DIVISION = auto()
     ELSE = auto()
     EQ = auto()
@@ -61,23 +62,24 @@ class Token(NamedTuple):
         return f'Type: {self.token_type}, Literal: {self.literal}'
 
 
-def lookup_token_type(literal: str) -> TokenType:
-    keywords: Dict[str, TokenType] = {
-        'fn': TokenType.FUNCTION,
-        'let': TokenType.LET,
-        'false': TokenType.FALSE,
-        'true': TokenType.TRUE,
-        'if': TokenType.IF,
-        'then': TokenType.THEN,
-        'else': TokenType.ELSE,
-        'bool': TokenType.CLASSNAME,
-        'int': TokenType.CLASSNAME,
-        'str': TokenType.CLASSNAME,
-        'float': TokenType.CLASSNAME,
-        'function': TokenType.CLASSNAME,
-        'list': TokenType.CLASSNAME,
-        'tuple': TokenType.CLASSNAME,
-        'null': TokenType.CLASSNAME,
-    }
+KEYWORDS: Dict[str, TokenType] = {
+    'fn': TokenType.FUNCTION,
+    'let': TokenType.LET,
+    'false': TokenType.FALSE,
+    'true': TokenType.TRUE,
+    'if': TokenType.IF,
+    'then': TokenType.THEN,
+    'else': TokenType.ELSE,
+    'bool': TokenType.CLASSNAME,
+    'int': TokenType.CLASSNAME,
+    'str': TokenType.CLASSNAME,
+    'float': TokenType.CLASSNAME,
+    'function': TokenType.CLASSNAME,
+    'list': TokenType.CLASSNAME,
+    'tuple': TokenType.CLASSNAME,
+    'null': TokenType.CLASSNAME,
+}
+
 
-    return keywords.get(literal, TokenType.IDENT)
+def lookup_token_type(literal: str) -> TokenType:
+    return KEYWORDS.get(literal, TokenType.IDENT)
@@ -0,0 +1,464 @@
+from math import isfinite
+from types import CodeType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple
+)
+
+import sigmaF.ast as ast
+from sigmaF.builtins import BUILTIN_SYMBOLS
+from sigmaF.evaluator import (
+    evaluate,
+    FALSE,
+    TRUE
+)
+from sigmaF.object import (
+    Boolean,
+    Environment,
+    Error,
+    Float,
+    Function,
+    Integer,
+    Object,
+    Return,
+    String
+)
+
+NativeType = str
+Code = Callable[[Environment], Optional[Object]]
+
+_UNSUPPORTED = 'The {} of the function {} can not be transpiled'
+
+_BOXES: Dict[NativeType, type] = {
+    'int': Integer,
+    'float': Float,
+    'str': String,
+    'bool': Boolean,
+}
+
+_COMPARISONS: Tuple[str, ...] = ('<', '>', '<=', '>=', '==', '!=')
+
+_OPERATORS: Dict[Tuple[NativeType, str], Tuple[str, NativeType]] = {
+    **{('int', operator): (f'({{}} {operator} {{}})', 'int') for operator in ('+', '-', '*', '%')},
+    ('int', '/'): ('_divide({}, {})', 'int'),
+    ('int', '**'): ('_power({}, {})', 'int'),
+    **{('float', operator): (f'({{}} {operator} {{}})', 'float')
+       for operator in ('+', '-', '*', '**', '%')},
+    ('float', '/'): ('_divide_float({}, {})', 'float'),
+    **{(native_type, operator): (f'({{}} {operator} {{}})', 'bool')
+       for native_type in ('int', 'float') for operator in _COMPARISONS},
+    ('str', '+'): ('({} + {})', 'str'),
+    ('str', '=='): ('({} == {})', 'bool'),
+    ('str', '!='): ('({} != {})', 'bool'),
+    ('bool', '=='): ('({} == {})', 'bool'),
+    ('bool', '!='): ('({} != {})', 'bool'),
+    ('bool', '&&'): ('({} & {})', 'bool'),
+    ('bool', '||'): ('({} | {})', 'bool'),
+}
+
+_CODE_CACHE: Dict[str, CodeType] = {}
+
+
+class Fallback(Exception):
+    pass
+
+
+def _divide(left: int, right: int) -> int:
+    if right == 0 or left % right != 0:
+        raise Fallback()
+
+    return left // right
+
+
+def _divide_float(left: float, right: float) -> float:
+    if right == 0:
+        raise Fallback()
+
+    return left / right
+
+
+def _power(left: int, right: int) -> int:
+    if right < 0:
+        raise Fallback()
+
+    return left ** right
+
+
+class NativeFunction:
+
+    __slots__ = ('name', 'function', 'symbol', 'parameter_symbols', 'parameter_types',
+                 'output', 'callees', 'dependencies', 'lines')
+
+    def __init__(self, name: str, symbol: int, function: ast.Function) -> None:
+        self.name = name
+        self.symbol = symbol
+        self.function = function
+        self.parameter_symbols: List[int] = [parameter.symbol for parameter in function.parameters]
+        self.parameter_types: List[NativeType] = [type_parameter.value
+                                                  for type_parameter in function.type_parameters]
+        self.output: NativeType = str(function.type_output)
+        self.callees: Set[str] = set()
+        self.dependencies: List[Tuple[int, str]] = []
+        self.lines: List[str] = []
+
+
+class Unsupported(Exception):
+    pass
+
+
+class Module:
+
+    def __init__(self, source: str, natives: Dict[str, NativeFunction]) -> None:
+        self.source = source
+        self._natives = natives
+        self._bound: Dict[str, Function] = {}
+        self._namespace: Dict[str, Any] = {
+            '_divide': _divide,
+            '_divide_float': _divide_float,
+            '_power': _power,
+        }
+
+        if len(natives) > 0:
+            if source not in _CODE_CACHE:
+                _CODE_CACHE[source] = compile(source, '<sigmaF>', 'exec')
+            exec(_CODE_CACHE[source], self._namespace)
+
+    @property
+    def names(self) -> List[str]:
+        return sorted(self._natives)
+
+    def bind(self, statement: ast.Statement, env: Environment) -> None:
+        if type(statement) != ast.LetStatement or statement.name is None \
+                or statement.name.value not in self._natives:
+            return
+
+        native: NativeFunction = self._natives[statement.name.value]
+        function = env._store.get(native.symbol)
+        if type(function) is not Function or native.function.body is not function.body:
+            return
+
+        self._bound[native.name] = function
+        function.code = self._adapter(native, function)
+
+    def _adapter(self, native: NativeFunction, function: Function) -> Code:
+        python_function: Callable[..., Any] = self._namespace[_function_name(native.name)]
+        box: type = _BOXES[native.output]
+        boxes: List[type] = [_BOXES[parameter_type] for parameter_type in native.parameter_types]
+        body: Optional[ast.Block] = function.body
+        bound: Dict[str, Function] = self._bound
+
+        def code(env: Environment) -> Optional[Object]:
+            values: List[Any] = []
+            for symbol, parameter_box in zip(native.parameter_symbols, boxes):
+                argument = env._store[symbol]
+                if type(argument) is not parameter_box:
+                    return evaluate(body, env)
+                values.append(argument.value)
+
+            store = env._outer._store
+            for symbol, name in native.dependencies:
+                if name not in bound or store.get(symbol) is not bound[name]:
+                    return evaluate(body, env)
+
+            try:
+                value = python_function(*values)
+            except Fallback:
+                return evaluate(body, env)
+
+            if box is Boolean:
+                return TRUE if value else FALSE
+            return box(value)
+
+        return code
+
+
+class Transpiler:
+
+    def __init__(self, env: Optional[Environment] = None) -> None:
+        self._env = env
+        self._natives: Dict[str, NativeFunction] = {}
+        self._native: Optional[NativeFunction] = None
+        self._looped: bool = False
+
+    def transpile(self, program: ast.Program) -> Module:
+        self._natives = self._collect_candidates(program)
+
+        changed: bool = True
+        while changed:
+            changed = False
+            for name in list(self._natives):
+                try:
+                    self._transpile_function(self._natives[name])
+                except (Unsupported, RecursionError):
+                    del self._natives[name]
+                    changed = True
+
+        for native in self._natives.values():
+            native.dependencies = [(self._natives[name].symbol, name)
+                                   for name in sorted(self._reachable(native))]
+
+        source: str = '\n\n'.join('\n'.join(native.lines) for native in self._natives.values())
+
+        return Module(source, self._natives)
+
+    def _collect_candidates(self, program: ast.Program) -> Dict[str, NativeFunction]:
+        names: Dict[str, Optional[NativeFunction]] = {}
+
+        for statement in program.statements:
+            if type(statement) != ast.LetStatement or statement.name is None:
+                continue
+
+            name: str = statement.name.value
+            symbol: int = statement.name.symbol
+            bound: bool = name in names \
+                or symbol in BUILTIN_SYMBOLS \
+                or (self._env is not None and symbol in self._env._store)
+
+            if not bound and type(statement.value) == ast.Function \
+                    and _has_native_signature(statement.value) and name.isidentifier():
+                names[name] = NativeFunction(name, symbol, statement.value)
+            else:
+                names[name] = None
+
+        return {name: native for name, native in names.items() if native is not None}
+
+    def _reachable(self, native: NativeFunction) -> Set[str]:
+        reachable: Set[str] = {native.name}
+        stack: List[str] = [native.name]
+
+        while stack:
+            for callee in self._natives[stack.pop()].callees:
+                if callee not in reachable:
+                    reachable.add(callee)
+                    stack.append(callee)
+
+        return reachable
+
+    def _transpile_function(self, native: NativeFunction) -> None:
+        function: ast.Function = native.function
+        assert function.body is not None
+
+        parameters: List[str] = [parameter.value for parameter in function.parameters]
+        declared: List[str] = _let_names(function.body)
+        if len(set(parameters)) != len(parameters) \
+                or len(set(declared)) != len(declared) \
+                or len(set(parameters) & set(declared)) > 0 \
+                or not all(name.isidentifier() for name in parameters + declared):
+            raise Unsupported(_UNSUPPORTED.format('names', native.name))
+
+        self._native = native
+        self._looped = False
+        native.callees = set()
+
+        scope: Dict[str, NativeType] = dict(zip(parameters, native.parameter_types))
+        lines: List[str] = [f'def {_function_name(native.name)}'
+                            f'({", ".join(_variable_name(name) for name in parameters)}):']
+        body: List[str] = self._block(function.body.statements, scope, tail=True, indent=1)
+
+        if self._looped:
+            lines.append('    while True:')
+            lines.extend(f'    {line}' for line in body)
+        else:
+            lines.extend(body)
+
+        native.lines = lines
+
+    def _block(self,
+               statements: List[ast.Statement],
+               scope: Dict[str, NativeType],
+               tail: bool,
+               indent: int) -> List[str]:
+        lines: List[str] = []
+        padding: str = '    ' * indent
+        output: NativeType = self._current.output
+
+        for index, statement in enumerate(statements):
+            last: bool = index == len(statements) - 1
+
+            if type(statement) == ast.ReturnStatement:
+                tail_call: Optional[List[str]] = self._tail_call(statement.return_value,
+                                                                 scope,
+                                                                 padding)
+                if tail_call is not None:
+                    lines.extend(tail_call)
+                    return lines
+
+                code, native_type = self._expression(statement.return_value, scope)
+                if native_type != output:
+                    raise Unsupported(_UNSUPPORTED.format('return', self._current.name))
+
+                lines.append(f'{padding}return {code}')
+                return lines
+
+            elif type(statement) == ast.LetStatement:
+                assert statement.name is not None
+                code, native_type = self._expression(statement.value, scope)
+                scope[statement.name.value] = native_type
+                lines.append(f'{padding}{_variable_name(statement.name.value)} = {code}')
+
+            elif type(statement) == ast.ExpressionStatement and type(statement.expression) == ast.If:
+                if_expression: ast.If = statement.expression
+                assert if_expression.consequence is not None
+                condition, condition_type = self._expression(if_expression.condition, scope)
+                if condition_type != 'bool' or (tail and last and if_expression.alternative is None):
+                    raise Unsupported(_UNSUPPORTED.format('if', self._current.name))
+
+                lines.append(f'{padding}if {condition}:')
+                lines.extend(self._block(if_expression.consequence.statements,
+                                         dict(scope), tail and last, indent + 1)
+                             or [f'{padding}    pass'])
+                if if_expression.alternative is not None:
+                    lines.append(f'{padding}else:')
+                    lines.extend(self._block(if_expression.alternative.statements,
+                                             dict(scope), tail and last, indent + 1)
+                                 or [f'{padding}    pass'])
+
+                if tail and last:
+                    return lines
+
+            elif type(statement) == ast.ExpressionStatement:
+                tail_call = self._tail_call(statement.expression, scope, padding) \
+                    if tail and last else None
+                if tail_call is not None:
+                    lines.extend(tail_call)
+                    return lines
+
+                code, native_type = self._expression(statement.expression, scope)
+                if tail and last:
+                    if native_type != output:
+                        raise Unsupported(_UNSUPPORTED.format('output', self._current.name))
+
+                    lines.append(f'{padding}return {code}')
+                    return lines
+
+                lines.append(f'{padding}{code}')
+
+            else:
+                raise Unsupported(_UNSUPPORTED.format('statement', self._current.name))
+
+        if tail:
+            raise Unsupported(_UNSUPPORTED.format('output', self._current.name))
+
+        return lines
+
+    def _tail_call(self,
+                   expression: Optional[ast.Expression],
+                   scope: Dict[str, NativeType],
+                   padding: str) -> Optional[List[str]]:
+        native: NativeFunction = self._current
+        if type(expression) != ast.Call or type(expression.function) != ast.Identifier \
+                or expression.function.value != native.name or native.name in scope:
+            return None
+
+        arguments: List[Tuple[str, NativeType]] = [self._expression(argument, scope)
+                                                   for argument in expression.arguments or []]
+        if [argument_type for _, argument_type in arguments] != native.parameter_types:
+            return None
+
+        self._looped = True
+        parameters: str = ', '.join(_variable_name(parameter.value)
+                                    for parameter in native.function.parameters)
+
+        return [f'{padding}{parameters} = {", ".join(code for code, _ in arguments)}',
+                f'{padding}continue']
+
+    @property
+    def _current(self) -> NativeFunction:
+        assert self._native is not None
+        return self._native
+
+    def _expression(self,
+                    expression: Optional[ast.Expression],
+                    scope: Dict[str, NativeType]) -> Tuple[str, NativeType]:
+        expression_type: type = type(expression)
+
+        if expression_type == ast.Integer:
+            return repr(expression.value), 'int'
+
+        elif expression_type == ast.Float and isfinite(expression.value):
+            return repr(expression.value), 'float'
+
+        elif expression_type == ast.String:
+            return repr(expression.value), 'str'
+
+        elif expression_type == ast.Boolean:
+            return repr(bool(expression.value)), 'bool'
+
+        elif expression_type == ast.Identifier and expression.value in scope:
+            return _variable_name(expression.value), scope[expression.value]
+
+        elif expression_type == ast.Prefix and expression.operator == '-':
+            code, native_type = self._expression(expression.right, scope)
+            if native_type in ('int', 'float'):
+                return f'(-{code})', native_type
+
+        elif expression_type == ast.Infix:
+            left, left_type = self._expression(expression.left, scope)
+            right, right_type = self._expression(expression.right, scope)
+            if left_type == right_type and (left_type, expression.operator) in _OPERATORS:
+                template, native_type = _OPERATORS[(left_type, expression.operator)]
+                return template.format(left, right), native_type
+
+        elif expression_type == ast.Call and type(expression.function) == ast.Identifier:
+            name: str = expression.function.value
+            if name not in scope and name in self._natives:
+                callee: NativeFunction = self._natives[name]
+                arguments: List[Tuple[str, NativeType]] = [self._expression(argument, scope)
+                                                           for argument in expression.arguments or []]
+
+                if [argument_type for _, argument_type in arguments] == callee.parameter_types:
+                    self._current.callees.add(name)
+                    return (f'{_function_name(name)}({", ".join(code for code, _ in arguments)})',
+                            callee.output)
+
+        raise Unsupported(_UNSUPPORTED.format('expression', self._current.name))
+
+
+def transpile(program: ast.Program, env: Optional[Environment] = None) -> Module:
+    return Transpiler(env).transpile(program)
+
+
+def run(program: ast.Program, env: Environment) -> Optional[Object]:
+    module: Module = transpile(program, env)
+    result: Optional[Object] = None
+
+    for statement in program.statements:
+        result = evaluate(statement, env)
+        module.bind(statement, env)
+
+        if type(result) == Return:
+            return result.value
+        elif type(result) == Error:
+            return result
+
+    return result
+
+
+def _has_native_signature(function: ast.Function) -> bool:
+    return function.type_output is not None \
+        and function.type_output.value in _BOXES \
+        and len(function.parameters) == len(function.type_parameters) \
+        and all(type_parameter.value in _BOXES for type_parameter in function.type_parameters)
+
+
+def _let_names(body: ast.Block) -> List[str]:
+    names: List[str] = []
+
+    for node in ast.iter_nodes(body):
+        if type(node) == ast.LetStatement and node.name is not None:
+            names.append(node.name.value)
+
+    return names
+
+
+def _function_name(name: str) -> str:
+    return f'f_{name}'
+
+
+def _variable_name(name: str) -> str:
+    return f'v_{name}'
@@ -0,0 +1,552 @@
+from operator import (
+    add,
+    and_,
+    eq,
+    ge,
+    gt,
+    le,
+    lt,
+    mod,
+    mul,
+    ne,
+    or_,
+    sub
+)
+from typing import (
+    Any,
+    Callable,
+    cast,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union
+)
+
+import sigmaF.ast as ast
+import sigmaF.evaluator as evaluator
+from sigmaF.evaluator import (
+    _DIVISION_BY_ZERO,
+    _NON_MODIFIABLE_VALUE,
+    _NOT_A_FUNCTION,
+    _TAIL_EXPRESSIONS,
+    _UNKNOW_IDENTIFIER,
+    _apply_function,
+    _capture_environment,
+    _check_type_tuple,
+    _evaluate_identifier,
+    _evaluate_infix_expression,
+    _evaluate_prefix_expression,
+    _get_values_iter,
+    _new_error,
+    TailCall,
+    TYPE_REGISTER_LITERAL
+)
+from sigmaF.object import (
+    Boolean,
+    Builtin,
+    EMPTY_LIST,
+    Environment,
+    Error,
+    FALSE,
+    Float,
+    Function,
+    Integer,
+    new_integer,
+    NULL,
+    Object,
+    ObjectType,
+    Return,
+    String,
+    TRUE,
+    ValueList
+)
+
+Value = Any
+
+_BOXES: Dict[Type, Callable[[Any], Object]] = {
+    int: new_integer,
+    float: Float,
+    complex: Float,
+    str: String,
+    bool: lambda value: TRUE if value else FALSE,
+}
+
+_UNBOXED_TYPES: Dict[Type, ObjectType] = {
+    int: ObjectType.INTEGER,
+    float: ObjectType.FLOAT,
+    complex: ObjectType.FLOAT,
+    str: ObjectType.STRING,
+    bool: ObjectType.BOOLEAN,
+}
+
+_BOXED_TYPES = (Integer, Float, String, Boolean)
+
+_UNBOXED_VALUES = {
+    (Integer, int),
+    (Float, float),
+    (Float, complex),
+    (String, str),
+    (Boolean, bool),
+}
+
+
+def _divide_integers(left: int, right: int) -> Union[int, float, Error]:
+    if right == 0:
+        return _new_error(_DIVISION_BY_ZERO, [''])
+    elif left % right == 0:
+        return left // right
+
+    return left / right
+
+
+def _divide_floats(left: float, right: float) -> Union[float, Error]:
+    if right == 0:
+        return _new_error(_DIVISION_BY_ZERO, [''])
+
+    return left / right
+
+
+_OPERATIONS: Dict[Tuple[str, Type, Type], Callable[[Any, Any], Value]] = {
+    **{(operator, value_type, value_type): operation
+       for operator, operation in (('+', add), ('-', sub), ('*', mul), ('%', mod),
+                                   ('<', lt), ('>', gt), ('<=', le), ('>=', ge),
+                                   ('==', eq), ('!=', ne))
+       for value_type in (int, float)},
+    ('**', float, float): pow,
+    ('/', int, int): _divide_integers,
+    ('/', float, float): _divide_floats,
+    ('+', str, str): add,
+    ('==', str, str): eq,
+    ('!=', str, str): ne,
+    ('==', bool, bool): eq,
+    ('!=', bool, bool): ne,
+    ('||', bool, bool): or_,
+    ('&&', bool, bool): and_,
+}
+
+
+class UnboxedCode:
+
+    __slots__ = ('body',)
+
+    def __init__(self, body: ast.Block) -> None:
+        self.body = body
+
+    def __call__(self, env: Environment) -> Object:
+        return box(_unwrap_return_value(_apply_tail_calls(self.body, env)))
+
+
+def run(program: ast.Program, env: Environment) -> Optional[Object]:
+    return box(evaluate(program, env))
+
+
+def box(value: Value) -> Any:
+    new_object: Optional[Callable[[Any], Object]] = _BOXES.get(type(value))
+    if new_object is not None:
+        return new_object(value)
+
+    return value
+
+
+def unbox(value: Any) -> Value:
+    if type(value) in _BOXED_TYPES and (type(value), type(value.value)) in _UNBOXED_VALUES:
+        return value.value
+
+    return value
+
+
+def evaluate(node: ast.ASTNode, env: Environment) -> Value:
+    node_type: Type = type(node)
+
+    if node_type == ast.Identifier:
+        node = cast(ast.Identifier, node)
+
+        value = _evaluate_identifier(node, env)
+        if type(value) in _BOXED_TYPES and (type(value), type(value.value)) in _UNBOXED_VALUES:
+            return value.value
+
+        return value
+
+    elif node_type == ast.Integer or node_type == ast.Float \
+            or node_type == ast.String or node_type == ast.Boolean:
+        assert node.value is not None
+        return node.value
+
+    elif node_type == ast.Infix:
+        node = cast(ast.Infix, node)
+
+        assert node.left is not None and node.right is not None
+        left = evaluate(node.left, env)
+        right = evaluate(node.right, env)
+
+        assert right is not None and left is not None
+        operation = _OPERATIONS.get((node.operator, type(left), type(right)))
+        if operation is not None:
+            return operation(left, right)
+
+        return unbox(_evaluate_infix_expression(node.operator, box(left), box(right)))
+
+    elif node_type == ast.Call:
+        node = cast(ast.Call, node)
+
+        function = evaluate(node.function, env)
+        assert function is not None
+        if type(function) == Error:
+            return function
+
+        assert node.arguments is not None
+        args = _evaluate_expression(node.arguments, env)
+
+        if node.signature is not None and type(function) == Function \
+                and cast(Function, function).body is node.signature.body:
+            return _apply(function, args)
+
+        error = _check_arguments(function, args)
+        if error is not None:
+            return error
+
+        return _check_output(function, _apply(function, args))
+
+    elif node_type == ast.If:
+        node = cast(ast.If, node)
+
+        assert node.condition is not None
+        condition = evaluate(node.condition, env)
+
+        assert condition is not None
+        if condition is True:
+            assert node.consequence is not None
+            return evaluate(node.consequence, env)
+        elif node.alternative is not None:
+            return evaluate(node.alternative, env)
+
+        return NULL
+
+    elif node_type == ast.ReturnStatement:
+        node = cast(ast.ReturnStatement, node)
+
+        assert node.return_value is not None
+        value = evaluate(node.return_value, env)
+
+        assert value is not None
+        return Return(value)
+
+    elif node_type == ast.Block:
+        node = cast(ast.Block, node)
+
+        return _evaluate_block_statement(node, env)
+
+    elif node_type == ast.ExpressionStatement:
+        node = cast(ast.ExpressionStatement, node)
+
+        assert node.expression is not None
+        return evaluate(node.expression, env)
+
+    elif node_type == ast.Prefix:
+        node = cast(ast.Prefix, node)
+
+        assert node.right is not None
+        right = evaluate(node.right, env)
+
+        assert right is not None
+        if node.operator == '-' and (type(right) is int or type(right) is float):
+            return -right
+
+        return unbox(_evaluate_prefix_expression(node.operator, box(right)))
+
+    elif node_type == ast.LetStatement:
+        node = cast(ast.LetStatement, node)
+
+        assert node.value is not None
+        value = evaluate(node.value, env)
+
+        assert node.name is not None
+        if node.name.symbol in env._store:
+            return _new_error(_NON_MODIFIABLE_VALUE, [node.name.value])
+
+        env[node.name.symbol] = box(value) if env._outer is None else value
+
+    elif node_type == ast.Function:
+        node = cast(ast.Function, node)
+
+        assert node.body is not None
+        return Function(node.parameters,
+                        node.type_parameters,
+                        node.type_output,
+                        node.body,
+                        env if node.free_symbols is None else _capture_environment(node, env),
+                        UnboxedCode(node.body))
+
+    elif node_type == ast.ListValues:
+        node = cast(ast.ListValues, node)
+
+        items = _evaluate_items(node, env)
+        if len(items) == 0:
+            return EMPTY_LIST
+        elif type(items[0]) == Error:
+            return items[0]
+
+        return ValueList([box(item) for item in items])
+
+    elif node_type == ast.CallList:
+        node = cast(ast.CallList, node)
+
+        list_identifier = evaluate(node.list_identifier, env)
+        assert list_identifier is not None
+
+        assert node.range is not None
+        ranges = [box(end_of) for end_of in _evaluate_expression(node.range, env)]
+
+        return unbox(_get_values_iter(box(list_identifier), ranges))
+
+    elif node_type == ast.TupleValues:
+        node = cast(ast.TupleValues, node)
+
+        items = _evaluate_items(node, env)
+        return _check_type_tuple([box(item) for item in items])
+
+    elif node_type == ast.Program:
+        node = cast(ast.Program, node)
+
+        return _evaluate_program(node, env)
+
+    return None
+
+
+def _object_type(value: Value) -> ObjectType:
+    object_type: Optional[ObjectType] = _UNBOXED_TYPES.get(type(value))
+    if object_type is not None:
+        return object_type
+
+    return value.type()
+
+
+def _check_arguments(function: Value, args: List[Value]) -> Optional[Object]:
+    if type(function) != Function:
+        return None
+
+    type_parameters: List[ast.Identifier] = cast(Function, function).type_parameters
+    for index, arg in enumerate(args):
+        object_type: ObjectType = _object_type(arg)
+        if object_type is ObjectType.ERROR:
+            return None
+
+        if object_type != TYPE_REGISTER_LITERAL[type_parameters[index].value]:
+            return evaluator._check_arguments(function, [box(arg) for arg in args])
+
+    return None
+
+
+def _check_output(function: Value, value: Value) -> Value:
+    if type(function) != Function:
+        return value
+
+    type_output = cast(ast.Identifier, cast(Function, function).type_output)
+    if _object_type(value) is TYPE_REGISTER_LITERAL[type_output.value]:
+        return value
+
+    return unbox(evaluator._check_output(function, box(value)))
+
+
+def _apply(function: Value, args: List[Value]) -> Value:
+    if type(function) == Function:
+        function = cast(Function, function)
+
+        if function.code is None or type(function.code) is UnboxedCode:
+            return _unwrap_return_value(
+                _apply_tail_calls(function.body, _extend_function_enviroment(function, args)))
+
+        return unbox(_apply_function(function, [box(arg) for arg in args]))
+
+    elif type(function) == Builtin:
+        function = cast(Builtin, function)
+
+        return unbox(function.fn(*[box(arg) for arg in args]))
+
+    return _new_error(_NOT_A_FUNCTION, [_object_type(function).name])
+
+
+def _apply_tail_calls(body: ast.Block, env: Environment) -> Value:
+    pending: List[Function] = []
+
+    while True:
+        evaluated = _evaluate_tail_block(body, env)
+
+        if type(evaluated) != TailCall:
+            assert evaluated is not None
+            value: Value = _unwrap_return_value(evaluated)
+            break
+
+        function: Value = evaluated.function
+        args: List[Value] = evaluated.arguments
+
+        if not evaluated.checked:
+            error = _check_arguments(function, args)
+            if error is not None:
+                value = error
+                break
+
+        if type(function) != Function or not (function.code is None
+                                              or type(function.code) is UnboxedCode):
+            value = _apply(function, args)
+            if not evaluated.checked:
+                value = _check_output(function, value)
+            break
+
+        fn = cast(Function, function)
+        body = fn.body
+        env = _extend_function_enviroment(fn, args)
+        if not evaluated.checked and \
+                (len(pending) == 0 or str(pending[-1].type_output) != str(fn.type_output)):
+            pending.append(fn)
+
+    for function in reversed(pending):
+        value = _check_output(function, value)
+
+    return value
+
+
+def _evaluate_tail_block(block: ast.Block,
+                         env: Environment,
+                         value_position: bool = True) -> Value:
+    result: Value = None
+    last: int = len(block.statements) - 1
+
+    for index, statement in enumerate(block.statements):
+        if type(statement) == ast.ReturnStatement and \
+                type(statement.return_value) in _TAIL_EXPRESSIONS:
+            assert statement.return_value is not None
+            result = _evaluate_tail_expression(statement.return_value, env, True)
+            if type(result) == TailCall:
+                return result
+
+            assert result is not None
+            return Return(result)
+
+        elif type(statement) == ast.ExpressionStatement and \
+                type(statement.expression) in _TAIL_EXPRESSIONS:
+            assert statement.expression is not None
+            result = _evaluate_tail_expression(statement.expression,
+                                               env,
+                                               value_position and index == last)
+            if type(result) == TailCall:
+                return result
+
+        else:
+            result = evaluate(statement, env)
+
+        if type(result) == Return or type(result) == Error:
+            return result
+
+    return result
+
+
+def _evaluate_tail_expression(expression: ast.Expression,
+                              env: Environment,
+                              value_position: bool) -> Value:
+    if type(expression) == ast.Call:
+        if not value_position:
+            return evaluate(expression, env)
+
+        return _evaluate_tail_call(cast(ast.Call, expression), env)
+
+    if_expression = cast(ast.If, expression)
+
+    assert if_expression.condition is not None
+    condition = evaluate(if_expression.condition, env)
+
+    assert condition is not None
+    if condition is True:
+        assert if_expression.consequence is not None
+        return _evaluate_tail_block(if_expression.consequence, env, value_position)
+    elif if_expression.alternative is not None:
+        return _evaluate_tail_block(if_expression.alternative, env, value_position)
+
+    return NULL
+
+
+def _evaluate_tail_call(node: ast.Call, env: Environment) -> Value:
+    function = evaluate(node.function, env)
+    assert function is not None
+    if type(function) == Error:
+        return function
+
+    assert node.arguments is not None
+    args = _evaluate_expression(node.arguments, env)
+
+    return TailCall(function, args, node.signature is not None and type(function) == Function
+                    and cast(Function, function).body is node.signature.body)
+
+
+def _extend_function_enviroment(fn: Function, args: List[Value]) -> Environment:
+    env: Environment = Environment(outer=fn.env)
+    for index, param in enumerate(fn.parameters):
+        env[param.symbol] = args[index]
+
+    return env
+
+
+def _unwrap_return_value(value: Value) -> Value:
+    if type(value) == Return:
+        return value.value
+
+    return value
+
+
+def _evaluate_items(node: Union[ast.TupleValues, ast.ListValues], env: Environment) -> List[Value]:
+    values: List[Value] = []
+
+    for value in node.values:
+        evaluated = evaluate(value, env)
+
+        assert evaluated is not None
+        if type(evaluated) == Error:
+            if type(value) is ast.Identifier:
+                return [_new_error(_UNKNOW_IDENTIFIER, [value.value])]
+            elif type(value) is ast.CallList:
+                return [_new_error(_UNKNOW_IDENTIFIER, [value.list_identifier])]
+            else:
+                return [_new_error(_UNKNOW_IDENTIFIER, ["unknow identifier"])]
+
+        values.append(evaluated)
+    return values
+
+
+def _evaluate_expression(expressions: List[ast.Expression], env: Environment) -> List[Value]:
+    result: List[Value] = []
+
+    for expression in expressions:
+        evaluated = evaluate(expression, env)
+
+        assert evaluated is not None
+        result.append(evaluated)
+
+    return result
+
+
+def _evaluate_block_statement(block: ast.Block, env: Environment) -> Value:
+    result: Value = None
+
+    for statement in block.statements:
+        result = evaluate(statement, env)
+
+        if type(result) == Return or type(result) == Error:
+            return result
+
+    return result
+
+
+def _evaluate_program(program: ast.Program, env: Environment) -> Value:
+    result: Value = None
+
+    for statement in program.statements:
+        result = evaluate(statement, env)
+
+        if type(result) == Return:
+            return result.value
+        elif type(result) == Error:
+            return result
+
+    return result
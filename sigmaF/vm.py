@@ -0,0 +1,487 @@
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    Tuple
+)
+
+from sigmaF.ast import Program
+from sigmaF.builtins import BUILTIN_SYMBOLS
+from sigmaF.compiler import (
+    Bytecode,
+    compile_program,
+    CompileError,
+    FunctionCode,
+    Opcode
+)
+from sigmaF.evaluator import (
+    evaluate,
+    FALSE,
+    NULL,
+    TRUE,
+    _apply_function,
+    _check_arguments,
+    _check_output,
+    _check_type_tuple,
+    _evaluate_infix_expression,
+    _evaluate_prefix_expression,
+    _get_values_iter,
+    _new_error,
+    _NON_MODIFIABLE_VALUE,
+    _UNKNOW_IDENTIFIER
+)
+from sigmaF.object import (
+    Environment,
+    Error,
+    Float,
+    Function,
+    Integer,
+    new_integer,
+    Object,
+    Return,
+    ValueList
+)
+
+MAX_FRAMES = 100000
+
+Frame = Tuple[FunctionCode, int, List[Any], Dict[int, Object], Environment, Optional[Function]]
+
+_MAXIMUM_FRAMES = 'Maximum number of frames exceeded: {}'
+
+_UNBOUND: Any = object()
+
+_LOAD_CONST: int = Opcode.LOAD_CONST.value
+_LOAD_TRUE: int = Opcode.LOAD_TRUE.value
+_LOAD_FALSE: int = Opcode.LOAD_FALSE.value
+_LOAD_NONE: int = Opcode.LOAD_NONE.value
+_LOAD_NULL: int = Opcode.LOAD_NULL.value
+_LOAD_LOCAL: int = Opcode.LOAD_LOCAL.value
+_LOAD_LOCAL_OR_GLOBAL: int = Opcode.LOAD_LOCAL_OR_GLOBAL.value
+_LOAD_FREE: int = Opcode.LOAD_FREE.value
+_LOAD_GLOBAL: int = Opcode.LOAD_GLOBAL.value
+_STORE_LOCAL: int = Opcode.STORE_LOCAL.value
+_STORE_GLOBAL: int = Opcode.STORE_GLOBAL.value
+_ADD: int = Opcode.ADD.value
+_SUB: int = Opcode.SUB.value
+_MUL: int = Opcode.MUL.value
+_POW: int = Opcode.POW.value
+_MOD: int = Opcode.MOD.value
+_LT: int = Opcode.LT.value
+_GT: int = Opcode.GT.value
+_LE: int = Opcode.LE.value
+_GE: int = Opcode.GE.value
+_EQ: int = Opcode.EQ.value
+_NE: int = Opcode.NE.value
+_BINARY: int = Opcode.BINARY.value
+_NEGATE: int = Opcode.NEGATE.value
+_PREFIX: int = Opcode.PREFIX.value
+_POP: int = Opcode.POP.value
+_POP_OR_EXIT: int = Opcode.POP_OR_EXIT.value
+_POP_OR_JUMP: int = Opcode.POP_OR_JUMP.value
+_JUMP: int = Opcode.JUMP.value
+_JUMP_IF_NOT_TRUE: int = Opcode.JUMP_IF_NOT_TRUE.value
+_JUMP_IF_ERROR: int = Opcode.JUMP_IF_ERROR.value
+_MAKE_RETURN: int = Opcode.MAKE_RETURN.value
+_RETURN: int = Opcode.RETURN.value
+_MAKE_FUNCTION: int = Opcode.MAKE_FUNCTION.value
+_CALL: int = Opcode.CALL.value
+_CALL_CHECKED: int = Opcode.CALL_CHECKED.value
+_ITEM_CHECK: int = Opcode.ITEM_CHECK.value
+_BUILD_LIST: int = Opcode.BUILD_LIST.value
+_BUILD_TUPLE: int = Opcode.BUILD_TUPLE.value
+_CALL_LIST: int = Opcode.CALL_LIST.value
+
+_INFIX_OPERATORS: Dict[int, str] = {
+    _ADD: '+',
+    _SUB: '-',
+    _MUL: '*',
+    _POW: '**',
+    _MOD: '%',
+    _LT: '<',
+    _GT: '>',
+    _LE: '<=',
+    _GE: '>=',
+    _EQ: '==',
+    _NE: '!=',
+}
+
+
+def run(program: Program, env: Environment) -> Optional[Object]:
+    try:
+        bytecode: Bytecode = compile_program(program)
+    except CompileError:
+        return evaluate(program, env)
+
+    return execute(bytecode, env)
+
+
+def execute(bytecode: Bytecode, env: Environment) -> Optional[Object]:
+    return _run(bytecode.main, [], {}, env)
+
+
+def call_code(code: FunctionCode, env: Environment) -> Optional[Object]:
+    outer: Environment = env._outer
+
+    slots: List[Any] = [env._store.get(symbol, _UNBOUND) for symbol in code.local_symbols]
+    if len(code.free_names) == 0:
+        return _run(code, slots, {}, outer)
+
+    return _run(code, slots, outer._store, outer._outer)
+
+
+def _run(code: FunctionCode,
+         slots: List[Any],
+         captured: Dict[int, Object],
+         env: Environment) -> Optional[Object]:
+    stack: List[Any] = []
+    push = stack.append
+    pop = stack.pop
+    frames: List[Frame] = []
+    function: Optional[Function] = None
+
+    instructions: List[int] = code.instructions
+    unit: Bytecode = code.unit
+    constants: List[Object] = unit.constants
+    symbols: List[int] = unit.symbols
+    ip: int = 0
+
+    while True:
+        opcode: int = instructions[ip]
+
+        if opcode == _LOAD_LOCAL:
+            push(slots[instructions[ip + 1]])
+            ip += 2
+            continue
+
+        elif opcode == _LOAD_CONST:
+            push(constants[instructions[ip + 1]])
+            ip += 2
+            continue
+
+        elif opcode == _LOAD_GLOBAL:
+            symbol: int = symbols[instructions[ip + 1]]
+            store: Dict[int, Object] = env._store
+            if symbol in store:
+                push(store[symbol])
+            else:
+                push(_load_global(env, symbol, unit.names[instructions[ip + 1]]))
+            ip += 2
+            continue
+
+        elif opcode == _JUMP_IF_NOT_TRUE:
+            if pop() is TRUE:
+                ip += 2
+            else:
+                ip = instructions[ip + 1]
+            continue
+
+        elif opcode == _ADD or opcode == _SUB or opcode == _MUL or opcode == _MOD:
+            right = pop()
+            left = stack[-1]
+            value_type: type = type(left)
+
+            if value_type is type(right) and (value_type is Integer or value_type is Float):
+                new_value = new_integer if value_type is Integer else Float
+                if opcode == _ADD:
+                    stack[-1] = new_value(left.value + right.value)
+                elif opcode == _SUB:
+                    stack[-1] = new_value(left.value - right.value)
+                elif opcode == _MUL:
+                    stack[-1] = new_value(left.value * right.value)
+                else:
+                    stack[-1] = new_value(left.value % right.value)
+            else:
+                stack[-1] = _evaluate_infix_expression(_INFIX_OPERATORS[opcode], left, right)
+            ip += 1
+            continue
+
+        elif _LT <= opcode <= _NE:
+            right = pop()
+            left = stack[-1]
+            value_type = type(left)
+
+            if value_type is type(right) and (value_type is Integer or value_type is Float):
+                if opcode == _LT:
+                    result: bool = left.value < right.value
+                elif opcode == _GT:
+                    result = left.value > right.value
+                elif opcode == _LE:
+                    result = left.value <= right.value
+                elif opcode == _GE:
+                    result = left.value >= right.value
+                elif opcode == _EQ:
+                    result = left.value == right.value
+                else:
+                    result = left.value != right.value
+                stack[-1] = TRUE if result else FALSE
+            else:
+                stack[-1] = _evaluate_infix_expression(_INFIX_OPERATORS[opcode], left, right)
+            ip += 1
+            continue
+
+        elif opcode == _CALL or opcode == _CALL_CHECKED:
+            argc: int = instructions[ip + 1]
+            base: int = len(stack) - argc
+            callee = stack[base - 1]
+
+            checked: bool = False
+            if opcode == _CALL_CHECKED:
+                checked = type(callee) is Function \
+                    and callee.code is unit.functions[instructions[ip + 2]]
+                ip += 3
+            else:
+                ip += 2
+
+            args: List[Any] = stack[base:]
+            del stack[base - 1:]
+
+            callee_code = callee.code if type(callee) is Function else None
+            if not checked:
+                if type(callee_code) is not FunctionCode or callee_code.argcount != argc:
+                    push(_call(callee, args))
+                    continue
+
+                error = _check_arguments(callee, args)
+                if error is not None:
+                    push(error)
+                    continue
+
+            frames.append((code, ip, slots, captured, env, function))
+            if len(frames) > MAX_FRAMES:
+                raise RecursionError(_MAXIMUM_FRAMES.format(MAX_FRAMES))
+
+            code = callee_code
+            function = None if checked else callee
+            instructions = code.instructions
+            slots = args
+            if len(code.local_names) > argc:
+                slots.extend([_UNBOUND] * (len(code.local_names) - argc))
+
+            if len(code.free_names) == 0:
+                env = callee.env
+            else:
+                captured = callee.env._store
+                env = callee.env._outer
+
+            if code.unit is not unit:
+                unit = code.unit
+                constants = unit.constants
+                symbols = unit.symbols
+            ip = 0
+            continue
+
+        elif opcode == _POP_OR_EXIT:
+            value = pop()
+            if type(value) is not Error and type(value) is not Return:
+                ip += 1
+                continue
+
+        elif opcode == _RETURN:
+            value = pop()
+
+        elif opcode == _LOAD_FREE:
+            push(captured[symbols[instructions[ip + 1]]])
+            ip += 2
+            continue
+
+        elif opcode == _JUMP:
+            ip = instructions[ip + 1]
+            continue
+
+        elif opcode == _JUMP_IF_ERROR:
+            if type(stack[-1]) is Error:
+                ip = instructions[ip + 1]
+            else:
+                ip += 2
+            continue
+
+        elif opcode == _NEGATE:
+            right = stack[-1]
+            value_type = type(right)
+
+            if value_type is Integer:
+                stack[-1] = new_integer(-right.value)
+            elif value_type is Float:
+                stack[-1] = Float(-right.value)
+            else:
+                stack[-1] = _evaluate_prefix_expression('-', right)
+            ip += 1
+            continue
+
+        elif opcode == _POW:
+            right = pop()
+            stack[-1] = _evaluate_infix_expression('**', stack[-1], right)
+            ip += 1
+            continue
+
+        elif opcode == _LOAD_TRUE:
+            push(TRUE)
+            ip += 1
+            continue
+
+        elif opcode == _LOAD_FALSE:
+            push(FALSE)
+            ip += 1
+            continue
+
+        elif opcode == _LOAD_NULL:
+            push(NULL)
+            ip += 1
+            continue
+
+        elif opcode == _LOAD_NONE:
+            push(None)
+            ip += 1
+            continue
+
+        elif opcode == _LOAD_LOCAL_OR_GLOBAL:
+            value = slots[instructions[ip + 1]]
+            if value is _UNBOUND:
+                value = _load_global(env,
+                                     code.local_symbols[instructions[ip + 1]],
+                                     code.local_names[instructions[ip + 1]])
+            push(value)
+            ip += 2
+            continue
+
+        elif opcode == _STORE_LOCAL:
+            value = pop()
+            if slots[instructions[ip + 1]] is _UNBOUND:
+                slots[instructions[ip + 1]] = value
+                push(None)
+            else:
+                push(_new_error(_NON_MODIFIABLE_VALUE, [code.local_names[instructions[ip + 1]]]))
+            ip += 2
+            continue
+
+        elif opcode == _STORE_GLOBAL:
+            value = pop()
+            symbol = symbols[instructions[ip + 1]]
+            if symbol not in env._store:
+                env[symbol] = value
+                push(None)
+            else:
+                push(_new_error(_NON_MODIFIABLE_VALUE, [unit.names[instructions[ip + 1]]]))
+            ip += 2
+            continue
+
+        elif opcode == _POP:
+            pop()
+            ip += 1
+            continue
+
+        elif opcode == _POP_OR_JUMP:
+            if type(stack[-1]) is Error or type(stack[-1]) is Return:
+                ip = instructions[ip + 1]
+            else:
+                pop()
+                ip += 2
+            continue
+
+        elif opcode == _MAKE_RETURN:
+            stack[-1] = Return(stack[-1])
+            ip += 1
+            continue
+
+        elif opcode == _MAKE_FUNCTION:
+            function_code: FunctionCode = unit.functions[instructions[ip + 1]]
+            function_env: Environment = env
+
+            if len(function_code.free_names) > 0:
+                base = len(stack) - len(function_code.free_names)
+                function_env = Environment(outer=env)
+                function_env._store = dict(zip(function_code.free_symbols, stack[base:]))
+                del stack[base:]
+
+            push(Function(function_code.parameters,
+                          function_code.type_parameters,
+                          function_code.type_output,
+                          function_code.body,
+                          function_env,
+                          function_code))
+            ip += 2
+            continue
+
+        elif opcode == _BINARY:
+            right = pop()
+            stack[-1] = _evaluate_infix_expression(unit.names[instructions[ip + 1]], stack[-1], right)
+            ip += 2
+            continue
+
+        elif opcode == _PREFIX:
+            stack[-1] = _evaluate_prefix_expression(unit.names[instructions[ip + 1]], stack[-1])
+            ip += 2
+            continue
+
+        elif opcode == _ITEM_CHECK:
+            if type(stack[-1]) is Error:
+                del stack[len(stack) - instructions[ip + 1] - 1:]
+                push(_new_error(_UNKNOW_IDENTIFIER, [unit.names[instructions[ip + 2]]]))
+                ip = instructions[ip + 3]
+            else:
+                ip += 4
+            continue
+
+        elif opcode == _BUILD_LIST or opcode == _BUILD_TUPLE:
+            base = len(stack) - instructions[ip + 1]
+            values: List[Object] = stack[base:]
+            del stack[base:]
+
+            push(ValueList(values) if opcode == _BUILD_LIST else _check_type_tuple(values))
+            ip += 2
+            continue
+
+        elif opcode == _CALL_LIST:
+            base = len(stack) - instructions[ip + 1]
+            ranges: List[Object] = stack[base:]
+            iterable = stack[base - 1]
+            del stack[base - 1:]
+
+            push(_get_values_iter(iterable, ranges))
+            ip += 2
+            continue
+
+        else:
+            raise ValueError(f'Unknown opcode {opcode}')
+
+        if type(value) is Return:
+            value = value.value
+
+        if len(frames) == 0:
+            return value
+
+        assert value is not None
+        if function is not None:
+            value = _check_output(function, value)
+
+        code, ip, slots, captured, env, function = frames.pop()
+        instructions = code.instructions
+        if code.unit is not unit:
+            unit = code.unit
+            constants = unit.constants
+            symbols = unit.symbols
+        push(value)
+
+
+def _load_global(env: Environment, symbol: int, name: str) -> Object:
+    if symbol in env._store:
+        return env._store[symbol]
+    elif env._outer is None:
+        return BUILTIN_SYMBOLS.get(symbol, _new_error(_UNKNOW_IDENTIFIER, [name]))
+
+    try:
+        return env[symbol]
+    except KeyError:
+        return BUILTIN_SYMBOLS.get(symbol, _new_error(_UNKNOW_IDENTIFIER, [name]))
+
+
+def _call(function: Object, args: List[Object]) -> Object:
+    if type(function) is Error:
+        return function
+
+    error = _check_arguments(function, args)
+    if error is not None:
+        return error
+
+    return _check_output(function, _apply_function(function, args))
@@ -1,3 +1,7 @@
+from pickle import (
+    dumps,
+    loads
+)
 from unittest import TestCase
 
 from sigmaF.ast import (
@@ -8,6 +12,8 @@ from sigmaF.ast import (
     Integer,
     ReturnStatement,
 )
+from sigmaF.lexer import new_lexer
+from sigmaF.parser import Parser
 from sigmaF.token import (
     Token,
     TokenType
@@ -64,3 +70,19 @@ class ASTTest(TestCase):
         program_str = str(program)
 
         self.assertEquals(program_str, '5')
+
+
+    def test_compact_nodes(self) -> None:
+        source: str = 'let f = fn x::int -> list { => [x, -x, (x, x)](0); }; f(1 + 2);'
+        program: Program = Parser(new_lexer(source)).parse_program()
+
+        nodes = [program, *program.statements,
+                 program.statements[0].name, program.statements[1].expression]
+        for node in nodes:
+            self.assertFalse(hasattr(node, '__dict__'))
+
+        restored: Program = loads(dumps(program))
+        identifier: Identifier = restored.statements[0].name
+
+        self.assertEqual(str(restored), str(program))
+        self.assertEqual(identifier.symbol, program.statements[0].name.symbol)
@@ -0,0 +1,33 @@
+from unittest import TestCase
+from typing import (
+    Any,
+    Dict
+)
+
+from benchmarks.frontend import (
+    compare,
+    CORPORA,
+    run
+)
+from sigmaF.lexer import new_lexer
+from sigmaF.parser import Parser
+
+
+class BenchmarkTest(TestCase):
+
+    def test_corpora_parse_without_errors(self) -> None:
+        for corpus in CORPORA.values():
+            parser: Parser = Parser(new_lexer(corpus(10)))
+            program = parser.parse_program()
+
+            self.assertEqual(parser.errors, [])
+            self.assertGreater(len(program.statements), 0)
+
+    def test_run_and_compare(self) -> None:
+        report: Dict[str, Any] = run(['functions'], ['small'], 'regex', 1)
+        result: Dict[str, Any] = report['results'][0]
+
+        self.assertEqual(result['statements'], 100)
+        self.assertGreater(result['tokens_per_second'], 0)
+        self.assertGreater(result['parse_peak_bytes'], 0)
+        self.assertEqual(len(compare(report, report)), 1)
@@ -0,0 +1,85 @@
+import os
+
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from typing import (
+    cast,
+    List
+)
+
+from sigmaF.ast import (
+    LetStatement,
+    Program
+)
+from sigmaF.cache import (
+    cache_path,
+    CACHE_DIRECTORY,
+    load_program,
+    parse_module,
+    source_digest
+)
+from sigmaF.symbol import SYMBOLS
+
+
+class CacheTest(TestCase):
+
+    def test_parse_module_uses_cache(self) -> None:
+        source: str = 'let add = fn x::int, y::int -> int { => x + y; }; add(1, 2);'
+
+        with TemporaryDirectory() as directory:
+            path: str = os.path.join(directory, 'module.sf')
+
+            self.assertIsNone(load_program(path, source))
+
+            program, errors = parse_module(source, path)
+            self.assertEqual(errors, [])
+            self.assertTrue(os.path.exists(cache_path(path, source_digest(source))))
+
+            cached = load_program(path, source)
+            assert cached is not None
+            self.assertIsNot(cached, program)
+            self.assertEqual(str(cached), str(program))
+
+            statement = cast(LetStatement, cached.statements[0])
+            assert statement.name is not None
+            self.assertEqual(statement.name.symbol, SYMBOLS.intern('add'))
+
+    def test_invalidation(self) -> None:
+        with TemporaryDirectory() as directory:
+            path: str = os.path.join(directory, 'module.sf')
+
+            parse_module('let a = 1;', path)
+            parse_module('let a = 2;', path)
+
+            entries: List[str] = os.listdir(os.path.join(directory, CACHE_DIRECTORY))
+            self.assertEqual(entries, [os.path.basename(
+                cache_path(path, source_digest('let a = 2;')))])
+            self.assertIsNone(load_program(path, 'let a = 1;'))
+
+    def test_corrupt_entry(self) -> None:
+        source: str = 'let a = 1;'
+
+        with TemporaryDirectory() as directory:
+            path: str = os.path.join(directory, 'module.sf')
+            parse_module(source, path)
+
+            filename: str = cache_path(path, source_digest(source))
+            with open(filename, mode='r+b') as fout:
+                fout.seek(-4, os.SEEK_END)
+                fout.write(b'\x00\x00\x00\x00')
+
+            self.assertIsNone(load_program(path, source))
+            self.assertFalse(os.path.exists(filename))
+
+            program, errors = parse_module(source, path)
+            self.assertIsInstance(program, Program)
+            self.assertEqual(errors, [])
+
+    def test_parse_errors_are_not_cached(self) -> None:
+        with TemporaryDirectory() as directory:
+            path: str = os.path.join(directory, 'module.sf')
+
+            _, errors = parse_module('let = 1;', path)
+
+            self.assertGreater(len(errors), 0)
+            self.assertFalse(os.path.exists(os.path.join(directory, CACHE_DIRECTORY)))
@@ -0,0 +1,117 @@
+from typing import (
+    cast,
+    List
+)
+from unittest import TestCase
+
+from sigmaF.ast import (
+    Call,
+    ExpressionStatement,
+    LetStatement,
+    Program,
+    ReturnStatement
+)
+from sigmaF.checker import TypeChecker
+from sigmaF.evaluator import evaluate
+from sigmaF.lexer import new_lexer
+from sigmaF.object import Environment
+from sigmaF.parser import Parser
+
+
+class CheckerTest(TestCase):
+
+    def test_checked_calls(self) -> None:
+        source: str = '''
+            let fibonacci = fn n::int -> int {
+                if n <= 2 then {
+                    => 1;
+                }
+                else {
+                    => fibonacci(n - 2) + fibonacci(n - 1);
+                }
+            }
+            let is_prime_number = fn x::int, i::int -> bool {
+                if x <= 1 then {=> false;}
+                if x == i then {=> true;}
+                if (x % i) == 0 then {=> false;}
+                => is_prime_number(x, i + 1);
+            }
+            fibonacci(15);
+            is_prime_number(97, 2);
+            is_prime_number(97, 2.0);
+        '''
+        program: Program = self._parse(source)
+        checker: TypeChecker = TypeChecker()
+
+        self.assertEqual(checker.check(program), 5)
+        self.assertEqual(checker.errors, [])
+
+        calls: List[Call] = [cast(ExpressionStatement, statement).expression
+                             for statement in program.statements[2:]]
+        self.assertIsNotNone(calls[0].signature)
+        self.assertIsNotNone(calls[1].signature)
+        self.assertIsNone(calls[2].signature)
+
+        env: Environment = Environment()
+        self.assertEqual(evaluate(program, env).inspect(),
+                         ' [Error] Arguments wrongs: The function expected to receive types int, and int and receives int, and float')
+        self.assertEqual(evaluate(self._parse('fibonacci(15);'), env).inspect(), '610')
+
+    def test_unproven_calls(self) -> None:
+        source: str = '''
+            let half = fn n::int -> int { => n / 2; }
+            let last = fn n::int -> int { if n > 0 then {=> n;} }
+            let first = fn l::list -> int { => l[0]; }
+            let wrong = fn n::int -> str { => n + 1; }
+            let length = fn l::list -> int { => 0; }
+            let twice = fn f::function, x::int -> int { => f(f(x)); }
+            half(4);
+            last(1);
+            first([1]);
+            wrong(1);
+            length([1]);
+            twice(last, 1);
+        '''
+        program: Program = self._parse(source)
+        checker: TypeChecker = TypeChecker()
+
+        self.assertEqual(checker.check(program), 0)
+        self.assertEqual(checker.errors, [
+            'Output wrongs: The function wrong expected to return type str and return int'
+        ])
+
+    def test_calls_without_arguments(self) -> None:
+        program: Program = self._parse('''
+            let f = fn x::int -> int { => 1; };
+            f();
+        ''')
+        checker: TypeChecker = TypeChecker()
+
+        self.assertEqual(checker.check(program), 0)
+        self.assertEqual(checker.errors, [])
+        self.assertIsNone(cast(ExpressionStatement, program.statements[1]).expression.signature)
+
+    def test_bound_names_are_not_trusted(self) -> None:
+        env: Environment = Environment()
+        evaluate(self._parse('let f = fn x::int -> str { => "a"; };'), env)
+
+        program: Program = self._parse('''
+            let g = fn x::int -> int { => x; };
+            let f = fn x::int -> int { => g(x); };
+            f(1);
+        ''')
+
+        self.assertEqual(TypeChecker(env).check(program), 1)
+
+        function = cast(LetStatement, program.statements[1]).value
+        call = cast(ReturnStatement, function.body.statements[0]).return_value
+        self.assertIsNotNone(call.signature)
+        self.assertIsNone(cast(ExpressionStatement, program.statements[2]).expression.signature)
+
+    def _parse(self, source: str) -> Program:
+        parser: Parser = Parser(new_lexer(source))
+        program: Program = parser.parse_program()
+
+        self.assertEqual(parser.errors, [])
+
+        return program
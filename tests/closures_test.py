@@ -0,0 +1,6 @@
+import tests.evaluator_test as evaluator_test
+
+
+class ClosuresEvaluatorTest(evaluator_test.EvaluatorTest):
+
+    engine: str = 'closures'
@@ -8,12 +8,16 @@ from typing import (
 from unittest import TestCase
 
 from sigmaF.ast import Program
+from sigmaF.checker import check_types
 from sigmaF.evaluator import (
     evaluate,
+    evaluate_statements,
     NULL
 )
 from sigmaF.lexer import Lexer
 from sigmaF.parser import Parser
+from sigmaF.repl import ENGINES
+from sigmaF.resolver import resolve_names
 from sigmaF.object import (
     Boolean,
     Float,
@@ -28,8 +32,110 @@ from sigmaF.object import (
 )
 
 
+DIFFERENTIAL_PROGRAMS: List[str] = [
+    '''
+        let fibonacci = fn n::int -> int {
+            if n <= 2 then {
+                => 1;
+            }
+            else {
+                => fibonacci(n - 2) + fibonacci(n - 1);
+            }
+        }
+        fibonacci(15);
+    ''',
+    '''
+        let make = fn values::list, n::int -> function {
+            let m = n * 2;
+            => fn x::int -> int { => x + m + length(values); };
+        };
+        make([1, 2], 5)(1) + 3 / 2;
+    ''',
+    '''
+        let make = fn values::list, n::int -> function {
+            let m = n * 2;
+            => fn a::int -> function {
+                => fn x::int -> int { => x + a + m + length(values); };
+            };
+        };
+        make([1, 2], 5)(1)(3) + 3 / 2;
+    ''',
+    '''
+        let m = 7;
+        let f = fn n::int -> int {
+            if n > 0 then {
+                let m = n;
+            }
+            => m;
+        };
+        f(1) + f(0);
+    ''',
+    '''
+        let f = fn n::int -> int {
+            let x = if n > 0 then {=> n;} else {5 + true; 1};
+            => x;
+        };
+        f(0);
+    ''',
+    '''
+        let f = fn n::int -> int { let n = 2; => n; };
+        f(1);
+    ''',
+    '''
+        let head = fn l::list -> list {=> [l[0]];}
+        head([(1, 2), (3, 4)]) + [(1.5 ** 2.0, 7.0 % 2.0)];
+    ''',
+    '''
+        let count = fn n::int, acc::int -> int {
+            if n == 0 then {
+                => acc;
+            }
+            => count(n - 1, acc + 1);
+        };
+        count(100, 0);
+    ''',
+    'let a = 1; let a = 2;',
+    'let f = fn x::int -> str { => x; }; f(1);',
+    'let f = fn x::int -> int { => x; }; f(1.5);',
+    'let f = fn x::str -> bool { => x == "a" || false; }; f("a");',
+    'let f = fn a::float -> float { => a ** 0.5; }; f(-1.0);',
+    'let f = fn a::float -> float { => a ** 0.5 + 1.0; }; f(-4.0);',
+    'let f = fn x::int -> int { => x ** -1; }; f(2);',
+    'let f = fn x::int -> int { let y = x ** -1; => y * 4; }; f(2);',
+    'unknown(1, 2);',
+    '[missing];',
+    '(missing, 1);',
+    '[1, 2, 3][0, 2];',
+    '[1000, 2000] == [1000, 2000];',
+    '[1000, 2000] == [1000, 2001];',
+    '[1, 2] != [1, 2];',
+    'if not(false) then { 2 ** 10; } else { -1 };',
+    '["a", "b"][1] + "c" == "bc" && 1 < 2;',
+    '"a" + "b" == "ab" && 1 < 2.0;',
+    '7 / 0 + -(2);',
+    '1 + 2.0;',
+    'true + true;',
+    '5(1);',
+    'if (1 > 2) then {=> 1} + 1;',
+    'if (1 > 2) then {1};',
+]
+
+
+def parse_program(source: str, resolve: bool = True) -> Program:
+    program: Program = Parser(Lexer(source)).parse_program()
+
+    if resolve:
+        check_types(program)
+        resolve_names(program)
+
+    return program
+
+
 class EvaluatorTest(TestCase):
 
+    engine: str = 'tree'
+    resolutions: Tuple[bool, ...] = (False, True)
+
     def test_boolean_evaluation(self) -> None:
         tests: List[Tuple[str, bool]] = [
             ('true', True),
@@ -277,6 +383,7 @@ class EvaluatorTest(TestCase):
             ('length("");', 0),
             ('length("Hello, World!");', 13),
             ('length("Supercalifragilisticexpialidocious");', 34),
+            ('length("tab\\there\\n");', 9),
             ('length(1);', 'Argument to length without support, it was received a INTEGER'),
             ('length("one", "two");',
              'Incorrect Number of arguments for length, it was received 2 arguments, and is needed only 1')
@@ -415,6 +522,26 @@ class EvaluatorTest(TestCase):
             evaluated = self._evaluate_tests(source)
             self._test_boolean_object(evaluated, expected)
 
+    def test_list_equality(self) -> None:
+        tests: List[Tuple[str, bool]] = [
+            ('[1, 2] == [1, 2];', True),
+            ('[1000, 2000] == [1000, 2000];', True),
+            ('[1000, 2000] != [1000, 2000];', False),
+            ('[1000, 2000] == [1000, 2001];', False),
+            ('[1.5, 2.5] == [1.5, 2.5];', True),
+            ('["a", "b"] == ["a", "b"];', True),
+            ('[true] == [false];', False),
+            ('[[1, 2], [3]] == [[1, 2], [3]];', True),
+            ('[(1, 2)] == [(1, 2)];', True),
+            ('[1, 2] == [1, 2, 3];', False),
+            ('[1] == [1.0];', False),
+            ('[] == [];', True),
+        ]
+
+        for source, expected in tests:
+            evaluated = self._evaluate_tests(source)
+            self._test_boolean_object(evaluated, expected)
+
     def test_empy_list(self) -> None:
         tests: List[Tuple[str, list]] = [
             ('[] + []', []),
@@ -426,6 +553,30 @@ class EvaluatorTest(TestCase):
             evaluated = self._evaluate_tests(source)
             self._test_list_object(evaluated, expected)
 
+    def test_evaluate_statements(self) -> None:
+        source: str = '''
+            let double = fn x::int -> int { => x * 2; };
+            let a = double(4);
+            a + 1;
+        '''
+        parser: Parser = Parser(Lexer(source))
+        env: Environment = Environment()
+
+        evaluated = evaluate_statements(parser.iter_statements(), env)
+
+        assert evaluated is not None
+        self._test_integer_object(evaluated, 9)
+
+    def test_same_results_as_evaluator(self) -> None:
+        for source in DIFFERENTIAL_PROGRAMS:
+            for resolve in self.resolutions:
+                expected = evaluate(parse_program(source, False), Environment())
+                evaluated = ENGINES[self.engine](parse_program(source, resolve), Environment())
+
+                assert expected is not None and evaluated is not None
+                self.assertEqual(type(evaluated), type(expected), source)
+                self.assertEqual(evaluated.inspect(), expected.inspect(), source)
+
     def _test_error_object(self, evaluated: Object, expected: str) -> None:
         self.assertIsInstance(evaluated, Error)
 
@@ -438,7 +589,7 @@ class EvaluatorTest(TestCase):
         program: Program = parser.parse_program()
         env: Environment = Environment()
 
-        evaluated = evaluate(program, env)
+        evaluated = ENGINES[self.engine](program, env)
 
         assert evaluated is not None
         return evaluated
@@ -0,0 +1,102 @@
+import os
+
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from typing import (
+    List,
+    Tuple
+)
+
+from sigmaF.incremental import (
+    IncrementalFrontEnd,
+    ModuleDiff,
+    split_definitions
+)
+from sigmaF.object import Environment
+from sigmaF.repl import (
+    ENGINES,
+    update
+)
+from sigmaF.symbol import SYMBOLS
+
+
+class IncrementalTest(TestCase):
+
+    def test_split_definitions(self) -> None:
+        source: str = '''printLn("let");
+let a = 1;
+let f = fn x::int -> int {
+    let b = x; -- let c = )
+    => b;
+}
+let g = "{";'''
+
+        spans: List[Tuple[int, int]] = split_definitions(source)
+        texts: List[str] = [source[start:end] for start, end in spans]
+
+        self.assertEqual(len(spans), 4)
+        self.assertEqual(texts[0], 'printLn("let");\n')
+        self.assertEqual(texts[1], 'let a = 1;\n')
+        self.assertTrue(texts[2].startswith('let f = fn'))
+        self.assertEqual(texts[3], 'let g = "{";')
+
+    def test_update_diff(self) -> None:
+        front_end: IncrementalFrontEnd = IncrementalFrontEnd()
+
+        diff: ModuleDiff = front_end.update('let a = 1;\nlet b = 2;\nlet c = 3;')
+        self.assertEqual(diff.added, ['a', 'b', 'c'])
+        self.assertEqual(diff.removed, [])
+        self.assertEqual(diff.changed, [])
+        self.assertEqual(len(diff.statements), 3)
+
+        definitions = front_end.definitions
+        diff = front_end.update('let a = 1;\nlet b = 20;\nlet d = 4;')
+        self.assertEqual(diff.added, ['d'])
+        self.assertEqual(diff.removed, ['c'])
+        self.assertEqual(diff.changed, ['b'])
+        self.assertEqual([str(statement) for statement in diff.statements],
+                         ['let b = 20;', 'let d = 4;'])
+        self.assertIs(front_end.definitions[0].statements[0],
+                      definitions[0].statements[0])
+
+        diff = front_end.update('let a = 1;\nlet b = 20;\nlet d = 4;')
+        self.assertEqual(diff, ModuleDiff([], [], [], []))
+        self.assertEqual(str(front_end.program),
+                         'let a = 1;let b = 20;let d = 4;')
+
+    def test_update_dependents(self) -> None:
+        front_end: IncrementalFrontEnd = IncrementalFrontEnd()
+
+        front_end.update('let a = 1;\nlet b = a * 2;\nlet c = b + 1;\nlet d = 4;')
+        diff: ModuleDiff = front_end.update('let a = 5;\nlet b = a * 2;\nlet c = b + 1;\nlet d = 4;')
+
+        self.assertEqual(diff.changed, ['a'])
+        self.assertEqual([str(statement) for statement in diff.statements],
+                         ['let a = 5;', 'let b = (a * 2);', 'let c = (b + 1);'])
+
+    def test_update_environment(self) -> None:
+        with TemporaryDirectory() as directory:
+            for engine in ENGINES:
+                path: str = os.path.join(directory, f'{engine}.sf')
+                env: Environment = Environment()
+
+                for value, expected in (('1', '3'), ('10', '21')):
+                    with open(path, 'w', encoding='utf-8') as fout:
+                        fout.write(f'let a = {value};\nlet b = a * 2;\nlet c = b + 1;')
+
+                    env = update(path, env, engine)
+
+                    self.assertEqual(env[SYMBOLS.intern('c')].inspect(), expected, engine)
+
+    def test_update_errors(self) -> None:
+        front_end: IncrementalFrontEnd = IncrementalFrontEnd()
+
+        front_end.update('let a = 1;\nlet = 2;')
+        self.assertGreater(len(front_end.errors), 0)
+        self.assertTrue(front_end.errors[0].startswith('Line 2, column 5: '))
+
+        front_end.update('let z = 0;\nlet a = 1;\nlet = 2;')
+        self.assertTrue(front_end.errors[0].startswith('Line 3, column 5: '))
+
+        front_end.update('let a = 1;\nlet b = 2;')
+        self.assertEqual(front_end.errors, [])
@@ -0,0 +1,95 @@
+import pickle
+
+from typing import List
+from unittest import TestCase
+
+from sigmaF.ast import (
+    Call,
+    Infix,
+    iter_nodes,
+    Program
+)
+from sigmaF.evaluator import (
+    evaluate,
+    inline_cache_statistics
+)
+from sigmaF.lexer import Lexer
+from sigmaF.object import (
+    Environment,
+    Integer,
+    String
+)
+from sigmaF.parser import Parser
+from sigmaF.symbol import SYMBOLS
+
+
+class InlineCacheTest(TestCase):
+
+    def test_counters(self) -> None:
+        program: Program = self._parse('''
+            let sum = fn n::int -> int {
+                if n == 0 then {=> 0;}
+                => n + sum(n - 1);
+            };
+            sum(10);
+        ''')
+
+        self.assertEqual(inline_cache_statistics(program), (0, 0))
+        self.assertEqual(evaluate(program, Environment()).inspect(), '55')
+        self.assertEqual(inline_cache_statistics(program), (37, 5))
+
+    def test_guard_failures(self) -> None:
+        program: Program = self._parse('x + x;')
+        tests: List[tuple] = [
+            (Integer(2), '4'),
+            (String('a'), 'aa'),
+            (String('b'), 'bb'),
+            (Integer(3), '6'),
+        ]
+
+        for value, expected in tests:
+            env: Environment = Environment()
+            env[SYMBOLS.intern('x')] = value
+
+            self.assertEqual(evaluate(program, env).inspect(), expected)
+
+        self.assertEqual(inline_cache_statistics(program), (1, 3))
+
+    def test_call_guard_failures(self) -> None:
+        program: Program = self._parse('f(1);')
+        double: Program = self._parse('let f = fn x::int -> int { => x * 2; };')
+        tests: List[tuple] = [
+            (double, '2'),
+            (double, '2'),
+            (self._parse('let f = fn x::int -> str { => x; };'),
+             'Output wrongs: The function expected to return type str and return int'),
+            (self._parse('let f = fn x::str -> str { => x; };'),
+             'Arguments wrongs: The function expected to receive types str and receives int'),
+            (self._parse('let f = length;'), 'Argument to length without support'),
+        ]
+
+        for definition, expected in tests:
+            env: Environment = Environment()
+            evaluate(definition, env)
+
+            self.assertIn(expected, evaluate(program, env).inspect())
+
+        self.assertEqual(inline_cache_statistics(program), (1, 3))
+
+    def test_caches_are_not_serialized(self) -> None:
+        program: Program = self._parse('let f = fn x::int -> int { => x + 1; }; f(1);')
+        evaluate(program, Environment())
+
+        loaded: Program = pickle.loads(pickle.dumps(program))
+
+        for node in iter_nodes(loaded):
+            if type(node) in (Infix, Call):
+                self.assertIsNone(node.cache)
+
+    def _parse(self, source: str) -> Program:
+        parser: Parser = Parser(Lexer(source))
+        program: Program = parser.parse_program()
+
+        self.assertEqual(parser.errors, [])
+
+        return program
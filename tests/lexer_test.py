@@ -1,10 +1,26 @@
+from io import (
+    BytesIO,
+    StringIO
+)
+from mmap import (
+    ACCESS_READ,
+    mmap
+)
+from tempfile import TemporaryFile
 from unittest import TestCase
 from typing import List
+from sigmaF.symbol import SYMBOLS
 from sigmaF.token import (
     Token,
     TokenType
 )
-from sigmaF.lexer import Lexer
+from sigmaF.lexer import (
+    Lexer,
+    RegexLexer,
+    StreamLexer,
+    TokenBuffer,
+    TokenBufferLexer
+)
 
 
 class LexerTest(TestCase):
@@ -103,7 +119,7 @@ class LexerTest(TestCase):
             Token(TokenType.LET, 'let'),
             Token(TokenType.IDENT, 'y'),
             Token(TokenType.ASSIGN, '='),
-            Token(TokenType.STRING, '"cinco"'),
+            Token(TokenType.STRING, 'cinco'),
             Token(TokenType.SEMICOLON, ';'),
             Token(TokenType.LET, 'let'),
             Token(TokenType.IDENT, 'foo'),
@@ -232,3 +248,188 @@ class LexerTest(TestCase):
             Token(TokenType.INT, '10'),
         ]
         self.assertEquals(tokens, expected_tokens)
+
+    def test_regex_lexer_matches_character_lexer(self) -> None:
+        sources: List[str] = [
+            '¡¿@',
+            '=+-/*<>%',
+            '(){}[],;',
+            'let y = "cinco"; let foo = 5.0; let bar = 5.;',
+            'let sum = fn x::int, y::int -> int { => x + y }',
+            'if 5 < 10 then true else false',
+            '10 == 10 != 10 >= 10 <= 10 ** 10 || 10 && 10',
+            '"unterminated string : | & !',
+            'let empty = ""; let spaced = "a b\\n c";',
+        ]
+
+        for source in sources:
+            expected_tokens: List[Token] = self._all_tokens(Lexer(source))
+            tokens: List[Token] = self._all_tokens(RegexLexer(source))
+
+            self.assertEqual(tokens, expected_tokens)
+
+    def test_stream_lexer_across_chunk_boundaries(self) -> None:
+        source: str = 'let saludo = "¡hola, mundo!";\nlet pi = 3.14159;\n' + \
+            'let sum = fn x::int, y::int -> int { => x ** y >= 10 && x != y };'
+        expected_tokens: List[Token] = self._all_tokens(RegexLexer(source))
+
+        for chunk_size in range(1, 12):
+            text_lexer: Lexer = StreamLexer(StringIO(source), chunk_size)
+            bytes_lexer: Lexer = StreamLexer(
+                BytesIO(source.encode('utf-8')), chunk_size)
+
+            self.assertEqual(self._all_tokens(text_lexer), expected_tokens)
+            self.assertEqual(self._all_tokens(bytes_lexer), expected_tokens)
+
+    def test_stream_lexer_over_mmap(self) -> None:
+        source: str = 'let x = [1, 2, 3];\nlet y = "cinco";\n' * 50
+
+        with TemporaryFile() as fout:
+            fout.write(source.encode('utf-8'))
+            fout.flush()
+
+            with mmap(fout.fileno(), 0, access=ACCESS_READ) as mapped:
+                tokens: List[Token] = self._all_tokens(
+                    StreamLexer(mapped, chunk_size=7))
+
+        self.assertEqual(tokens, self._all_tokens(RegexLexer(source)))
+
+    def test_comments(self) -> None:
+        source: str = '''
+            -- single line comment
+            let x = 5; -- trailing comment
+            /* multiline
+               comment */
+            let y = x / 2 * 3 /* inline */ - 1;
+            let s = "-- not a comment";
+            /* unterminated
+        '''
+        expected_tokens: List[Token] = [
+            Token(TokenType.LET, 'let'),
+            Token(TokenType.IDENT, 'x'),
+            Token(TokenType.ASSIGN, '='),
+            Token(TokenType.INT, '5'),
+            Token(TokenType.SEMICOLON, ';'),
+            Token(TokenType.LET, 'let'),
+            Token(TokenType.IDENT, 'y'),
+            Token(TokenType.ASSIGN, '='),
+            Token(TokenType.IDENT, 'x'),
+            Token(TokenType.DIVISION, '/'),
+            Token(TokenType.INT, '2'),
+            Token(TokenType.MULTIPLICATION, '*'),
+            Token(TokenType.INT, '3'),
+            Token(TokenType.MINUS, '-'),
+            Token(TokenType.INT, '1'),
+            Token(TokenType.SEMICOLON, ';'),
+            Token(TokenType.LET, 'let'),
+            Token(TokenType.IDENT, 's'),
+            Token(TokenType.ASSIGN, '='),
+            Token(TokenType.STRING, '-- not a comment'),
+            Token(TokenType.SEMICOLON, ';'),
+            Token(TokenType.DIVISION, '/'),
+            Token(TokenType.MULTIPLICATION, '*'),
+            Token(TokenType.IDENT, 'unterminated'),
+        ]
+
+        self.assertEqual(self._all_tokens(Lexer(source)), expected_tokens)
+        self.assertEqual(self._all_tokens(RegexLexer(source)), expected_tokens)
+        self.assertEqual(list(TokenBuffer(source))[:-1], expected_tokens)
+        for chunk_size in range(1, 8):
+            self.assertEqual(self._all_tokens(
+                StreamLexer(StringIO(source), chunk_size)), expected_tokens)
+
+    def test_keep_comments(self) -> None:
+        source: str = 'let x = 5; -- trailing\n/* multi\nline */ x'
+
+        expected_tokens: List[Token] = [
+            Token(TokenType.LET, 'let'),
+            Token(TokenType.IDENT, 'x'),
+            Token(TokenType.ASSIGN, '='),
+            Token(TokenType.INT, '5'),
+            Token(TokenType.SEMICOLON, ';'),
+            Token(TokenType.COMMENT, '-- trailing'),
+            Token(TokenType.COMMENT, '/* multi\nline */'),
+            Token(TokenType.IDENT, 'x'),
+        ]
+
+        self.assertEqual(self._all_tokens(
+            Lexer(source, keep_comments=True)), expected_tokens)
+        self.assertEqual(self._all_tokens(
+            RegexLexer(source, keep_comments=True)), expected_tokens)
+        self.assertEqual(self._all_tokens(StreamLexer(
+            StringIO(source), 3, keep_comments=True)), expected_tokens)
+
+    def test_identifiers_are_interned(self) -> None:
+        lexer: Lexer = RegexLexer('let foo = fn x::int -> int { => foo }; foo')
+        tokens: List[Token] = self._all_tokens(lexer)
+        identifiers: List[Token] = [
+            token for token in tokens if token.literal == 'foo']
+
+        self.assertEqual(len(identifiers), 3)
+        self.assertIs(identifiers[0].literal, identifiers[1].literal)
+        self.assertIs(identifiers[0].literal, identifiers[2].literal)
+        self.assertEqual(SYMBOLS.intern('foo'), SYMBOLS.intern('f' + 'oo'))
+        self.assertEqual(SYMBOLS.name(SYMBOLS.intern('foo')), 'foo')
+        self.assertEqual(SYMBOLS.token_type(SYMBOLS.intern('let')), TokenType.LET)
+        self.assertEqual(SYMBOLS.token_type(SYMBOLS.intern('int')), TokenType.CLASSNAME)
+        self.assertEqual(SYMBOLS.token_type(SYMBOLS.intern('foo')), TokenType.IDENT)
+
+    def test_string_escapes(self) -> None:
+        source: str = r'let s = "tab\there\n"; let e = ""; "plain"'
+        expected_tokens: List[Token] = [
+            Token(TokenType.LET, 'let'),
+            Token(TokenType.IDENT, 's'),
+            Token(TokenType.ASSIGN, '='),
+            Token(TokenType.STRING, 'tab\there\n'),
+            Token(TokenType.SEMICOLON, ';'),
+            Token(TokenType.LET, 'let'),
+            Token(TokenType.IDENT, 'e'),
+            Token(TokenType.ASSIGN, '='),
+            Token(TokenType.STRING, ''),
+            Token(TokenType.SEMICOLON, ';'),
+            Token(TokenType.STRING, 'plain'),
+        ]
+
+        self.assertEqual(self._all_tokens(Lexer(source)), expected_tokens)
+        self.assertEqual(self._all_tokens(RegexLexer(source)), expected_tokens)
+        self.assertEqual(list(TokenBuffer(source))[:-1], expected_tokens)
+
+    def test_token_buffer(self) -> None:
+        source: str = 'let x = 5;\n  let y = "cinco";\nx ** 2'
+        tokens: TokenBuffer = TokenBuffer(source)
+
+        self.assertEqual(len(tokens), 14)
+        self.assertEqual(list(tokens)[:-1], self._all_tokens(RegexLexer(source)))
+        self.assertEqual(tokens[8], Token(TokenType.STRING, 'cinco'))
+        self.assertEqual(tokens.token_type(13), TokenType.EOF)
+        self.assertEqual(tokens.span(8), (21, 28))
+        self.assertEqual(tokens.position(0), (1, 1))
+        self.assertEqual(tokens.position(5), (2, 3))
+        self.assertEqual(tokens.position(10), (3, 1))
+        self.assertEqual(tokens.position(11), (3, 3))
+
+    def test_token_buffer_lexer(self) -> None:
+        source: str = 'let sum = fn x::int -> int { => x + 1 }'
+        lexer: TokenBufferLexer = TokenBufferLexer(source)
+
+        self.assertEqual(self._all_tokens(lexer),
+                         self._all_tokens(RegexLexer(source)))
+        self.assertEqual(lexer.next_token(), Token(TokenType.EOF, ''))
+        self.assertEqual(lexer.current_position(), (1, 40))
+        self.assertEqual(lexer.current_position(1), (1, 39))
+        self.assertIsNone(RegexLexer(source).current_position())
+
+    def test_token_buffer_slice(self) -> None:
+        source: str = 'let x = 5;\nlet y = x;\n'
+        tokens: TokenBuffer = TokenBuffer(source, start=11, end=21)
+
+        self.assertEqual(list(tokens)[:-1], self._all_tokens(RegexLexer(source[11:21])))
+        self.assertEqual(tokens.position(0), (2, 1))
+        self.assertEqual(tokens.position(len(tokens) - 1), (2, 11))
+
+    def _all_tokens(self, lexer: Lexer) -> List[Token]:
+        tokens: List[Token] = []
+        while (token := lexer.next_token()).token_type != TokenType.EOF:
+            tokens.append(token)
+
+        return tokens
@@ -0,0 +1,80 @@
+from typing import List
+from unittest import TestCase
+
+from sigmaF.ast import Program
+from sigmaF.builtins import BUILTIN
+from sigmaF.evaluator import (
+    evaluate,
+    NULL,
+    TRUE
+)
+from sigmaF.lexer import Lexer
+from sigmaF.object import (
+    EMPTY_LIST,
+    Environment,
+    FALSE,
+    Integer,
+    new_integer,
+    Object,
+    SMALL_INTEGER_MAX,
+    SMALL_INTEGER_MIN,
+    String
+)
+from sigmaF.parser import Parser
+
+
+class ObjectTest(TestCase):
+
+    def test_small_integers(self) -> None:
+        for value in (SMALL_INTEGER_MIN, 0, 1, SMALL_INTEGER_MAX):
+            self.assertIs(new_integer(value), new_integer(value))
+            self.assertEqual(new_integer(value).value, value)
+
+        for value in (SMALL_INTEGER_MIN - 1, SMALL_INTEGER_MAX + 1, 10 ** 20):
+            self.assertIsNot(new_integer(value), new_integer(value))
+            self.assertEqual(new_integer(value).value, value)
+
+        self.assertEqual(new_integer(2.0).value, 2.0)
+        self.assertIs(type(new_integer(0.5).value), float)
+
+    def test_shared_values(self) -> None:
+        program: Program = self._parse('''
+            let a = 40 + 2;
+            let b = 6 * 7;
+            let c = 2000 + 1;
+            let d = "text";
+            let e = [];
+        ''')
+        env: Environment = Environment()
+
+        evaluate(program, env)
+        values: List[Object] = self._values(env)
+
+        self.assertIs(values[0], values[1])
+        self.assertIs(values[4], EMPTY_LIST)
+        self.assertIsInstance(values[3], String)
+
+        again: Environment = Environment()
+        evaluate(program, again)
+
+        self.assertIs(self._values(again)[3], values[3])
+        self.assertIsNot(self._values(again)[2], values[2])
+
+    def test_builtin_singletons(self) -> None:
+        self.assertIs(BUILTIN['printLn'].fn(Integer(1)), NULL)
+        self.assertIs(BUILTIN['not'].fn(FALSE), TRUE)
+
+        evaluated = evaluate(self._parse('if not(false) then { 1; } else { 2; };'), Environment())
+
+        self.assertEqual(evaluated.inspect(), '1')
+
+    def _values(self, env: Environment) -> List[Object]:
+        return list(env._store.values())
+
+    def _parse(self, source: str) -> Program:
+        parser: Parser = Parser(Lexer(source))
+        program: Program = parser.parse_program()
+
+        self.assertEqual(parser.errors, [])
+
+        return program
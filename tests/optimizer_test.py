@@ -0,0 +1,75 @@
+from typing import (
+    List,
+    Tuple
+)
+from unittest import TestCase
+
+from sigmaF.ast import Program
+from sigmaF.evaluator import evaluate
+from sigmaF.lexer import new_lexer
+from sigmaF.object import Environment
+from sigmaF.optimizer import fold_constants
+from sigmaF.parser import Parser
+
+
+class OptimizerTest(TestCase):
+
+    def test_fold_constants(self) -> None:
+        tests: List[Tuple[str, str, int]] = [
+            ('60 * 60 * 24;', '86400', 2),
+            ('"a" + "b";', '"ab"', 1),
+            ('-(2.0) ** 2.0;', '4.0', 2),
+            ('7 / 2 > 3.0;', 'true', 2),
+            ('7 / 2 > 3;', '(3.5 > 3)', 1),
+            ('5 % 0;', '(5 % 0)', 0),
+            ('1 + x * 2;', '(1 + (x * 2))', 0),
+            ('let f = fn x::float -> float { => x * (1.5 + 1.5); };',
+             'let f = function: x::float  -> float => (x * 3.0); ;', 1),
+        ]
+
+        for source, expected, expected_folded in tests:
+            program: Program = self._parse(source)
+
+            self.assertEqual(fold_constants(program), expected_folded)
+            self.assertEqual(str(program), expected)
+
+    def test_errors_are_not_folded(self) -> None:
+        tests: List[str] = [
+            '10 / 0;',
+            '1 + true;',
+            '"a" - "b";',
+            '-"a";',
+            '1 + 2 + 3.0;',
+        ]
+
+        for source in tests:
+            expected = evaluate(self._parse(source), Environment())
+            program: Program = self._parse(source)
+
+            fold_constants(program)
+            evaluated = evaluate(program, Environment())
+
+            self.assertEqual(evaluated.inspect(), expected.inspect())
+
+    def test_folded_program_evaluation(self) -> None:
+        source: str = '''
+            let seconds = fn days::int -> int { => days * 60 * 60 * 24; };
+            let area = fn radius::float -> float { => 3.0 * radius ** 2.0; };
+            seconds(2) + 1 == 172801;
+        '''
+        program: Program = self._parse(source)
+
+        self.assertEqual(fold_constants(program), 0)
+
+        program = self._parse(source.replace('days * 60 * 60 * 24', 'days * (60 * 60 * 24)'))
+
+        self.assertEqual(fold_constants(program), 2)
+        self.assertEqual(evaluate(program, Environment()).inspect(), 'true')
+
+    def _parse(self, source: str) -> Program:
+        parser: Parser = Parser(new_lexer(source))
+        program: Program = parser.parse_program()
+
+        self.assertEqual(parser.errors, [])
+
+        return program
@@ -1,6 +1,10 @@
+import os
+
+from io import StringIO
 from unittest import TestCase
 from typing import (
     Any,
+    Iterator,
     Type,
     Tuple,
     cast,
@@ -23,10 +27,20 @@ from sigmaF.ast import (
     ListValues,
     TupleValues,
     ReturnStatement,
-    ExpressionStatement
+    ExpressionStatement,
+    Statement
+)
+from sigmaF.lexer import (
+    Lexer,
+    RegexLexer,
+    StreamLexer,
+    TokenBufferLexer
+)
+from sigmaF.parser import (
+    Parser,
+    StackParser,
+    TableParser
 )
-from sigmaF.lexer import Lexer
-from sigmaF.parser import Parser
 
 
 class ParserTest(TestCase):
@@ -90,6 +104,19 @@ class ParserTest(TestCase):
 
         self.assertEquals(len(parser.errors), 1)
 
+    def test_parse_error_positions(self) -> None:
+        source: str = 'let a = 1;\nlet x 5;\n  let y = );'
+
+        for parser_class in (Parser, TableParser, StackParser):
+            parser: Parser = parser_class(TokenBufferLexer(source))
+            parser.parse_program()
+
+            self.assertEqual(parser.errors, [
+                'Line 2, column 7: The next token was expected to be of type TokenType.ASSIGN ' +
+                ', but TokenType.INT was obtained',
+                'Line 3, column 11: It was not found nothing funtion for parse )',
+            ])
+
     def test_return_statement(self) -> None:
         source: str = '''
             => 5;
@@ -588,3 +615,64 @@ class ParserTest(TestCase):
         self.assertEquals(len(call_list.range), 2)
         self._test_literal_expression(call_list.range[0], 1)
         self._test_infix_expression(call_list.range[1], 2, '*', 3)
+
+    def test_table_parser_matches_parser(self) -> None:
+        sources: List[str] = [
+            'let x = 5; -x + 10 * 2 ** 3 - 4 / 2 % 3;',
+            'a == b != c && d || e < f <= g > h >= i;',
+            'fn x::int, y::int -> int { => x + y }(1, 2)[0, 1];',
+            'if (x > 1) then { => [1, 2, (3, 4)]; } else { => []; }',
+            'let x 5; let = ; )',
+        ]
+        for path in ('egs/eg_1.sf', 'egs/eg_2.sf'):
+            with open(os.path.join(os.path.dirname(__file__), '..', path)) as fin:
+                sources.append(fin.read())
+
+        for source in sources:
+            parser: Parser = Parser(Lexer(source))
+            program: Program = parser.parse_program()
+
+            for parser_class in (TableParser, StackParser):
+                other_parser: Parser = parser_class(Lexer(source))
+                other_program: Program = other_parser.parse_program()
+
+                self.assertEqual(str(other_program), str(program))
+                self.assertEqual(other_parser.errors, parser.errors)
+
+    def test_stack_parser_deep_nesting(self) -> None:
+        depth: int = 50000
+        source: str = '(' * depth + '[' * depth + '- f(1 + 2)' + ']' * depth + ')' * depth
+
+        parser: Parser = StackParser(RegexLexer(source))
+        program: Program = parser.parse_program()
+
+        self.assertEqual(parser.errors, [])
+        self.assertEqual(len(program.statements), 1)
+
+        expression = cast(ExpressionStatement, program.statements[0]).expression
+        for _ in range(depth):
+            self.assertIsInstance(expression, ListValues)
+            expression = cast(ListValues, expression).values[0]
+
+        self.assertIsInstance(expression, Prefix)
+        self.assertEqual(str(expression), '(-f((1 + 2)))')
+
+    def test_iter_statements(self) -> None:
+        source: str = 'let a = 1;\nlet b = fn x::int -> int { => x; };\nb(a);\n' * 100
+        stream: StringIO = StringIO(source)
+        parser: Parser = Parser(StreamLexer(stream, chunk_size=16))
+
+        statements: Iterator[Statement] = parser.iter_statements()
+        first = next(statements)
+
+        self.assertIsInstance(first, LetStatement)
+        self.assertLess(stream.tell(), 64)
+        self.assertLess(stream.tell(), len(source))
+
+        middle: List[Statement] = [next(statements) for _ in range(149)]
+        self.assertIsInstance(middle[-1], ExpressionStatement)
+        self.assertLess(stream.tell(), len(source))
+
+        self.assertEqual(len(list(statements)), 150)
+        self.assertEqual(stream.tell(), len(source))
+        self.assertEqual(parser.errors, [])
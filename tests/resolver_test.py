@@ -0,0 +1,151 @@
+from typing import (
+    Dict,
+    List,
+    Optional,
+    Tuple
+)
+from unittest import TestCase
+
+from sigmaF.ast import (
+    Identifier,
+    iter_nodes,
+    Program
+)
+from sigmaF.evaluator import evaluate
+from sigmaF.lexer import new_lexer
+from sigmaF.object import (
+    Environment,
+    Function
+)
+from sigmaF.symbol import SYMBOLS
+from sigmaF.parser import Parser
+from sigmaF.resolver import Resolver
+
+
+class ResolverTest(TestCase):
+
+    def test_depths(self) -> None:
+        source: str = '''
+            let adder = fn a::int -> function {
+                let b = a + 1;
+                if a > 0 then {
+                    let c = 2;
+                    => fn x::int -> int { => x + a + b + c + d + length([]); };
+                }
+                let d = 3;
+                => fn x::int -> int { => x + a + d; };
+            };
+            adder(1)(2);
+        '''
+        program: Program = self._parse(source)
+
+        self.assertEqual(Resolver().resolve(program), 11)
+
+        depths: Dict[str, List[Optional[int]]] = {}
+        for node in iter_nodes(program):
+            if type(node) == Identifier:
+                depths.setdefault(node.value, []).append(node.depth)
+
+        self.assertEqual(depths, {
+            'a': [0, 0, 1, 1],
+            'b': [1],
+            'c': [1],
+            'd': [None, 1],
+            'x': [0, 0],
+            'length': [2],
+            'adder': [0],
+        })
+
+    def test_resolved_evaluation(self) -> None:
+        tests: List[Tuple[str, str]] = [
+            ('''
+                let com = fn f1::function, f2::function -> function {
+                    => fn any::int -> int { => f1(f2(any)); };
+                };
+                let inc = fn x::int -> int { => x + 1; };
+                let double = fn x::int -> int { => x * 2; };
+                com(inc, double)(5);
+            ''', '11'),
+            ('''
+                let f = fn n::int -> int {
+                    if n > 0 then {
+                        let m = n;
+                    }
+                    => m;
+                };
+                f(0);
+            ''', 'Identifier not found: m'),
+            ('''
+                let m = 7;
+                let f = fn n::int -> int {
+                    if n > 0 then {
+                        let m = n;
+                    }
+                    => m;
+                };
+                f(1) + f(0);
+            ''', '8'),
+            ('length([1, 2, 3]);', '3'),
+            ('unknown;', 'Identifier not found: unknown'),
+        ]
+
+        for source, expected in tests:
+            program: Program = self._parse(source)
+            Resolver().resolve(program)
+
+            evaluated = evaluate(program, Environment())
+
+            self.assertIn(expected, evaluated.inspect())
+
+    def test_closure_conversion(self) -> None:
+        source: str = '''
+            let make = fn values::list, n::int -> function {
+                let m = n * 2;
+                => fn a::int -> function {
+                    => fn x::int -> int { => x + a + m + length(values); };
+                };
+            };
+            let add = make([1, 2, 3], 5)(1);
+        '''
+        program: Program = self._parse(source)
+        Resolver().resolve(program)
+
+        env: Environment = Environment()
+        evaluate(program, env)
+        add = env[SYMBOLS.intern('add')]
+
+        self.assertIsInstance(add, Function)
+        self.assertEqual(set(add.env._store),
+                         {SYMBOLS.intern('a'), SYMBOLS.intern('m'), SYMBOLS.intern('values')})
+        self.assertIs(add.env._outer, env)
+        self.assertEqual(evaluate(self._parse('add(10);'), env).inspect(), '24')
+
+        outer = env[SYMBOLS.intern('make')]
+        self.assertIs(outer.env, env)
+
+    def test_closure_without_conversion(self) -> None:
+        source: str = '''
+            let make = fn n::int -> function {
+                let f = fn x::int -> int { => x + later; };
+                let later = n;
+                => f;
+            };
+            let add = make(5);
+        '''
+        program: Program = self._parse(source)
+        Resolver().resolve(program)
+
+        env: Environment = Environment()
+        evaluate(program, env)
+        add = env[SYMBOLS.intern('add')]
+
+        self.assertIn(SYMBOLS.intern('n'), add.env._store)
+        self.assertEqual(evaluate(self._parse('add(1);'), env).inspect(), '6')
+
+    def _parse(self, source: str) -> Program:
+        parser: Parser = Parser(new_lexer(source))
+        program: Program = parser.parse_program()
+
+        self.assertEqual(parser.errors, [])
+
+        return program
@@ -0,0 +1,93 @@
+from typing import (
+    List,
+    Tuple
+)
+from unittest import TestCase
+
+import tests.evaluator_test as evaluator_test
+from sigmaF.ast import Program
+from sigmaF.object import Environment
+from sigmaF.stackless import run
+from tests.evaluator_test import parse_program
+
+
+class StacklessEvaluatorTest(evaluator_test.EvaluatorTest):
+
+    engine: str = 'stackless'
+
+
+class StacklessTest(TestCase):
+
+    def test_shared_literals(self) -> None:
+        for source in ('2000;', '1.5;', '"text";'):
+            program: Program = parse_program(source)
+
+            self.assertIs(run(program, Environment()), run(program, Environment()))
+
+    def test_deep_recursion(self) -> None:
+        source: str = '''
+            let count = fn n::int -> int {
+                if n == 0 then {=> 0;}
+                => 1 + count(n - 1);
+            };
+            count(50000);
+        '''
+
+        self.assertEqual(run(parse_program(source), Environment()).inspect(), '50000')
+
+    def test_deep_tail_recursion(self) -> None:
+        tests: List[Tuple[str, str]] = [
+            ('''
+                let f = fn x::int -> int {
+                    if x == 0 then {=> 0;}
+                    => f(x - 1);
+                };
+                f(20000);
+            ''', '0'),
+            ('''
+                let is_prime_number = fn x::int, i::int -> bool {
+                    if x <= 1 then {=> false;}
+                    if x == i then {=> true;}
+                    if (x % i) == 0 then {=> false;}
+                    => is_prime_number(x, i + 1);
+                };
+                is_prime_number(20011, 2);
+            ''', 'true'),
+            ('''
+                let is_even = fn n::int -> bool {
+                    => if n == 0 then { true; } else { is_odd(n - 1); };
+                };
+                let is_odd = fn n::int -> bool {
+                    if n == 0 then {=> false;}
+                    => is_even(n - 1);
+                };
+                is_even(10001);
+            ''', 'false'),
+            ('''
+                let wrong = fn n::int -> str { => n; };
+                let chain = fn n::int -> int {
+                    if n == 0 then {=> wrong(n);}
+                    => chain(n - 1);
+                };
+                chain(3000);
+            ''', ' [Error] Output wrongs: The function expected to return type str and return int'),
+        ]
+
+        for source, expected in tests:
+            for resolve in (False, True):
+                evaluated = run(parse_program(source, resolve), Environment(), 100)
+
+                self.assertEqual(evaluated.inspect(), expected, source)
+
+    def test_maximum_depth(self) -> None:
+        source: str = '''
+            let count = fn n::int -> int {
+                if n == 0 then {=> 0;}
+                => 1 + count(n - 1);
+            };
+            count(100);
+        '''
+
+        self.assertEqual(run(parse_program(source), Environment(), 101).inspect(), '100')
+        self.assertEqual(run(parse_program(source), Environment(), 100).inspect(),
+                         ' [Error] Maximum recursion depth exceeded: There are more than 100 nested calls')
@@ -0,0 +1,68 @@
+from typing import (
+    List,
+    Tuple
+)
+from unittest import TestCase
+
+from sigmaF.object import Environment
+from sigmaF.repl import ENGINES
+from tests.evaluator_test import parse_program
+
+
+class TailCallTest(TestCase):
+
+    def test_deep_tail_recursion(self) -> None:
+        tests: List[Tuple[str, str]] = [
+            ('''
+                let count = fn n::int, acc::int -> int {
+                    if n == 0 then {
+                        => acc;
+                    }
+                    => count(n - 1, acc + 1);
+                };
+                count(10000, 0);
+            ''', '10000'),
+            ('''
+                let f = fn n::int, acc::int -> int {
+                    if n == 0 then { => acc } else { => f(n - 1, acc + 1) }
+                };
+                f(10000, 0);
+            ''', '10000'),
+            ('''
+                let is_even = fn n::int -> bool {
+                    => if n == 0 then { true; } else { is_odd(n - 1); };
+                };
+                let is_odd = fn n::int -> bool {
+                    => if n == 0 then { false; } else { is_even(n - 1); };
+                };
+                is_even(10001);
+            ''', 'false'),
+        ]
+
+        for source, expected in tests:
+            for engine in ENGINES:
+                for resolve in (False, True):
+                    self.assertEqual(self._evaluate(source, engine, resolve), expected, engine)
+
+    def test_output_checks_in_tail_chain(self) -> None:
+        source: str = '''
+            let wrong = fn n::int -> str { => n; };
+            let chain = fn n::int -> int {
+                if n == 0 then {
+                    => wrong(n);
+                }
+                => chain(n - 1);
+            };
+            chain(3000);
+        '''
+
+        for engine in ENGINES:
+            for resolve in (False, True):
+                self.assertIn('Output wrongs: The function expected to return type str and return int',
+                              self._evaluate(source, engine, resolve), engine)
+
+    def _evaluate(self, source: str, engine: str, resolve: bool) -> str:
+        evaluated = ENGINES[engine](parse_program(source, resolve), Environment())
+
+        assert evaluated is not None
+        return evaluated.inspect()
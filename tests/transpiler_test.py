@@ -0,0 +1,119 @@
+from typing import List
+from unittest import TestCase
+
+from sigmaF.ast import Program
+from sigmaF.checker import check_types
+from sigmaF.evaluator import evaluate
+from sigmaF.lexer import Lexer
+from sigmaF.object import Environment
+from sigmaF.parser import Parser
+from sigmaF.symbol import SYMBOLS
+from sigmaF.transpiler import (
+    Module,
+    run,
+    transpile
+)
+
+
+class TranspilerTest(TestCase):
+
+    def test_source(self) -> None:
+        module: Module = transpile(self._parse('''
+            let is_prime_number = fn x::int, i::int -> bool {
+                if x <= 1 then {=> false;}
+                if (x % i) == 0 then {=> x == i;}
+                => is_prime_number(x, i + 1);
+            };
+            let half = fn x::float -> float { let y = x / 2.0; y };
+        '''))
+
+        self.assertEqual(module.names, ['half', 'is_prime_number'])
+        self.assertEqual(module.source.splitlines(), [
+            'def f_is_prime_number(v_x, v_i):',
+            '    while True:',
+            '        if (v_x <= 1):',
+            '            return False',
+            '        if ((v_x % v_i) == 0):',
+            '            return (v_x == v_i)',
+            '        v_x, v_i = v_x, (v_i + 1)',
+            '        continue',
+            '',
+            'def f_half(v_x):',
+            '    v_y = _divide_float(v_x, 2.0)',
+            '    return v_y',
+        ])
+
+    def test_unsupported_functions(self) -> None:
+        module: Module = transpile(self._parse('''
+            let first = fn l::list -> int { => l[0]; };
+            let wrong = fn x::int -> str { => x; };
+            let last = fn x::int -> int { if x > 0 then {=> x;} };
+            let twice = fn x::int -> int { let y = x; let y = 2; => y; };
+            let calls = fn x::int -> int { => wrong(x) + 1; };
+            let add = fn x::int -> int { => x + 1; };
+            let add = fn x::int -> int { => x + 2; };
+            let inc = fn x::int -> int { => x + 1; };
+            let uses = fn x::int -> int { => inc(x) * 2; };
+        '''))
+
+        self.assertEqual(module.names, ['inc', 'uses'])
+
+    def test_same_results_as_evaluator(self) -> None:
+        definitions: str = '''
+            let fibonacci = fn n::int -> int {
+                if n <= 2 then {
+                    => 1;
+                }
+                else {
+                    => fibonacci(n - 2) + fibonacci(n - 1);
+                }
+            };
+            let half = fn n::int -> int { => n / 2; };
+            let power = fn n::int, e::int -> int { => n ** e; };
+            let ratio = fn a::float, b::float -> float { => a / b; };
+            let greet = fn name::str, loud::bool -> str {
+                if loud && name != "" then {=> "HI " + name;} else {=> "hi " + name;}
+            };
+        '''
+        tests: List[str] = [
+            'fibonacci(15);',
+            'half(4);',
+            'half(3);',
+            'power(2, 10);',
+            'power(2, -1);',
+            'ratio(1.0, 4.0);',
+            'ratio(1.0, 0.0);',
+            'greet("ana", true) + greet("", true);',
+            'half(if false then {1});',
+            'fibonacci(2.0);',
+        ]
+
+        for source in tests:
+            expected = evaluate(self._parse(definitions + source), Environment())
+            evaluated = run(self._parse(definitions + source), Environment())
+
+            self.assertEqual(type(evaluated), type(expected), source)
+            self.assertEqual(evaluated.inspect(), expected.inspect(), source)
+
+    def test_rebound_dependencies(self) -> None:
+        env: Environment = Environment()
+        run(self._parse('''
+            let inc = fn x::int -> int { => x + 1; };
+            let twice = fn x::int -> int { => inc(inc(x)); };
+        '''), env)
+
+        self.assertEqual(evaluate(self._parse('twice(1);'), env).inspect(), '3')
+
+        del env[SYMBOLS.intern('inc')]
+        evaluate(self._parse('let inc = fn x::int -> int { => x + 10; };'), env)
+
+        self.assertEqual(evaluate(self._parse('twice(1);'), env).inspect(), '21')
+
+    def _parse(self, source: str) -> Program:
+        parser: Parser = Parser(Lexer(source))
+        program: Program = parser.parse_program()
+
+        self.assertEqual(parser.errors, [])
+        check_types(program)
+
+        return program
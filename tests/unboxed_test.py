@@ -0,0 +1,46 @@
+from unittest import TestCase
+
+import tests.evaluator_test as evaluator_test
+from sigmaF.evaluator import evaluate
+from sigmaF.object import (
+    Environment,
+    Function,
+    Integer
+)
+from sigmaF.symbol import SYMBOLS
+from sigmaF.unboxed import run
+from tests.evaluator_test import parse_program
+
+
+class UnboxedEvaluatorTest(evaluator_test.EvaluatorTest):
+
+    engine: str = 'unboxed'
+
+
+class UnboxedTest(TestCase):
+
+    def test_boxed_boundaries(self) -> None:
+        env: Environment = Environment()
+        run(parse_program('''
+            let n = 41;
+            let inc = fn x::int -> int { => x + 1; };
+        '''), env)
+
+        self.assertIsInstance(env[SYMBOLS.intern('n')], Integer)
+        self.assertIsInstance(env[SYMBOLS.intern('inc')], Function)
+        self.assertEqual(evaluate(parse_program('inc(n);'), env).inspect(), '42')
+        self.assertEqual(run(parse_program('inc(n) * 2;'), env).inspect(), '84')
+
+    def test_deep_recursion(self) -> None:
+        source: str = '''
+            let count = fn n::int, acc::int -> int {
+                if n == 0 then {
+                    => acc;
+                }
+                => count(n - 1, acc + 1);
+            };
+            count(5000, 0);
+        '''
+
+        self.assertEqual(run(parse_program(source), Environment()).inspect(), '5000')
+        self.assertEqual(run(parse_program(source, False), Environment()).inspect(), '5000')
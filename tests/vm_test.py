@@ -0,0 +1,139 @@
+import os
+
+from tempfile import TemporaryDirectory
+from typing import Optional
+from unittest import TestCase
+
+import tests.evaluator_test as evaluator_test
+from sigmaF.cache import (
+    load_bytecode,
+    store_bytecode
+)
+from sigmaF.compiler import (
+    Bytecode,
+    compile_program,
+    CompileError,
+    disassemble,
+    dumps,
+    loads
+)
+from sigmaF.evaluator import evaluate
+from sigmaF.object import (
+    Environment,
+    Function,
+    new_integer,
+    Object
+)
+from sigmaF.symbol import SYMBOLS
+from sigmaF.vm import (
+    execute,
+    run
+)
+from tests.evaluator_test import parse_program
+
+
+class VirtualMachineEvaluatorTest(evaluator_test.EvaluatorTest):
+
+    engine: str = 'vm'
+
+
+class VirtualMachineTest(TestCase):
+
+    def test_function_without_return(self) -> None:
+        with self.assertRaises(AssertionError):
+            run(parse_program('let f = fn x::int -> int { let y = x; }; f(1);'), Environment())
+
+    def test_disassemble(self) -> None:
+        bytecode: Bytecode = compile_program(parse_program('''
+            let add = fn x::int, y::int -> int { => x + y; };
+            add(1, 2);
+        '''))
+
+        self.assertEqual(disassemble(bytecode).splitlines(), [
+            '0: <program>() locals=[] free=[]',
+            '     0 MAKE_FUNCTION         1         (add)',
+            '     2 STORE_GLOBAL          0         (add)',
+            '     4 POP_OR_EXIT',
+            '     5 LOAD_GLOBAL           0         (add)',
+            '     7 JUMP_IF_ERROR         16        (to 16)',
+            '     9 LOAD_CONST            0         (1)',
+            '    11 LOAD_CONST            1         (2)',
+            '    13 CALL_CHECKED          2 1       (add)',
+            '    16 RETURN',
+            '1: add(x, y) locals=[] free=[]',
+            '     0 LOAD_LOCAL            0         (x)',
+            '     2 LOAD_LOCAL            1         (y)',
+            '     4 ADD',
+            '     5 RETURN',
+            '     6 RETURN',
+        ])
+
+    def test_serialization(self) -> None:
+        source: str = '''
+            let scale = fn factor::int -> function {
+                => fn x::int -> int { => x * factor; };
+            };
+            let triple = scale(3);
+            triple(5);
+        '''
+        bytecode: Bytecode = loads(dumps(compile_program(parse_program(source))))
+
+        env: Environment = Environment()
+        self.assertEqual(execute(bytecode, env).inspect(), '15')
+
+        triple: Optional[Object] = env[SYMBOLS.intern('triple')]
+        assert isinstance(triple, Function)
+        self.assertIsNone(triple.body)
+        self.assertEqual(evaluate(parse_program('triple(2);'), env).inspect(), '6')
+
+        with self.assertRaises(ValueError):
+            loads(b'SFC\x00' + dumps(bytecode)[4:])
+
+        with TemporaryDirectory() as directory:
+            path: str = os.path.join(directory, 'module.sf')
+
+            self.assertIsNone(load_bytecode(path, source))
+            store_bytecode(path, source, bytecode)
+
+            cached: Optional[Bytecode] = load_bytecode(path, source)
+            assert cached is not None
+            self.assertEqual(disassemble(cached), disassemble(bytecode))
+            self.assertIsNone(load_bytecode(path, source + ' '))
+
+    def test_dynamic_names_fall_back(self) -> None:
+        source: str = '''
+            let make = fn n::int -> function {
+                let f = fn x::int -> int { => x + later; };
+                let later = n;
+                => f;
+            };
+            make(5)(1);
+        '''
+
+        with self.assertRaises(CompileError):
+            compile_program(parse_program(source))
+
+        self.assertEqual(run(parse_program(source), Environment()).inspect(), '6')
+
+    def test_small_integers_are_shared(self) -> None:
+        env: Environment = Environment()
+        run(parse_program('''
+            let f = fn x::int -> int { => x * 2 + 1 - 1 % 5; };
+            let g = fn x::int -> int { => -x; };
+            let a = f(20);
+            let b = g(3);
+        '''), env)
+
+        self.assertIs(env[SYMBOLS.intern('a')], new_integer(40))
+        self.assertIs(env[SYMBOLS.intern('b')], new_integer(-3))
+
+    def test_deep_recursion(self) -> None:
+        source: str = '''
+            let count = fn n::int -> int {
+                if n == 0 then {=> 0;}
+                => 1 + count(n - 1);
+            };
+            count(5000);
+        '''
+
+        self.assertEqual(run(parse_program(source), Environment()).inspect(), '5000')